@@ -849,10 +849,10 @@ async def websocket_endpoint(websocket: WebSocket, client_id: Optional[str] = No
                 await ws_manager.send_message(client_id, response)
                 
     except WebSocketDisconnect:
-        ws_manager.disconnect(client_id)
+        ws_manager.disconnect(client_id, websocket)
     except Exception as e:
         logger.error("websocket_error", client_id=client_id, error=str(e))
-        ws_manager.disconnect(client_id)
+        ws_manager.disconnect(client_id, websocket)
 
 
 @app.get("/api/v1/ws/status")
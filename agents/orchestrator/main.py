@@ -4,17 +4,26 @@ Main FastAPI application for coordinating all CME and NON-CME content generation
 Includes LangGraph integration for graph-based workflow orchestration
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, Set, Tuple
 from enum import Enum
+from dataclasses import dataclass, asdict
+import asyncio
 import httpx
+import orjson
 import os
 import structlog
 from datetime import datetime
 import uuid
+import time
 import json
+import re
+from functools import lru_cache
+from collections import Counter
 
 # MCP Registry Integration
 from mcp_registry import mcp_router
@@ -56,7 +65,8 @@ logger.info("tracing_configured", mode=TRACING_MODE)
 app = FastAPI(
     title="DHG AI Factory - CME Orchestrator",
     description="Master Agent for CME/NON-CME Content Pipeline",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -87,37 +97,41 @@ async def ws_endpoint(websocket: WebSocket, client_id: str | None = None):
             if resp:
                 await ws_manager.send_message(client_id, resp)
     except WebSocketDisconnect:
-        ws_manager.disconnect(client_id)
+        ws_manager.disconnect(client_id, websocket)
     except Exception as e:
         logger.error("ws_error", client_id=client_id, error=str(e))
-        ws_manager.disconnect(client_id)
+        ws_manager.disconnect(client_id, websocket)
 
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """System configuration from environment variables"""
-    REGISTRY_DB_URL = os.getenv("REGISTRY_DB_URL")
-    CME_MODE_DEFAULT = os.getenv("CME_MODE_DEFAULT", "auto")
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    """System configuration from environment variables (read once at import)"""
+    REGISTRY_DB_URL: Optional[str] = os.getenv("REGISTRY_DB_URL")
+    CME_MODE_DEFAULT: str = os.getenv("CME_MODE_DEFAULT", "auto")
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     
     # Agent endpoints
-    MEDICAL_LLM_URL = "http://medical-llm:8000"
-    RESEARCH_URL = "http://research:8000"
-    CURRICULUM_URL = "http://curriculum:8000"
-    OUTCOMES_URL = "http://outcomes:8000"
-    COMPETITOR_INTEL_URL = "http://competitor-intel:8000"
-    QA_COMPLIANCE_URL = "http://qa-compliance:8000"
+    MEDICAL_LLM_URL: str = "http://medical-llm:8000"
+    RESEARCH_URL: str = "http://research:8000"
+    CURRICULUM_URL: str = "http://curriculum:8000"
+    OUTCOMES_URL: str = "http://outcomes:8000"
+    COMPETITOR_INTEL_URL: str = "http://competitor-intel:8000"
+    QA_COMPLIANCE_URL: str = "http://qa-compliance:8000"
     
     # CME Configuration
-    ACCME_STRICT_MODE = os.getenv("ACCME_STRICT_MODE", "true").lower() == "true"
-    MOORE_LEVELS_VALIDATION = os.getenv("MOORE_LEVELS_VALIDATION", "true").lower() == "true"
-    FAIR_BALANCE_CHECK = os.getenv("FAIR_BALANCE_CHECK", "true").lower() == "true"
+    ACCME_STRICT_MODE: bool = os.getenv("ACCME_STRICT_MODE", "true").lower() == "true"
+    MOORE_LEVELS_VALIDATION: bool = os.getenv("MOORE_LEVELS_VALIDATION", "true").lower() == "true"
+    FAIR_BALANCE_CHECK: bool = os.getenv("FAIR_BALANCE_CHECK", "true").lower() == "true"
 
 config = Config()
 
+# Snapshot for startup logging; the registry URL may embed credentials
+CONFIG_LOG_FIELDS = {**asdict(config), "REGISTRY_DB_URL": bool(config.REGISTRY_DB_URL)}
+
 # ============================================================================
 # ENUMS AND MODELS
 # ============================================================================
@@ -248,21 +262,36 @@ class AgentClient:
     """HTTP client for communicating with specialized agents"""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=300.0)
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(300.0, connect=5.0),
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=128)
+        )
+        # Agents whose /health doesn't answer HEAD (FastAPI GET routes return 405)
+        self._health_get_only = set()
     
     async def call_agent(self, url: str, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Call a specialized agent"""
         try:
-            response = await self.client.post(f"{url}/{endpoint}", json=payload)
+            response = await self.client.post(
+                f"{url}/{endpoint}",
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPError as e:
             logger.error("agent_call_failed", url=url, endpoint=endpoint, error=str(e))
             raise HTTPException(status_code=502, detail=f"Agent call failed: {str(e)}")
     
     async def health_check(self, url: str) -> bool:
-        """Check if an agent is healthy"""
+        """Check if an agent is healthy (HEAD probe, GET for agents without HEAD)"""
         try:
+            if url not in self._health_get_only:
+                response = await self.client.head(f"{url}/health", timeout=2.0)
+                if response.status_code not in (405, 501):
+                    return response.status_code == 200
+                self._health_get_only.add(url)
             response = await self.client.get(f"{url}/health", timeout=5.0)
             return response.status_code == 200
         except:
@@ -270,10 +299,78 @@ class AgentClient:
 
 agent_client = AgentClient()
 
+# ============================================================================
+# KEYWORD PATTERNS
+# ============================================================================
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one alternation so a text is scanned once"""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+# Topic keywords for compliance mode detection
+CME_TOPIC_RE = _keyword_pattern([
+    "cme", "accme", "needs assessment", "moore levels",
+    "gap analysis", "learning objectives", "curriculum",
+    "educational", "medical education", "continuing education"
+])
+NON_CME_TOPIC_RE = _keyword_pattern([
+    "not cme", "non-cme", "business", "strategy",
+    "commercial", "marketing", "competitive"
+])
+
+# Prompt analysis keywords
+VAGUE_TERMS = ("something", "stuff", "things", "good", "nice", "better", "maybe")
+PROMPT_TERM_GROUPS = {
+    "verb": ("create", "generate", "write", "analyze", "explain"),
+    "vague": VAGUE_TERMS,
+    "specific": ("diabetes", "hypertension", "cardiology", "oncology", "cme", "icd-10", "moore"),
+    "cme": ("cme", "accme", "needs assessment", "moore levels", "learning objectives", "curriculum", "medical education", "gap analysis"),
+    "non_cme": ("business", "strategy", "marketing", "commercial", "not cme"),
+    "brand": ("pfizer", "merck", "novartis", "lilly", "abbvie", "roche", "johnson", "bristol", "astrazeneca", "sanofi", "gsk"),
+    "punct": ("?", ","),
+}
+_PROMPT_TERMS = sorted(
+    {term for terms in PROMPT_TERM_GROUPS.values() for term in terms},
+    key=len,
+    reverse=True
+)
+# Zero-width lookahead over every term, longest first, so one finditer pass
+# sees a match at every position where any term starts
+PROMPT_TERMS_RE = re.compile("(?=(%s))" % "|".join(re.escape(term) for term in _PROMPT_TERMS))
+
+
+def scan_prompt_terms(prompt_lower: str) -> Tuple[Set[str], Counter]:
+    """
+    Single pass over a lowercased prompt.
+    
+    Returns every analysis term present as a substring, plus per-term match
+    counts. Only the longest term starting at each position is captured, so a
+    term also counts as present when it is contained in a captured one
+    ("moore" in "moore levels", "cme" in "accme").
+    """
+    counts = Counter(match.group(1) for match in PROMPT_TERMS_RE.finditer(prompt_lower))
+    present = {term for term in _PROMPT_TERMS if any(term in found for found in counts)}
+    return present, counts
+
 # ============================================================================
 # COMPLIANCE MODE DETECTION
 # ============================================================================
 
+CME_TASKS = frozenset([
+    TaskType.NEEDS_ASSESSMENT,
+    TaskType.CURRICULUM,
+    TaskType.LEARNING_OBJECTIVES,
+    TaskType.CME_SCRIPT,
+    TaskType.GRANT_REQUEST,
+    TaskType.GAP_ANALYSIS,
+    TaskType.OUTCOMES_PLAN,
+])
+
+NON_CME_TASKS = frozenset([
+    TaskType.BUSINESS_STRATEGY,
+    TaskType.COMPETITOR_ANALYSIS,
+])
+
 def detect_compliance_mode(request: TaskRequest) -> ComplianceMode:
     """
     Detect whether request requires CME or NON-CME mode
@@ -297,46 +394,25 @@ def detect_compliance_mode(request: TaskRequest) -> ComplianceMode:
         return request.compliance_mode
     
     # CME task types
-    cme_tasks = [
-        TaskType.NEEDS_ASSESSMENT,
-        TaskType.CURRICULUM,
-        TaskType.LEARNING_OBJECTIVES,
-        TaskType.CME_SCRIPT,
-        TaskType.GRANT_REQUEST,
-        TaskType.GAP_ANALYSIS,
-        TaskType.OUTCOMES_PLAN,
-    ]
-    
-    if request.task_type in cme_tasks:
+    if request.task_type in CME_TASKS:
         return ComplianceMode.CME
     
     # NON-CME task types
-    non_cme_tasks = [
-        TaskType.BUSINESS_STRATEGY,
-        TaskType.COMPETITOR_ANALYSIS,
-    ]
-    
-    if request.task_type in non_cme_tasks:
+    if request.task_type in NON_CME_TASKS:
         return ComplianceMode.NON_CME
     
+    return _detect_from_topic(request.topic.lower())
+
+
+@lru_cache(maxsize=4096)
+def _detect_from_topic(topic_lower: str) -> ComplianceMode:
+    """Keyword scan of a lowercased topic, memoized for repeat topics"""
     # CME keywords in topic
-    cme_keywords = [
-        "cme", "accme", "needs assessment", "moore levels",
-        "gap analysis", "learning objectives", "curriculum",
-        "educational", "medical education", "continuing education"
-    ]
-    
-    topic_lower = request.topic.lower()
-    if any(keyword in topic_lower for keyword in cme_keywords):
+    if CME_TOPIC_RE.search(topic_lower):
         return ComplianceMode.CME
     
     # NON-CME keywords
-    non_cme_keywords = [
-        "not cme", "non-cme", "business", "strategy",
-        "commercial", "marketing", "competitive"
-    ]
-    
-    if any(keyword in topic_lower for keyword in non_cme_keywords):
+    if NON_CME_TOPIC_RE.search(topic_lower):
         return ComplianceMode.NON_CME
     
     # Default to CME (conservative approach)
@@ -461,18 +537,24 @@ async def orchestrate_needs_assessment(
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    agents_status = {}
-    
-    # Check all agent health
-    for name, url in [
+    names, urls = zip(*[
         ("medical-llm", config.MEDICAL_LLM_URL),
         ("research", config.RESEARCH_URL),
         ("curriculum", config.CURRICULUM_URL),
         ("outcomes", config.OUTCOMES_URL),
         ("competitor-intel", config.COMPETITOR_INTEL_URL),
         ("qa-compliance", config.QA_COMPLIANCE_URL),
-    ]:
-        agents_status[name] = "healthy" if await agent_client.health_check(url) else "unhealthy"
+    ])
+    
+    # Probe all agents concurrently so latency is the slowest agent, not the sum
+    results = await asyncio.gather(
+        *(agent_client.health_check(url) for url in urls),
+        return_exceptions=True
+    )
+    agents_status = {
+        name: "healthy" if result is True else "unhealthy"
+        for name, result in zip(names, results)
+    }
     
     langgraph_ready = False
     try:
@@ -610,62 +692,52 @@ Respond with this exact JSON structure:
         return None
 
 
-@app.post("/api/prompt-analyze", response_model=PromptAnalyzeResponse)
-async def analyze_prompt(request: PromptAnalyzeRequest):
-    """
-    Analyze a prompt for clarity, specificity, and compliance
-    
-    Returns scores and suggestions for improvement
-    """
-    prompt = request.prompt.strip()
+async def _analyze_prompt(prompt: str) -> Dict[str, Any]:
+    """Score a prompt and collect suggestions; shared by the analyze endpoints"""
+    prompt = prompt.strip()
+    prompt_lower = prompt.lower()
     word_count = len(prompt.split())
     estimated_tokens = int(word_count * 1.3)
     
     suggestions = []
     flags = []
     
+    present, counts = scan_prompt_terms(prompt_lower)
+    
     clarity_score = 1.0
     if word_count < 10:
         clarity_score -= 0.3
         suggestions.append("Add more context to your prompt for clearer results")
-    if "?" not in prompt and not any(verb in prompt.lower() for verb in ["create", "generate", "write", "analyze", "explain"]):
+    if "?" not in present and present.isdisjoint(PROMPT_TERM_GROUPS["verb"]):
         clarity_score -= 0.2
         suggestions.append("Include a clear action verb or question")
-    if prompt.count(",") > 10:
+    if counts[","] > 10:
         clarity_score -= 0.1
         suggestions.append("Consider breaking complex prompts into multiple requests")
     
     specificity_score = 1.0
-    vague_terms = ["something", "stuff", "things", "good", "nice", "better", "maybe"]
-    for term in vague_terms:
-        if term in prompt.lower():
-            specificity_score -= 0.15
-            flags.append(f"Vague term detected: '{term}'")
+    hits = [term for term in VAGUE_TERMS if term in present]
+    specificity_score -= 0.15 * len(hits)
+    flags.extend(f"Vague term detected: '{term}'" for term in hits)
     if word_count < 20:
         specificity_score -= 0.2
         suggestions.append("Add specific details about expected output format")
-    has_specifics = any(x in prompt.lower() for x in ["diabetes", "hypertension", "cardiology", "oncology", "cme", "icd-10", "moore"])
-    if has_specifics:
+    if not present.isdisjoint(PROMPT_TERM_GROUPS["specific"]):
         specificity_score = min(1.0, specificity_score + 0.2)
     
-    cme_keywords = ["cme", "accme", "needs assessment", "moore levels", "learning objectives", "curriculum", "medical education", "gap analysis"]
-    non_cme_keywords = ["business", "strategy", "marketing", "commercial", "not cme"]
-    
     detected_mode = "auto"
     compliance_score = 0.8
     
-    prompt_lower = prompt.lower()
-    if any(kw in prompt_lower for kw in cme_keywords):
+    if not present.isdisjoint(PROMPT_TERM_GROUPS["cme"]):
         detected_mode = "cme"
         compliance_score = 0.95
-        if "accme" not in prompt_lower and "cme" in prompt_lower:
+        if "accme" not in present and "cme" in present:
             suggestions.append("Consider specifying ACCME compliance requirements")
-    elif any(kw in prompt_lower for kw in non_cme_keywords):
+    elif not present.isdisjoint(PROMPT_TERM_GROUPS["non_cme"]):
         detected_mode = "non-cme"
         compliance_score = 0.9
     
-    brand_terms = ["pfizer", "merck", "novartis", "lilly", "abbvie", "roche", "johnson", "bristol", "astrazeneca", "sanofi", "gsk"]
-    if any(brand in prompt_lower for brand in brand_terms):
+    if not present.isdisjoint(PROMPT_TERM_GROUPS["brand"]):
         flags.append("Commercial content detected - ensure fair balance")
         compliance_score -= 0.1
         if detected_mode == "cme":
@@ -700,18 +772,48 @@ async def analyze_prompt(request: PromptAnalyzeRequest):
     logger.info("prompt_analyzed", word_count=word_count, overall_score=overall_score, 
                 detected_mode=detected_mode, has_semantic=semantic_analysis is not None)
     
-    return PromptAnalyzeResponse(
-        overall_score=round(overall_score, 2),
-        clarity_score=round(clarity_score, 2),
-        specificity_score=round(specificity_score, 2),
-        compliance_score=round(compliance_score, 2),
-        detected_mode=detected_mode,
-        suggestions=suggestions[:5],
-        flags=flags[:5],
-        word_count=word_count,
-        estimated_tokens=estimated_tokens,
-        semantic_analysis=semantic_analysis
-    )
+    return {
+        "overall_score": round(overall_score, 2),
+        "clarity_score": round(clarity_score, 2),
+        "specificity_score": round(specificity_score, 2),
+        "compliance_score": round(compliance_score, 2),
+        "detected_mode": detected_mode,
+        "suggestions": suggestions[:5],
+        "flags": flags[:5],
+        "word_count": word_count,
+        "estimated_tokens": estimated_tokens,
+        "semantic_analysis": semantic_analysis
+    }
+
+
+@app.post("/api/prompt-analyze", response_model=PromptAnalyzeResponse)
+async def analyze_prompt(request: PromptAnalyzeRequest):
+    """
+    Analyze a prompt for clarity, specificity, and compliance
+    
+    Returns scores and suggestions for improvement
+    """
+    return PromptAnalyzeResponse(**await _analyze_prompt(request.prompt))
+
+
+@app.post("/api/prompt-analyze-fast")
+async def analyze_prompt_fast(request: Request):
+    """
+    Same analysis as /api/prompt-analyze without model validation
+    
+    Parses the body with orjson and returns the result dict directly;
+    the typed endpoint remains the documented schema.
+    """
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+    
+    prompt = body.get("prompt") if isinstance(body, dict) else None
+    if not isinstance(prompt, str):
+        raise HTTPException(status_code=422, detail="'prompt' must be a string")
+    
+    return ORJSONResponse(await _analyze_prompt(prompt))
 
 
 @app.post("/api/transcribe", response_model=TranscriptionResponse)
@@ -722,7 +824,7 @@ async def transcribe_audio(request: TranscriptionRequest):
     Downloads audio and processes with Whisper ASR
     """
     transcription_id = str(uuid.uuid4())
-    start_time = datetime.utcnow()
+    start_time = time.perf_counter()
     
     logger.info("transcription_request", transcription_id=transcription_id, url=request.url[:50])
     
@@ -752,7 +854,7 @@ async def transcribe_audio(request: TranscriptionRequest):
                     error=f"Cannot reach URL: {str(e)}"
                 )
         
-        processing_time = (datetime.utcnow() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         
         return TranscriptionResponse(
             transcription_id=transcription_id,
@@ -985,11 +1087,22 @@ async def langgraph_history(thread_id: str):
         graph = await get_agent_graph()
         history = await graph.get_thread_history(thread_id)
         
-        return {
-            "thread_id": thread_id,
-            "states": history,
-            "count": len(history)
-        }
+        # Encode once; checkpoint snapshots can be large. Types orjson doesn't
+        # know (state snapshots, messages) go through jsonable_encoder.
+        body = orjson.dumps(
+            {
+                "thread_id": thread_id,
+                "states": history,
+                "count": len(history)
+            },
+            default=jsonable_encoder,
+            option=orjson.OPT_NAIVE_UTC
+        )
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"Cache-Control": "private, max-age=5"}
+        )
         
     except Exception as e:
         logger.error("langgraph_history_failed", thread_id=thread_id, error=str(e))
@@ -1276,7 +1389,7 @@ async def get_artifact(artifact_id: str):
 @app.on_event("startup")
 async def startup_event():
     """Startup tasks"""
-    logger.info("orchestrator_starting", config=config.__dict__)
+    logger.info("orchestrator_starting", config=CONFIG_LOG_FIELDS)
     
     # Dependency Injection for WebSocket Manager
     ws_manager.agent_client = agent_client
@@ -2,9 +2,9 @@
 WebSocket Manager for DHG AI Factory
 Handles real-time communication with UI clients
 """
-import json
 import asyncio
 import uuid
+import orjson
 from typing import Dict, Set, Any, Optional
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
@@ -12,6 +12,9 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Messages a client may have waiting before it is treated as stalled and dropped
+CLIENT_QUEUE_MAX = 1000
+
 
 class ConnectionManager:
     """Manages WebSocket connections and message broadcasting"""
@@ -23,6 +26,11 @@ class ConnectionManager:
         self.sessions: Dict[str, Dict[str, Any]] = {}
         # Heartbeat tracking
         self.heartbeats: Dict[str, float] = {}
+        # Outbound queues and their sender tasks: {client_id: ...}
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.senders: Dict[str, asyncio.Task] = {}
+        # Close handshakes for clients dropped as too slow
+        self._closing: Set[asyncio.Task] = set()
         
     async def connect(self, websocket: WebSocket, client_id: str = None) -> str:
         """Accept a new WebSocket connection"""
@@ -31,55 +39,122 @@ class ConnectionManager:
         if not client_id:
             client_id = str(uuid.uuid4())
             
+        # A reconnect reuses the client_id: stop the sender bound to the old socket
+        old_sender = self.senders.pop(client_id, None)
+        if old_sender is not None:
+            old_sender.cancel()
+        
         self.active_connections[client_id] = websocket
         self.sessions[client_id] = {
             "connected_at": datetime.utcnow().isoformat(),
             "session_id": str(uuid.uuid4()),
             "authenticated": False
         }
+        self.queues[client_id] = asyncio.Queue(maxsize=CLIENT_QUEUE_MAX)
+        self.senders[client_id] = asyncio.create_task(
+            self._drain(client_id, self.queues[client_id], websocket)
+        )
         
         logger.info("websocket_connected", client_id=client_id, 
                    total_connections=len(self.active_connections))
         return client_id
         
-    def disconnect(self, client_id: str):
-        """Remove a WebSocket connection"""
+    def disconnect(self, client_id: str, websocket: Optional[WebSocket] = None):
+        """
+        Remove a WebSocket connection.
+        
+        Passing the websocket makes this a no-op once a reconnect has replaced
+        it under the same client_id.
+        """
+        if websocket is not None and self.active_connections.get(client_id) is not websocket:
+            return
         if client_id in self.active_connections:
             del self.active_connections[client_id]
         if client_id in self.sessions:
             del self.sessions[client_id]
         if client_id in self.heartbeats:
             del self.heartbeats[client_id]
+        self.queues.pop(client_id, None)
+        sender = self.senders.pop(client_id, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
             
         logger.info("websocket_disconnected", client_id=client_id,
                    remaining_connections=len(self.active_connections))
     
     async def send_message(self, client_id: str, message: Dict[str, Any]):
-        """Send a message to a specific client"""
-        if client_id in self.active_connections:
+        """Queue a message for a specific client"""
+        queue = self.queues.get(client_id)
+        if queue is not None:
+            self._enqueue(client_id, queue, message)
+    
+    def _enqueue(self, client_id: str, queue: asyncio.Queue, message: Dict[str, Any]):
+        """
+        Queue a message, dropping the client if its queue is full.
+        
+        A full queue means the socket has stopped keeping up; disconnecting it
+        bounds memory instead of buffering for it indefinitely.
+        """
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("websocket_client_too_slow", client_id=client_id,
+                           queued=queue.qsize())
+            websocket = self.active_connections.get(client_id)
+            self.disconnect(client_id)
+            if websocket is not None:
+                task = asyncio.create_task(self._close(websocket))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+    
+    async def _close(self, websocket: WebSocket):
+        """Close a dropped client's socket (1013: try again later)"""
+        try:
+            await websocket.close(code=1013)
+        except Exception:
+            pass
+    
+    async def _drain(self, client_id: str, queue: asyncio.Queue, websocket: WebSocket):
+        """
+        Per-client sender task.
+        
+        Waits for the next message, then takes whatever else is already queued
+        and writes it in a single frame. Several pending messages are wrapped as
+        {"type": "batch", "data": {"messages": [...]}}; a lone message is sent as-is.
+        """
+        while True:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            if len(batch) == 1:
+                payload = batch[0]
+            else:
+                payload = {"type": "batch", "data": {"messages": batch}}
+            
             try:
-                websocket = self.active_connections[client_id]
-                await websocket.send_json(message)
+                await websocket.send_text(orjson.dumps(payload).decode())
             except Exception as e:
                 logger.error("send_message_failed", client_id=client_id, error=str(e))
-                self.disconnect(client_id)
+                self.disconnect(client_id, websocket)
+                return
     
     async def broadcast(self, message: Dict[str, Any], exclude: Set[str] = None):
-        """Broadcast a message to all connected clients"""
-        exclude = exclude or set()
-        disconnected = []
+        """
+        Broadcast a message to all connected clients.
         
-        for client_id, websocket in self.active_connections.items():
+        The message goes through each client's queue like any other, so it
+        keeps its order relative to queued messages, is batched with them, and
+        each socket is only ever written by its own sender task. Clients whose
+        queue is full are disconnected.
+        """
+        exclude = exclude or set()
+        for client_id, queue in list(self.queues.items()):
             if client_id not in exclude:
-                try:
-                    await websocket.send_json(message)
-                except Exception as e:
-                    logger.error("broadcast_failed", client_id=client_id, error=str(e))
-                    disconnected.append(client_id)
-        
-        # Clean up disconnected clients
-        for client_id in disconnected:
-            self.disconnect(client_id)
+                self._enqueue(client_id, queue, message)
     
     async def handle_client_message(self, client_id: str, message: Dict[str, Any]) -> Dict[str, Any]:
         """Process incoming client messages and return response"""
@@ -27,6 +27,7 @@ Version: 2.1.0 (Cloud + Ollama + Registry)
 """
 
 import os
+import asyncio
 import logging
 
 # Load secrets from Infisical at startup
@@ -55,6 +56,8 @@ from langchain_core.messages import HumanMessage, SystemMessage
 # HTTP for external APIs
 import httpx
 
+from output_files import ensure_dir, output_filename
+
 
 # =============================================================================
 # CONFIGURATION
@@ -921,19 +924,12 @@ def save_research_output(
     Returns:
         Full path to saved file
     """
-    import os
-    from datetime import datetime
 
     # Create outputs directory if it does not exist
-    os.makedirs(base_dir, exist_ok=True)
-
-    # Sanitize topic for filename
-    safe_topic = "".join(c if c.isalnum() or c in (" ", "-", "_") else "_" for c in topic)
-    safe_topic = safe_topic.replace(" ", "_").lower()[:50]
+    ensure_dir(base_dir)
 
-    # Generate filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{output_format}_{safe_topic}_{timestamp}.{file_format}"
+    # Generate filename from the sanitized topic
+    filename = output_filename(output_format, topic, file_format)
     filepath = os.path.join(base_dir, filename)
 
     # Build final content with optional evaluation header
@@ -950,6 +946,31 @@ def save_research_output(
     return filepath
 
 
+async def save_research_output_async(
+    content: str,
+    topic: str,
+    output_format: str,
+    file_format: str = "md",
+    base_dir: str = "./outputs",
+    evaluation: dict = None
+) -> str:
+    """
+    Async variant of save_research_output for use inside the event loop.
+
+    Runs the blocking directory creation and file write on a worker thread
+    so concurrent research runs keep making progress during the disk flush.
+    """
+    return await asyncio.to_thread(
+        save_research_output,
+        content=content,
+        topic=topic,
+        output_format=output_format,
+        file_format=file_format,
+        base_dir=base_dir,
+        evaluation=evaluation
+    )
+
+
 def _build_evaluation_header(evaluation: dict, file_format: str) -> str:
     """Build evaluation metadata header based on file format"""
 
@@ -1141,7 +1162,7 @@ async def run_research(
                     file_format = "md"  # Default to .md
 
                 try:
-                    saved_path = save_research_output(
+                    saved_path = await save_research_output_async(
                         content=rendered_content,
                         topic=topic,
                         output_format=output_format,
@@ -4,51 +4,65 @@ Pulls secrets from Infisical at runtime.
 Only INFISICAL_TOKEN needed in LangSmith Cloud environment variables.
 """
 import os
-from functools import lru_cache
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    from infisical_client import InfisicalClient, GetSecretOptions
+except ImportError:
+    InfisicalClient = None
+    GetSecretOptions = None
 
-@lru_cache(maxsize=1)
-def load_secrets():
-    """Load secrets from Infisical or fall back to environment variables."""
 
+SECRET_NAMES = (
+    "ANTHROPIC_API_KEY",
+    "GOOGLE_API_KEY",
+    "PERPLEXITY_API_KEY",
+    "NCBI_API_KEY"
+)
+
+# Re-fetch from Infisical after this long so rotated secrets are picked up
+SECRETS_TTL_SECONDS = 3600
+
+_cache = {}  # environment -> (expires_at, secrets)
+_cache_lock = threading.Lock()
+
+
+def _fetch_secrets(environment: str) -> dict:
     infisical_token = os.getenv("INFISICAL_TOKEN")
 
-    if infisical_token:
-        try:
-            from infisical_client import InfisicalClient, GetSecretOptions
-
-            client = InfisicalClient(token=infisical_token)
-
-            secrets = {}
-            secret_names = [
-                "ANTHROPIC_API_KEY",
-                "GOOGLE_API_KEY",
-                "PERPLEXITY_API_KEY",
-                "NCBI_API_KEY"
-            ]
-
-            for name in secret_names:
-                try:
-                    secret = client.get_secret(GetSecretOptions(
-                        secret_name=name,
-                        environment="prod"
-                    ))
-                    secrets[name] = secret.secret_value
-                    os.environ[name] = secret.secret_value
-                except Exception:
-                    secrets[name] = os.getenv(name, "")
-
-            return secrets
-
-        except ImportError:
-            pass
-
-    return {
-        "ANTHROPIC_API_KEY": os.getenv("ANTHROPIC_API_KEY", ""),
-        "GOOGLE_API_KEY": os.getenv("GOOGLE_API_KEY", ""),
-        "PERPLEXITY_API_KEY": os.getenv("PERPLEXITY_API_KEY", ""),
-        "NCBI_API_KEY": os.getenv("NCBI_API_KEY", "")
-    }
+    if infisical_token and InfisicalClient is not None:
+        client = InfisicalClient(token=infisical_token)
+
+        def fetch(name):
+            try:
+                secret = client.get_secret(GetSecretOptions(
+                    secret_name=name,
+                    environment=environment
+                ))
+                os.environ[name] = secret.secret_value
+                return secret.secret_value
+            except Exception:
+                return os.getenv(name, "")
+
+        # Each get_secret is a blocking network call; fetch them in parallel
+        with ThreadPoolExecutor(max_workers=len(SECRET_NAMES)) as pool:
+            return dict(zip(SECRET_NAMES, pool.map(fetch, SECRET_NAMES)))
+
+    return {name: os.getenv(name, "") for name in SECRET_NAMES}
+
+
+def load_secrets(environment: str = "prod"):
+    """Load secrets from Infisical or fall back to environment variables."""
+    with _cache_lock:
+        cached = _cache.get(environment)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        secrets = _fetch_secrets(environment)
+        _cache[environment] = (time.monotonic() + SECRETS_TTL_SECONDS, secrets)
+        return secrets
 
 
 def get_secret(name: str) -> str:
@@ -3,19 +3,90 @@ NotebookLM Integration for DHG AI Factory
 Allows agents to query NotebookLM projects as knowledge sources
 """
 
+import asyncio
 import httpx
-from typing import List, Dict, Optional
+import time
+from collections import OrderedDict
+from heapq import nlargest
+from operator import itemgetter
+from typing import Any, List, Dict, Optional, Tuple
 from datetime import datetime
 import json
 
 
+# =============================================================================
+# SHARED HTTP CLIENT
+# =============================================================================
+
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get or create the process-wide pooled HTTP client"""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (call from the app/graph shutdown hook)"""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+# Local cache of project metadata (NotebookLM has no public listing API yet).
+# Shared across calls: treat the entries as read-only.
+_PROJECTS = (
+    {
+        "id": "project_1",
+        "name": "DHG Medical Research",
+        "description": "Collection of medical research papers and guidelines",
+        "sources": 45,
+        "created_at": "2026-01-15"
+    },
+    {
+        "id": "project_2",
+        "name": "CME Content Library",
+        "description": "Previous CME proposals and educational content",
+        "sources": 120,
+        "created_at": "2025-12-01"
+    },
+    {
+        "id": "project_3",
+        "name": "Competitor Analysis",
+        "description": "Competitor CME programs and market research",
+        "sources": 30,
+        "created_at": "2026-01-10"
+    }
+)
+
+
 class NotebookLMClient:
     """Client for interacting with NotebookLM"""
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
         self.base_url = "https://notebooklm.google.com/api"  # Hypothetical API
-        self.client = httpx.AsyncClient()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return get_client()
+
+    async def close(self) -> None:
+        """No-op: the pool is shared process-wide; close_client() runs at shutdown"""
+
+    async def __aenter__(self) -> "NotebookLMClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     async def list_projects(self) -> List[Dict]:
         """List all NotebookLM projects"""
@@ -23,39 +94,19 @@ class NotebookLMClient:
         # This is a conceptual implementation
 
         # For now, we'll use a local cache of project metadata
-        projects = [
-            {
-                "id": "project_1",
-                "name": "DHG Medical Research",
-                "description": "Collection of medical research papers and guidelines",
-                "sources": 45,
-                "created_at": "2026-01-15"
-            },
-            {
-                "id": "project_2",
-                "name": "CME Content Library",
-                "description": "Previous CME proposals and educational content",
-                "sources": 120,
-                "created_at": "2025-12-01"
-            },
-            {
-                "id": "project_3",
-                "name": "Competitor Analysis",
-                "description": "Competitor CME programs and market research",
-                "sources": 30,
-                "created_at": "2026-01-10"
-            }
-        ]
-
-        return projects
+        return list(_PROJECTS)
 
     async def query_project(
         self,
         project_id: str,
         query: str,
-        max_results: int = 10
+        max_results: int = 10,
+        timestamp: Optional[str] = None
     ) -> Dict:
-        """Query a NotebookLM project"""
+        """Query a NotebookLM project
+
+        Fan-out callers pass one shared ``timestamp`` for all projects.
+        """
 
         # Conceptual implementation
         # In reality, this would call NotebookLM's API
@@ -80,7 +131,7 @@ class NotebookLMClient:
                 }
             ],
             "summary": "NotebookLM found 2 highly relevant sources discussing chronic cough management, including recent evidence on P2X3 antagonists and clinical practice guidelines.",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp or datetime.now().isoformat()
         }
 
     async def get_project_summary(self, project_id: str) -> Dict:
@@ -151,12 +202,92 @@ class NotebookLMClient:
 # INTEGRATION WITH DHG AI FACTORY
 # =============================================================================
 
+# Upper bound on concurrent project queries during a cross-project search
+MAX_CONCURRENT_PROJECT_QUERIES = 20
+
+# Upper bound on cached query/augmentation results (LRU-evicted)
+QUERY_CACHE_MAXSIZE = 2048
+
+# How long the list of all project ids is reused before re-listing
+PROJECT_LIST_TTL_SECONDS = 300
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Tuple, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _cache_ttl_seconds() -> float:
+    return NOTEBOOKLM_CONFIG["cache_duration_hours"] * 3600
+
+
 class NotebookLMIntegration:
     """Integration layer for DHG AI Factory agents"""
 
     def __init__(self):
         self.client = NotebookLMClient()
         self.project_cache = {}
+        self.query_cache = _TTLCache(QUERY_CACHE_MAXSIZE)
+        self._query_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROJECT_QUERIES)
+
+    async def __aenter__(self) -> "NotebookLMIntegration":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Leaves the shared client open for other instances
+        await self.client.close()
+
+    async def query_project(
+        self,
+        project_id: str,
+        query: str,
+        max_results: int = 10,
+        timestamp: Optional[str] = None
+    ) -> Dict:
+        """Query a project, serving repeats from the TTL cache"""
+        key = ("query", project_id, query, max_results)
+        cached = self.query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = await self.client.query_project(project_id, query, max_results, timestamp)
+        self.query_cache.set(key, result, _cache_ttl_seconds())
+        return result
+
+    async def _all_project_ids(self) -> List[str]:
+        """Ids of every project, cached in project_cache for a short TTL"""
+        cached = self.project_cache.get("_all_ids")
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        projects = await self.client.list_projects()
+        project_ids = [p["id"] for p in projects]
+        self.project_cache["_all_ids"] = (time.monotonic() + PROJECT_LIST_TTL_SECONDS, project_ids)
+        return project_ids
+
+    async def _bounded_query(self, project_id: str, query: str, timestamp: str) -> Dict:
+        async with self._query_semaphore:
+            return await self.query_project(project_id, query, timestamp=timestamp)
 
     async def search_across_projects(
         self,
@@ -167,24 +298,31 @@ class NotebookLMIntegration:
 
         if project_ids is None:
             # Search all projects
-            projects = await self.client.list_projects()
-            project_ids = [p["id"] for p in projects]
+            project_ids = await self._all_project_ids()
 
-        all_results = []
+        # One timestamp for the whole search, shared by every project query
+        timestamp = datetime.now().isoformat()
 
-        for project_id in project_ids:
-            results = await self.client.query_project(project_id, query)
-            all_results.extend(results["results"])
+        # Query all projects concurrently; a failing project is skipped
+        responses = await asyncio.gather(
+            *(self._bounded_query(project_id, query, timestamp) for project_id in project_ids),
+            return_exceptions=True
+        )
+
+        all_results = []
+        for response in responses:
+            if isinstance(response, dict):
+                all_results.extend(response["results"])
 
-        # Sort by relevance
-        all_results.sort(key=lambda x: x["relevance_score"], reverse=True)
+        # Top 10 by relevance
+        top_results = nlargest(10, all_results, key=itemgetter("relevance_score"))
 
         return {
             "query": query,
             "total_results": len(all_results),
             "projects_searched": len(project_ids),
-            "results": all_results[:10],  # Top 10
-            "timestamp": datetime.now().isoformat()
+            "results": top_results,
+            "timestamp": timestamp
         }
 
     async def augment_research_request(
@@ -194,17 +332,24 @@ class NotebookLMIntegration:
     ) -> Dict:
         """Augment a research request with NotebookLM knowledge"""
 
+        key = ("augment", topic, therapeutic_area)
+        cached = self.query_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Search relevant projects
         query = f"{topic} {therapeutic_area}"
         results = await self.search_across_projects(query)
 
-        return {
+        augmented = {
             "topic": topic,
             "therapeutic_area": therapeutic_area,
             "notebooklm_sources": results["results"],
             "source_count": results["total_results"],
             "recommendation": "Use these NotebookLM sources as additional context for research"
         }
+        self.query_cache.set(key, augmented, _cache_ttl_seconds())
+        return augmented
 
     async def create_knowledge_base_from_project(
         self,
@@ -213,33 +358,63 @@ class NotebookLMIntegration:
     ) -> Dict:
         """Export NotebookLM project to Onyx knowledge base"""
 
-        # Get project summary
-        summary = await self.client.get_project_summary(project_id)
-
-        # Export sources
-        sources_md = await self.client.export_project_sources(project_id, "markdown")
-
-        # Index in Onyx
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{onyx_url}/api/documents",
-                json={
-                    "title": f"NotebookLM: {summary['project_id']}",
-                    "content": sources_md,
-                    "metadata": {
-                        "source": "notebooklm",
-                        "project_id": project_id,
-                        "source_count": summary["source_breakdown"],
-                        "key_topics": summary["key_topics"]
-                    }
-                }
-            )
+        # Get project summary and export sources concurrently
+        summary, sources_md = await asyncio.gather(
+            self.client.get_project_summary(project_id),
+            self.client.export_project_sources(project_id, "markdown")
+        )
 
-            return {
-                "project_id": project_id,
-                "indexed": response.status_code in [200, 201],
-                "onyx_response": response.json() if response.status_code in [200, 201] else response.text
+        return await self._index_in_onyx(project_id, summary, sources_md, onyx_url)
+
+    async def create_knowledge_bases(
+        self,
+        project_ids: List[str],
+        onyx_url: str
+    ) -> List[Dict]:
+        """Export several NotebookLM projects to Onyx in one batch"""
+
+        # Fetch every summary and export up front, all in flight at once
+        exports = await asyncio.gather(
+            *(self.client.get_project_summary(pid) for pid in project_ids),
+            *(self.client.export_project_sources(pid, "markdown") for pid in project_ids)
+        )
+        summaries = exports[:len(project_ids)]
+        sources = exports[len(project_ids):]
+
+        # Index concurrently; requests multiplex over the shared HTTP/2 client
+        return await asyncio.gather(*(
+            self._index_in_onyx(pid, summary, sources_md, onyx_url)
+            for pid, summary, sources_md in zip(project_ids, summaries, sources)
+        ))
+
+    async def _index_in_onyx(
+        self,
+        project_id: str,
+        summary: Dict,
+        sources_md: str,
+        onyx_url: str
+    ) -> Dict:
+        """Index one exported project in Onyx over the shared pooled client"""
+        client = get_client()
+        response = await client.post(
+            f"{onyx_url}/api/documents",
+            json={
+                "title": f"NotebookLM: {summary['project_id']}",
+                "content": sources_md,
+                "metadata": {
+                    "source": "notebooklm",
+                    "project_id": project_id,
+                    "source_count": summary["source_breakdown"],
+                    "key_topics": summary["key_topics"]
+                }
             }
+        )
+
+        return {
+            "project_id": project_id,
+            "indexed": response.status_code in [200, 201],
+            "onyx_response": response.json() if response.status_code in [200, 201] else response.text
+        }
 
 
 # =============================================================================
@@ -358,12 +533,15 @@ if __name__ == "__main__":
     import asyncio
 
     async def test():
-        integration = NotebookLMIntegration()
-
-        # Test query
-        results = await integration.search_across_projects(
-            "chronic cough management"
-        )
+        try:
+            async with NotebookLMIntegration() as integration:
+                # Test query
+                results = await integration.search_across_projects(
+                    "chronic cough management"
+                )
+        finally:
+            # Process shutdown: the only place the shared client is closed
+            await close_client()
 
         print(json.dumps(results, indent=2))
 
@@ -0,0 +1,35 @@
+"""
+Shared helpers for saving rendered agent output to disk.
+=========================================================
+Used by the research agent's save_research_output and the standalone
+file-saving test scripts so filenames are built identically everywhere.
+"""
+
+import itertools
+import os
+import re
+import time
+
+
+# Anything that is not a word character, space or hyphen becomes "_"
+_UNSAFE_TOPIC_CHARS = re.compile(r"[^\w -]")
+
+# Per-process sequence appended to filenames so saves within the same
+# second never overwrite each other
+_SEQ = itertools.count()
+
+
+def sanitize_topic(topic: str, max_length: int = 50) -> str:
+    """Turn a free-text topic into a lowercase, filename-safe slug."""
+    return _UNSAFE_TOPIC_CHARS.sub("_", topic).replace(" ", "_").lower()[:max_length]
+
+
+def ensure_dir(path: str) -> None:
+    """Create an output directory if it does not exist yet."""
+    os.makedirs(path, exist_ok=True)
+
+
+def output_filename(output_format: str, topic: str, file_format: str) -> str:
+    """Build a unique output filename for a rendered document."""
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    return f"{output_format}_{sanitize_topic(topic)}_{timestamp}_{next(_SEQ):04d}.{file_format}"
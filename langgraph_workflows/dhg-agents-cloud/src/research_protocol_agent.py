@@ -106,6 +106,9 @@ class ResearchProtocolState(TypedDict):
     vs_distributions: Dict[str, Dict[str, Any]]  # keyed by step name
     vs_used: bool
 
+    # === Cached prompt views (serialized once per run) ===
+    _compact_outcomes: Dict[str, str]
+
 
 # =============================================================================
 # LLM CLIENT
@@ -194,6 +197,24 @@ Do NOT include a references list at the end of your section. References will be
 When citing, mentally track what each number refers to (e.g. [1] = Smith et al. 2023 NEJM study) so the citations are consistent and traceable."""
 
 
+# =============================================================================
+# PROMPT HELPERS
+# =============================================================================
+
+def _compact_outcomes(outcomes: Dict[str, Any]) -> Dict[str, str]:
+    """Serialize the outcome views used by the instrument and statistical-plan prompts.
+
+    The instrument prompt sees every secondary outcome (clipped to 1500
+    characters there); the statistical plan sees only the first three.
+    """
+    secondary = outcomes.get("secondary_outcomes", [])
+    return {
+        "primary": json.dumps(outcomes.get("primary_outcome", {}), indent=2),
+        "secondary": json.dumps(secondary, indent=2),
+        "secondary_top3": json.dumps(secondary[:3], indent=2),
+    }
+
+
 # =============================================================================
 # GRAPH NODES
 # =============================================================================
@@ -470,6 +491,7 @@ Return ONLY valid JSON."""
 
     return {
         "outcome_measures": outcome_measures,
+        "_compact_outcomes": _compact_outcomes(outcome_measures),
         "total_tokens": prev_tokens + result["total_tokens"],
         "total_cost": prev_cost + result["cost"],
         "vs_distributions": {**prev_dists, "outcomes": vs_result} if vs_result else prev_dists,
@@ -482,7 +504,9 @@ Return ONLY valid JSON."""
 async def design_instruments_node(state: ResearchProtocolState) -> dict:
     """Design assessment instruments."""
 
-    outcomes = state.get("outcome_measures", {})
+    compact_outcomes = state.get("_compact_outcomes") or _compact_outcomes(
+        state.get("outcome_measures", {})
+    )
     disease = state.get("disease_state", "")
 
     system = f"""{RESEARCH_PROTOCOL_SYSTEM_PROMPT}
@@ -528,8 +552,8 @@ You are designing ASSESSMENT INSTRUMENTS. Return a JSON array:
     prompt = f"""Design assessment instruments for {disease} CME outcomes research.
 
 OUTCOMES TO MEASURE:
-Primary: {json.dumps(outcomes.get('primary_outcome', {}), indent=2)}
-Secondary: {json.dumps(outcomes.get('secondary_outcomes', []), indent=2)[:1500]}
+Primary: {compact_outcomes['primary']}
+Secondary: {compact_outcomes['secondary'][:1500]}
 
 Design instruments that:
 1. Align to each outcome measure
@@ -631,7 +655,9 @@ async def create_data_collection_plan_node(state: ResearchProtocolState) -> dict
 async def develop_statistical_plan_node(state: ResearchProtocolState) -> dict:
     """Develop the statistical analysis plan."""
 
-    outcomes = state.get("outcome_measures", {})
+    compact_outcomes = state.get("_compact_outcomes") or _compact_outcomes(
+        state.get("outcome_measures", {})
+    )
     target_n = state.get("target_enrollment", 200)
     disease = state.get("disease_state", "")
     therapeutic_area = state.get("therapeutic_area", "")
@@ -662,10 +688,10 @@ Target enrollment: {target_n}
 Expected completers: ~{int(target_n * 0.6)} (40% attrition)
 
 PRIMARY OUTCOME:
-{json.dumps(outcomes.get('primary_outcome', {}), indent=2)}
+{compact_outcomes['primary']}
 
 SECONDARY OUTCOMES:
-{json.dumps(outcomes.get('secondary_outcomes', [])[:3], indent=2)}
+{compact_outcomes['secondary_top3']}
 
 Create a statistical plan that:
 1. Is appropriate for {disease} educational outcomes
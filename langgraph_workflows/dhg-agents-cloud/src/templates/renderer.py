@@ -2,9 +2,10 @@
 # Location: /home/swebber64/DHG/aifactory3.5/dhgaifactory3.5/langgraph_workflows/dhg-cme-research-agent-cloud/src/templates/renderer.py
 
 from enum import Enum
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Protocol
 from datetime import datetime
-import json
+from itertools import islice
+import orjson
 
 
 class TemplateType(str, Enum):
@@ -15,71 +16,88 @@ class TemplateType(str, Enum):
     POWERPOINT_OUTLINE = "powerpoint_outline"
 
 
-def render_template(template_type: TemplateType, data: Dict[str, Any]) -> str:
-    """Render agent output using specified template"""
-    if template_type == TemplateType.JSON:
-        return json.dumps(data, indent=2)
-    elif template_type == TemplateType.CME_PROPOSAL:
-        return render_cme_proposal(data)
-    elif template_type == TemplateType.PODCAST_SCRIPT:
-        return render_podcast_script(data)
-    elif template_type == TemplateType.GAP_REPORT:
-        return render_gap_report(data)
-    elif template_type == TemplateType.POWERPOINT_OUTLINE:
-        return render_powerpoint_outline(data)
-    else:
+def format_date() -> str:
+    """Today's date as shown in rendered documents"""
+    return datetime.now().strftime("%B %d, %Y")
+
+
+def render_template(
+    template_type: TemplateType,
+    data: Dict[str, Any],
+    today: Optional[str] = None
+) -> str:
+    """Render agent output using specified template
+
+    Batch callers can pass a precomputed ``today`` (see format_date) so the
+    date is formatted once rather than per document.
+    """
+    try:
+        renderer = _RENDERERS[TemplateType(template_type)]
+    except (KeyError, ValueError):
         raise ValueError(f"Unknown template type: {template_type}")
+    return renderer(data, today=today or format_date())
+
+
+def render_json(data: Dict[str, Any], today: Optional[str] = None) -> str:
+    """Render raw agent output as indented JSON"""
+    return orjson.dumps(
+        data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    ).decode()
 
 
-def render_cme_proposal(data: Dict[str, Any]) -> str:
+def render_cme_proposal(data: Dict[str, Any], today: Optional[str] = None) -> str:
     """Render CME Activity Proposal"""
     topic = data.get("topic", "Unknown Topic")
     gaps = data.get("clinical_gaps", [])
     findings = data.get("key_findings", [])
     citations = data.get("validated_citations", [])
     synthesis = data.get("synthesis", "")
+    today = today or format_date()
 
-    output = f"""# CME Activity Proposal: {topic}
+    parts = [f"""# CME Activity Proposal: {topic}
 
-**Date:** {datetime.now().strftime("%B %d, %Y")}
+**Date:** {today}
 
 ## Educational Need
 
 Current clinical practice demonstrates {len(gaps)} critical gaps:
 
-"""
-    for i, gap in enumerate(gaps, 1):
-        output += f"{i}. {gap}\n"
+"""]
+    parts.extend(f"{i}. {gap}\n" for i, gap in enumerate(gaps, 1))
 
-    output += f"""
+    parts.append(f"""
 ## Content Outline
 
 {synthesis}
 
 ## Key Evidence
 
-"""
-    for i, finding in enumerate(findings, 1):
-        output += f"{i}. {finding}\n"
+""")
+    parts.extend(f"{i}. {finding}\n" for i, finding in enumerate(findings, 1))
 
-    output += f"""
+    parts.append(f"""
 ## References ({len(citations)} citations)
 
-"""
-    for i, cit in enumerate(citations[:10], 1):
-        ama = cit.get("ama_format", cit.get("title", "Citation"))
-        output += f"{i}. {ama}\n"
+""")
+    get = dict.get
+    append = parts.append
+    for i, cit in enumerate(islice(citations, 10), 1):
+        ama = get(cit, "ama_format")
+        if ama is None:
+            ama = get(cit, "title", "Citation")
+        append(f"{i}. {ama}\n")
 
-    return output
+    return "".join(parts)
 
 
-def render_podcast_script(data: Dict[str, Any]) -> str:
+def render_podcast_script(data: Dict[str, Any], today: Optional[str] = None) -> str:
     """Render Podcast Script"""
     topic = data.get("topic", "Unknown Topic")
     gaps = data.get("clinical_gaps", [])
     findings = data.get("key_findings", [])
 
-    output = f"""# Podcast Script: {topic}
+    parts = [f"""# Podcast Script: {topic}
 
 ## Opening
 
@@ -87,84 +105,94 @@ Welcome to DHG CME Podcast. Today: {topic}
 
 ## Educational Gap
 
-"""
-    for gap in gaps[:2]:
-        output += f"- {gap}\n"
+"""]
+    parts.extend(f"- {gap}\n" for gap in islice(gaps, 2))
 
-    output += """
+    parts.append("""
 ## Key Findings
 
-"""
-    for finding in findings:
-        output += f"- {finding}\n"
+""")
+    parts.extend(f"- {finding}\n" for finding in findings)
 
-    output += """
+    parts.append("""
 ## Closing
 
 Thank you for listening. Visit our website to claim CME credit.
-"""
-    return output
+""")
+    return "".join(parts)
 
 
-def render_gap_report(data: Dict[str, Any]) -> str:
+def render_gap_report(data: Dict[str, Any], today: Optional[str] = None) -> str:
     """Render Gap Analysis Report"""
     topic = data.get("topic", "Unknown Topic")
     gaps = data.get("clinical_gaps", [])
     findings = data.get("key_findings", [])
     citations = data.get("validated_citations", [])
+    today = today or format_date()
 
-    output = f"""# Clinical Practice Gap Analysis
+    parts = [f"""# Clinical Practice Gap Analysis
 
 **Topic:** {topic}
-**Date:** {datetime.now().strftime("%B %d, %Y")}
+**Date:** {today}
 
 ## Identified Gaps ({len(gaps)} total)
 
-"""
-    for i, gap in enumerate(gaps, 1):
-        priority = "High" if i <= 2 else "Medium"
-        output += f"### Gap #{i}: {gap}\n**Priority:** {priority}\n\n"
+"""]
+    parts.extend(
+        f"### Gap #{i}: {gap}\n**Priority:** {'High' if i <= 2 else 'Medium'}\n\n"
+        for i, gap in enumerate(gaps, 1)
+    )
 
-    output += """
+    parts.append("""
 ## Supporting Evidence
 
-"""
-    for finding in findings:
-        output += f"- {finding}\n"
+""")
+    parts.extend(f"- {finding}\n" for finding in findings)
 
-    output += f"""
+    parts.append(f"""
 ## Evidence Base: {len(citations)} citations
-"""
-    return output
+""")
+    return "".join(parts)
 
 
-def render_powerpoint_outline(data: Dict[str, Any]) -> str:
+def render_powerpoint_outline(data: Dict[str, Any], today: Optional[str] = None) -> str:
     """Render PowerPoint Outline"""
     topic = data.get("topic", "Unknown Topic")
     gaps = data.get("clinical_gaps", [])
     findings = data.get("key_findings", [])
 
-    output = f"""# PowerPoint Outline: {topic}
+    parts = [f"""# PowerPoint Outline: {topic}
 
 ## Slide 1: Title
 {topic}
 
 ## Slide 2: Learning Objectives
-"""
-    for i, gap in enumerate(gaps[:4], 1):
-        output += f"{i}. Describe {gap.lower()}\n"
+"""]
+    parts.extend(f"{i}. Describe {gap.lower()}\n" for i, gap in enumerate(islice(gaps, 4), 1))
 
-    output += """
+    parts.append("""
 ## Slides 3-5: Evidence Review
 [Content from synthesis]
 
 ## Slide 6: Key Findings
-"""
-    for finding in findings:
-        output += f"- {finding}\n"
+""")
+    parts.extend(f"- {finding}\n" for finding in findings)
 
-    output += """
+    parts.append("""
 ## Slide 7: References
 [Citations]
-"""
-    return output
+""")
+    return "".join(parts)
+
+
+class _Renderer(Protocol):
+    def __call__(self, data: Dict[str, Any], today: Optional[str] = None) -> str: ...
+
+
+_RENDERERS: Dict[TemplateType, _Renderer] = {
+    TemplateType.JSON: render_json,
+    TemplateType.CME_PROPOSAL: render_cme_proposal,
+    TemplateType.PODCAST_SCRIPT: render_podcast_script,
+    TemplateType.GAP_REPORT: render_gap_report,
+    TemplateType.POWERPOINT_OUTLINE: render_powerpoint_outline,
+}
@@ -2,7 +2,11 @@
 Simple test for file saving - standalone version
 """
 import os
-from datetime import datetime
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from output_files import ensure_dir, output_filename
 
 def save_research_output(
     content: str,
@@ -12,11 +16,8 @@ def save_research_output(
     base_dir: str = "./outputs"
 ) -> str:
     """Save research output to file."""
-    os.makedirs(base_dir, exist_ok=True)
-    safe_topic = "".join(c if c.isalnum() or c in (" ", "-", "_") else "_" for c in topic)
-    safe_topic = safe_topic.replace(" ", "_").lower()[:50]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{output_format}_{safe_topic}_{timestamp}.{file_format}"
+    ensure_dir(base_dir)
+    filename = output_filename(output_format, topic, file_format)
     filepath = os.path.join(base_dir, filename)
     with open(filepath, "w", encoding="utf-8") as f:
         f.write(content)
@@ -0,0 +1,36 @@
+"""Tests for templates.renderer."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from templates.renderer import TemplateType, render_template
+
+
+def _payload():
+    return {
+        "topic": "Chronic Cough Management",
+        "clinical_gaps": ["Delayed referral"],
+        "key_findings": ["Neuromodulators help refractory cases"],
+        "validated_citations": [],
+        "synthesis": "Initial synthesis.",
+    }
+
+
+class TestRenderTemplate:
+    def test_render_does_not_modify_payload(self):
+        data = _payload()
+        render_template(TemplateType.CME_PROPOSAL, data, today="January 01, 2026")
+
+        assert data == _payload()
+
+    def test_rerender_reflects_updated_payload(self):
+        data = _payload()
+        before = render_template(TemplateType.CME_PROPOSAL, data, today="January 01, 2026")
+
+        data["topic"] = "Severe Asthma"
+        after = render_template(TemplateType.CME_PROPOSAL, data, today="January 01, 2026")
+
+        assert "Severe Asthma" in after
+        assert after != before
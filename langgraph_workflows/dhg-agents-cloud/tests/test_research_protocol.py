@@ -0,0 +1,35 @@
+"""
+Tests for the Research Protocol Agent (research_protocol_agent.py).
+
+Covers:
+- Cached outcome views match the per-prompt serializations they replace
+"""
+
+import json
+
+import research_protocol_agent as rp
+
+
+OUTCOMES = {
+    "primary_outcome": {"name": "Guideline-concordant prescribing", "moore_level": "Level 5"},
+    "secondary_outcomes": [{"name": f"Secondary {i}", "moore_level": "Level 4"} for i in range(5)],
+}
+
+
+class TestCompactOutcomes:
+    def test_primary_view_is_full_primary_outcome(self):
+        views = rp._compact_outcomes(OUTCOMES)
+
+        assert views["primary"] == json.dumps(OUTCOMES["primary_outcome"], indent=2)
+
+    def test_instrument_prompt_sees_every_secondary_outcome(self):
+        views = rp._compact_outcomes(OUTCOMES)
+
+        assert views["secondary"] == json.dumps(OUTCOMES["secondary_outcomes"], indent=2)
+        assert "Secondary 4" in views["secondary"]
+
+    def test_statistical_plan_sees_first_three_secondary_outcomes(self):
+        views = rp._compact_outcomes(OUTCOMES)
+
+        assert views["secondary_top3"] == json.dumps(OUTCOMES["secondary_outcomes"][:3], indent=2)
+        assert "Secondary 3" not in views["secondary_top3"]
@@ -5,8 +5,16 @@ Simple proof-of-concept using Perplexity for research
 
 from typing import TypedDict, Annotated
 from langgraph.graph import StateGraph, END
+from langgraph.types import StreamWriter
 from langchain_core.messages import HumanMessage
+from collections import OrderedDict
+from hashlib import blake2b
+import asyncio
+import httpx
+import orjson
 import os
+import re
+import time
 
 
 class ResearchState(TypedDict):
@@ -16,27 +24,143 @@ class ResearchState(TypedDict):
     status: str
 
 
-def research_node(state: ResearchState) -> ResearchState:
-    """Research using Perplexity API"""
-    import httpx
-    
+# Shared client so TLS sessions and HTTP/2 connections to Perplexity are
+# pooled across research calls instead of re-handshaking every request
+_CLIENT = httpx.AsyncClient(
+    timeout=60.0,
+    http2=True,
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+)
+
+
+PERPLEXITY_URL = "https://api.perplexity.ai/chat/completions"
+PERPLEXITY_MODEL = "llama-3.1-sonar-small-128k-online"
+
+# Per-process cap on simultaneous Perplexity calls to stay under account limits
+_PERPLEXITY_SEMAPHORE = asyncio.Semaphore(int(os.getenv("PERPLEXITY_MAX_CONCURRENCY", "16")))
+
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a medical research expert."}
+
+# (api_key, headers) - rebuilt only when the key changes so rotation still works
+_headers_cache = (None, None)
+
+
+def _perplexity_headers() -> dict:
+    global _headers_cache
     perplexity_key = os.getenv("PERPLEXITY_API_KEY")
+    if _headers_cache[0] != perplexity_key:
+        _headers_cache = (perplexity_key, {
+            "Authorization": f"Bearer {perplexity_key}",
+            "Content-Type": "application/json"
+        })
+    return _headers_cache[1]
+
+
+async def close_client():
+    """Close the shared Perplexity client (call on server shutdown)"""
+    await _CLIENT.aclose()
+
+
+async def _stream_research(query: str, writer: StreamWriter) -> str:
+    """
+    Stream a Perplexity completion, forwarding each token delta to graph
+    stream consumers (stream_mode="custom") as it arrives.
+    """
+    body = orjson.dumps({
+        "model": PERPLEXITY_MODEL,
+        "stream": True,
+        "messages": [
+            _SYSTEM_MESSAGE,
+            {"role": "user", "content": f"Research: {query}"}
+        ]
+    })
+    
+    parts = []
+    async with _PERPLEXITY_SEMAPHORE, _CLIENT.stream(
+        "POST",
+        PERPLEXITY_URL,
+        headers=_perplexity_headers(),
+        content=body
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            chunk = orjson.loads(data)
+            delta = chunk["choices"][0].get("delta", {}).get("content")
+            if delta:
+                parts.append(delta)
+                writer({"type": "research.delta", "text": delta})
     
-    response = httpx.post(
-        "https://api.perplexity.ai/chat/completions",
-        headers={"Authorization": f"Bearer {perplexity_key}"},
-        json={
-            "model": "llama-3.1-sonar-small-128k-online",
-            "messages": [
-                {"role": "system", "content": "You are a medical research expert."},
-                {"role": "user", "content": f"Research: {state['query']}"}
-            ]
-        },
-        timeout=60.0
-    )
+    return "".join(parts)
+
+
+RESEARCH_CACHE_MAXSIZE = 1024
+RESEARCH_CACHE_TTL_SECONDS = 3600
+
+# Queries asking for fresh information always go to Perplexity
+_TIME_SENSITIVE_RE = re.compile(r"\b(?:today|latest|current|recent|news|this (?:week|month|year))\b")
+
+_research_cache = OrderedDict()  # query key -> (expires_at, results)
+_inflight = {}  # query key -> Future for the Perplexity call in progress
+
+
+def _query_key(query: str) -> bytes:
+    """Hash a whitespace/case-normalized query"""
+    normalized = " ".join(query.lower().split())
+    return blake2b(normalized.encode(), digest_size=16).digest()
+
+
+async def _research(query: str, writer: StreamWriter) -> str:
+    """
+    Research a query, serving repeats from a bounded TTL cache and collapsing
+    concurrent identical queries onto a single Perplexity call.
+    """
+    key = _query_key(query)
+    cacheable = not _TIME_SENSITIVE_RE.search(query.lower())
+    
+    if cacheable:
+        cached = _research_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            _research_cache.move_to_end(key)
+            writer({"type": "research.delta", "text": cached[1]})
+            return cached[1]
+    
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        results = await asyncio.shield(inflight)
+        writer({"type": "research.delta", "text": results})
+        return results
+    
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        results = await _stream_research(query, writer)
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved in case nobody else was waiting
+        raise
+    else:
+        future.set_result(results)
+    finally:
+        _inflight.pop(key, None)
+        if not future.done():
+            future.cancel()
     
-    data = response.json()
-    results = data["choices"][0]["message"]["content"]
+    if cacheable:
+        _research_cache[key] = (time.monotonic() + RESEARCH_CACHE_TTL_SECONDS, results)
+        _research_cache.move_to_end(key)
+        while len(_research_cache) > RESEARCH_CACHE_MAXSIZE:
+            _research_cache.popitem(last=False)
+    return results
+
+
+async def research_node(state: ResearchState, writer: StreamWriter) -> ResearchState:
+    """Research using Perplexity API"""
+    results = await _research(state["query"], writer)
     
     return {
         **state,
@@ -5,7 +5,6 @@ Routes:
   GET    /api/agent-sessions              list with filters (project, source, limit, offset)
   GET    /api/agent-sessions/{session_id} get by session_id
 """
-import time
 import logging
 from typing import Optional
 
@@ -28,32 +27,56 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/agent-sessions", tags=["agent-sessions"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_agent_sessions",
+        "get_agent_session",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_agent_session",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_agent_session_failed",
+        "list_agent_sessions_failed",
+        "get_agent_session_failed",
+    )
+}
+
 
 @router.post("", response_model=AgentSessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_agent_session(
     payload: AgentSessionCreate,
     db: Session = Depends(get_db),
 ) -> AgentSessionResponse:
-    start = time.time()
     try:
-        try:
-            row = svc.create_agent_session(db, payload)
-        except RuntimeError as re:
-            raise HTTPException(status_code=409, detail=str(re))
-
-        registry_write_operations.labels(operation="create_agent_session").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            try:
+                row = svc.create_agent_session(db, payload)
+            except RuntimeError as re:
+                raise HTTPException(status_code=409, detail=str(re))
+        WRITE_OPS['create_agent_session'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_agent_session_failed").inc()
+        ERRORS['create_agent_session_failed'].inc()
         logger.exception("create_agent_session failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -66,18 +89,16 @@ async def list_agent_sessions(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ) -> AgentSessionList:
-    start = time.time()
     try:
-        rows, total = svc.list_agent_sessions(
-            db, project=project, source=source,
-            limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_agent_sessions").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_agent_sessions(
+                db, project=project, source=source,
+                limit=limit, offset=offset,
+            )
+        READ_OPS['list_agent_sessions'].inc()
         return AgentSessionList(sessions=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="list_agent_sessions_failed").inc()
+        ERRORS['list_agent_sessions_failed'].inc()
         logger.exception("list_agent_sessions failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -87,18 +108,16 @@ async def get_agent_session(
     session_id: str,
     db: Session = Depends(get_db),
 ) -> AgentSessionResponse:
-    start = time.time()
     try:
-        row = svc.get_agent_session(db, session_id)
-        if not row:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        registry_read_operations.labels(operation="get_agent_session").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            row = svc.get_agent_session(db, session_id)
+            if not row:
+                raise HTTPException(status_code=404, detail="Session not found")
+        READ_OPS['get_agent_session'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
-        registry_errors.labels(error_type="get_agent_session_failed").inc()
+        ERRORS['get_agent_session_failed'].inc()
         logger.exception("get_agent_session failed")
         raise HTTPException(status_code=500, detail="Internal server error")
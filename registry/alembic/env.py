@@ -2,12 +2,9 @@ from logging.config import fileConfig
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
+import functools
 import os
-
-# Import models for autogenerate support
 import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from models import Base
 
 # Alembic Config object
 config = context.config
@@ -16,10 +13,24 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Target metadata for autogenerate support
-target_metadata = Base.metadata
+
+def get_target_metadata():
+    """Model metadata for autogenerate/check; None for plain upgrade/downgrade.
+
+    Importing models builds the whole ORM graph, which migrations themselves
+    never need. Programmatic callers without cmd_opts still get the metadata.
+    """
+    opts = config.cmd_opts
+    if opts is not None and not getattr(opts, "autogenerate", False) and opts.cmd[0].__name__ != "check":
+        return None
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    from models import Base
+    return Base.metadata
+
 
 # Get database URL from environment - consistent with database.py
+@functools.lru_cache(maxsize=1)
 def get_url():
     # Check for direct URL override
     url = os.getenv("DATABASE_URL")
@@ -40,7 +51,7 @@ def run_migrations_offline() -> None:
     url = get_url()
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=get_target_metadata(),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -63,7 +74,7 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=get_target_metadata()
         )
 
         with context.begin_transaction():
@@ -0,0 +1,50 @@
+"""align media indexes with listing queries
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-17
+
+Replaces the two single-column media indexes from 001 with ones shaped like
+the queries that actually run:
+
+  idx_media_status_created_at  (status, created_at DESC) INCLUDE (filename,
+                               mime_type, file_size_bytes) — status-filtered
+                               listings newest-first, answerable index-only.
+                               Makes idx_media_status (its prefix) redundant.
+  idx_media_created_at_id      (created_at DESC, id DESC) — the keyset cursor
+                               used by GET /api/v1/media. Supersedes
+                               idx_media_created_at.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "027"
+down_revision = "026"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_media_status_created_at",
+        "media",
+        ["status", sa.text("created_at DESC")],
+        postgresql_include=["filename", "mime_type", "file_size_bytes"],
+    )
+    op.create_index(
+        "idx_media_created_at_id",
+        "media",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("idx_media_status", table_name="media")
+    op.drop_index("idx_media_created_at", table_name="media")
+
+
+def downgrade() -> None:
+    op.create_index("idx_media_created_at", "media", ["created_at"])
+    op.create_index("idx_media_status", "media", ["status"])
+    op.drop_index("idx_media_created_at_id", table_name="media")
+    op.drop_index("idx_media_status_created_at", table_name="media")
@@ -0,0 +1,31 @@
+"""drop redundant messages.conversation_id index
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-17
+
+002 created both idx_messages_conversation_id (conversation_id) and
+idx_messages_conversation_index (conversation_id, message_index). The first is
+a prefix of the second, so lookups by conversation_id already use the
+composite; the extra B-tree only costs a write per inserted message.
+
+artifacts has no composite index led by conversation_id, so
+idx_artifacts_conversation_id stays.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "028"
+down_revision = "027"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_messages_conversation_id", table_name="messages")
+
+
+def downgrade() -> None:
+    op.create_index("idx_messages_conversation_id", "messages", ["conversation_id"])
@@ -0,0 +1,41 @@
+"""replace messages.created_at B-tree with BRIN
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-17
+
+messages is append-only and created_at grows with physical row order, so a
+BRIN index answers time-range filters at a tiny fraction of the B-tree's size
+and insert cost. Nothing orders messages by created_at alone (conversations
+are read through idx_messages_conversation_index), so the B-tree's ordered
+scans are not needed.
+
+events.created_at and artifacts.created_at keep their B-trees: list_events
+and list_artifacts page with ORDER BY created_at DESC LIMIT, which BRIN
+cannot serve. segments has no created_at index to convert.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "029"
+down_revision = "028"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_messages_created_at_brin",
+        "messages",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.drop_index("idx_messages_created_at", table_name="messages")
+
+
+def downgrade() -> None:
+    op.create_index("idx_messages_created_at", "messages", ["created_at"])
+    op.drop_index("idx_messages_created_at_brin", table_name="messages")
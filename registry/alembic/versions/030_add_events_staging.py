@@ -0,0 +1,28 @@
+"""add UNLOGGED events_staging table
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-17
+
+Landing table for the registry's background event flusher. Batches are COPYd
+here without WAL and periodically moved into events in one transaction.
+Same columns and defaults as events; no indexes, since rows only live here
+for a few seconds and are always read in full.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "030"
+down_revision = "029"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE UNLOGGED TABLE events_staging (LIKE events INCLUDING DEFAULTS)")
+
+
+def downgrade() -> None:
+    op.drop_table("events_staging")
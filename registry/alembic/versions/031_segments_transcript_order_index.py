@@ -0,0 +1,34 @@
+"""index segments by (transcript_id, segment_index)
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-17
+
+GET /api/v1/segments/transcript/{id} filters on transcript_id and orders by
+segment_index. With only idx_segments_transcript_id the planner fetches every
+matching segment and sorts them; the composite returns them already ordered.
+idx_segments_transcript_id is its prefix, so it is dropped.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "031"
+down_revision = "030"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_segments_transcript_index",
+        "segments",
+        ["transcript_id", "segment_index"],
+    )
+    op.drop_index("idx_segments_transcript_id", table_name="segments")
+
+
+def downgrade() -> None:
+    op.create_index("idx_segments_transcript_id", "segments", ["transcript_id"])
+    op.drop_index("idx_segments_transcript_index", table_name="segments")
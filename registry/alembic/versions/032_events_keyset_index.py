@@ -0,0 +1,35 @@
+"""index events for keyset listing
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-17
+
+GET /api/v1/events pages by (created_at, id) newest-first, the same keyset
+cursor media uses since 027. idx_events_created_at_id (created_at DESC,
+id DESC) serves both the row comparison and the ordering, and supersedes
+idx_events_created_at from 001.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "032"
+down_revision = "031"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_events_created_at_id",
+        "events",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("idx_events_created_at", table_name="events")
+
+
+def downgrade() -> None:
+    op.create_index("idx_events_created_at", "events", ["created_at"])
+    op.drop_index("idx_events_created_at_id", table_name="events")
@@ -0,0 +1,36 @@
+"""trigram index for conversation title search
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-17
+
+GET /api/v1/conversations/search filters with title ILIKE '%q%'. A leading
+wildcard cannot use the B-tree idx_conversations_title, so every search was
+a sequential scan. A pg_trgm GIN index serves ILIKE with wildcards on both
+sides. The B-tree is kept for exact title lookups.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "033"
+down_revision = "032"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_conversations_title_trgm",
+        "conversations",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it
+    op.drop_index("idx_conversations_title_trgm", table_name="conversations")
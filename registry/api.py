@@ -3,8 +3,9 @@ DHG Registry API Service
 FastAPI service with /healthz, /metrics, and CRUD operations
 All data stored in PostgreSQL DHG Registry
 """
-import time
+import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager
 from typing import List, Optional
 from datetime import datetime
@@ -12,16 +13,20 @@ import uuid
 
 logger = logging.getLogger("dhg.registry")
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select, tuple_, update
 from sqlalchemy.orm import Session
 from prometheus_client import generate_latest
 
-from database import engine, SessionLocal, get_db
-from models import Media, Transcript, Segment, Event
+from database import engine, SessionLocal, get_db, bulk_insert_with_copy
+from event_queue import enqueue_event, start_event_flusher, stop_event_flusher, flush_pending_events
+from models import Media, Transcript, Segment, Event, uuid7
+from json_rows import LIST_STREAM_CHUNK, construct, json_list, json_row, stream_json_list
+from response_cache import ResponseCache
 from metrics import (
     registry_write_latency,
     registry_read_latency,
@@ -29,6 +34,9 @@ from metrics import (
     registry_read_operations,
     registry_errors,
     registry_db_errors,
+    flush_latency_metrics,
+    latency_flusher,
+    timed,
 )
 
 
@@ -65,6 +73,16 @@ class MediaResponse(BaseModel):
         from_attributes = True
 
 
+class MediaBulkResponse(BaseModel):
+    created: int
+    ids: List[uuid.UUID]
+
+
+class SegmentBulkResponse(BaseModel):
+    created: int
+    ids: List[uuid.UUID]
+
+
 class TranscriptCreate(BaseModel):
     media_id: uuid.UUID
     full_text: str
@@ -145,6 +163,9 @@ class EventResponse(BaseModel):
 # ============================================================================
 # FastAPI Application
 # ============================================================================
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "60"))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - startup and shutdown"""
@@ -169,17 +190,32 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"✗ Security role seeding failed: {e}")
 
+    # Sync handlers run in anyio's threadpool (40 threads by default); size it
+    # to the DB pool (pool_size + max_overflow) so requests queue on threads
+    # rather than idling while connections are free
+    anyio.to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+
+    # Background writer for audit events queued by request handlers
+    event_flusher_task = start_event_flusher()
+    # Applies buffered latency observations to the Prometheus histograms
+    latency_flusher_task = asyncio.create_task(latency_flusher())
+
     yield
 
     # Shutdown
     print("Shutting down Registry API...")
+    # Let the flusher write its in-flight batch instead of cancelling it mid-collection
+    await stop_event_flusher(event_flusher_task)
+    latency_flusher_task.cancel()
+    await flush_pending_events()
 
 
 app = FastAPI(
     title="DHG Registry API",
     description="Central data registry for DHG AI Factory",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 # Import routers
 from agent_endpoints import router as agent_router
@@ -264,11 +300,59 @@ app.add_middleware(
 
 
 
+# ============================================================================
+# Metric children — resolved once so handlers skip the labels() lookup
+# ============================================================================
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_media",
+        "create_media_bulk",
+        "create_transcript",
+        "create_segment",
+        "create_segments_bulk",
+        "create_event",
+    )
+}
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_media",
+        "get_media",
+        "list_transcripts",
+        "get_transcripts_by_media",
+        "get_segments_by_transcript",
+        "list_events",
+    )
+}
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_media_failed",
+        "create_media_bulk_failed",
+        "list_media_stream_failed",
+        "list_transcripts_stream_failed",
+        "get_segments_by_transcript_stream_failed",
+        "list_events_stream_failed",
+        "list_media_failed",
+        "get_media_failed",
+        "create_transcript_failed",
+        "list_transcripts_failed",
+        "get_transcripts_by_media_failed",
+        "create_segment_failed",
+        "create_segments_bulk_failed",
+        "get_segments_by_transcript_failed",
+        "create_event_failed",
+        "list_events_failed",
+    )
+}
+
+
 # ============================================================================
 # Health & Metrics Endpoints
 # ============================================================================
 @app.get("/healthz", response_class=PlainTextResponse)
-async def health():
+def health():
     """Health check endpoint"""
     try:
         with engine.connect() as conn:
@@ -281,8 +365,9 @@ async def health():
 
 
 @app.get("/metrics", response_class=PlainTextResponse)
-async def metrics():
-    """Prometheus metrics endpoint"""
+def metrics():
+    """Prometheus metrics endpoint (rendered in the threadpool, off the event loop)"""
+    flush_latency_metrics()
     return generate_latest()
 
 
@@ -324,7 +409,7 @@ ALERT_TRIGGER_MAP: dict = {
 
 
 @app.post("/webhooks/alertmanager")
-async def alertmanager_webhook(
+def alertmanager_webhook(
     payload: AlertmanagerPayload,
     db: Session = Depends(get_db),
 ):
@@ -378,66 +463,147 @@ async def alertmanager_webhook(
 # Media Endpoints
 # ============================================================================
 @app.post("/api/v1/media", response_model=MediaResponse, status_code=status.HTTP_201_CREATED)
-async def create_media(media: MediaCreate, db: Session = Depends(get_db)):
+def create_media(media: MediaCreate, db: Session = Depends(get_db)):
     """Create a new media entry"""
-    start_time = time.time()
     try:
-        db_media = Media(**media.model_dump())
-        db.add(db_media)
-        db.commit()
-        db.refresh(db_media)
-
-        # Log event
-        db_event = Event(
-            event_type="create",
-            entity_type="media",
-            entity_id=db_media.id,
-            description=f"Created media: {media.filename}"
-        )
-        db.add(db_event)
-        db.commit()
+        with timed(registry_write_latency):
+            db_media = db.execute(
+                insert(Media).values(**media.model_dump()).returning(*Media.__table__.c)
+            ).one()
+            db.commit()
+
+            # Log event (written in the background)
+            enqueue_event(
+                "create",
+                "media",
+                db_media.id,
+                description=f"Created media: {media.filename}"
+            )
 
-        registry_write_operations.labels(operation='create_media').inc()
-        registry_write_latency.observe((time.time() - start_time) * 1000)
+        WRITE_OPS['create_media'].inc()
 
-        return db_media
+        return json_row(MediaResponse, db_media, status.HTTP_201_CREATED)
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type='create_media_failed').inc()
+        ERRORS['create_media_failed'].inc()
         logger.exception("create_media failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# Batches at least this large go through COPY; smaller ones use bulk INSERTs
+BULK_COPY_THRESHOLD = 100
+
+MEDIA_COPY_COLUMNS = [
+    "id", "filename", "filepath", "file_size_bytes", "mime_type",
+    "duration_seconds", "status", "meta_data",
+]
+EVENT_COPY_COLUMNS = ["id", "event_type", "entity_type", "entity_id", "description"]
+
+
+@app.post("/api/v1/media/bulk", response_model=MediaBulkResponse, status_code=status.HTTP_201_CREATED)
+def create_media_bulk(media: List[MediaCreate], db: Session = Depends(get_db)):
+    """Create many media entries (and their audit events) in one transaction"""
+    try:
+        with timed(registry_write_latency):
+            media_rows = [
+                {"id": uuid7(), "status": "pending", **item.model_dump()}
+                for item in media
+            ]
+            event_rows = [
+                {
+                    "id": uuid7(),
+                    "event_type": "create",
+                    "entity_type": "media",
+                    "entity_id": row["id"],
+                    "description": f"Created media: {row['filename']}",
+                }
+                for row in media_rows
+            ]
+
+            if len(media_rows) >= BULK_COPY_THRESHOLD:
+                bulk_insert_with_copy(db, "media", media_rows, MEDIA_COPY_COLUMNS)
+                bulk_insert_with_copy(db, "events", event_rows, EVENT_COPY_COLUMNS)
+            else:
+                db.bulk_insert_mappings(Media, media_rows)
+                db.bulk_insert_mappings(Event, event_rows)
+            db.commit()
+
+        WRITE_OPS['create_media_bulk'].inc()
+
+        return MediaBulkResponse(created=len(media_rows), ids=[row["id"] for row in media_rows])
+    except Exception as e:
+        db.rollback()
+        ERRORS['create_media_bulk_failed'].inc()
+        logger.exception("create_media_bulk failed")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @app.get("/api/v1/media", response_model=List[MediaResponse])
-async def list_media(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """List all media entries"""
-    start_time = time.time()
+def list_media(
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[uuid.UUID] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+):
+    """List media entries, newest first.
+
+    Keyset pagination: pass the created_at and id of the last row of the
+    previous page as after_created_at / after_id to fetch the next page.
+    """
     try:
-        media = db.query(Media).offset(skip).limit(limit).all()
-        registry_read_operations.labels(operation='list_media').inc()
-        registry_read_latency.observe((time.time() - start_time) * 1000)
-        return media
+        with timed(registry_read_latency):
+            stmt = select(*Media.__table__.c)
+            if after_created_at is not None:
+                if after_id is not None:
+                    stmt = stmt.where(tuple_(Media.created_at, Media.id) < (after_created_at, after_id))
+                else:
+                    stmt = stmt.where(Media.created_at < after_created_at)
+            stmt = stmt.order_by(Media.created_at.desc(), Media.id.desc()).limit(limit)
+            # Server-side cursor: rows are fetched and serialized in chunks
+            # rather than materialising the whole page first
+            rows = db.execute(stmt.execution_options(yield_per=LIST_STREAM_CHUNK))
+        READ_OPS['list_media'].inc()
+        return stream_json_list(
+            MediaResponse, rows, "list_media", ERRORS['list_media_stream_failed']
+        )
     except Exception as e:
-        registry_errors.labels(error_type='list_media_failed').inc()
+        ERRORS['list_media_failed'].inc()
         logger.exception("list_media failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# get_media bodies cached per process; create_transcript evicts the entry
+# when it changes the media's status.
+MEDIA_CACHE_TTL = 5.0
+MEDIA_CACHE_MAX = 10_000
+media_cache = ResponseCache(MEDIA_CACHE_TTL, MEDIA_CACHE_MAX)
+
+
+# Built once: repeat lookups skip statement construction and go straight to
+# the engine's compiled cache
+GET_MEDIA_STMT = select(*Media.__table__.c).where(Media.id == bindparam("id"))
+
+
 @app.get("/api/v1/media/{media_id}", response_model=MediaResponse)
-async def get_media(media_id: uuid.UUID, db: Session = Depends(get_db)):
+def get_media(media_id: uuid.UUID, db: Session = Depends(get_db)):
     """Get a specific media entry"""
-    start_time = time.time()
+    cached = media_cache.get(media_id)
+    if cached is not None:
+        READ_OPS['get_media'].inc()
+        return Response(cached, media_type="application/json")
     try:
-        media = db.query(Media).filter(Media.id == media_id).first()
-        if not media:
-            raise HTTPException(status_code=404, detail="Media not found")
-        registry_read_operations.labels(operation='get_media').inc()
-        registry_read_latency.observe((time.time() - start_time) * 1000)
-        return media
+        with timed(registry_read_latency):
+            media = db.execute(GET_MEDIA_STMT, {"id": media_id}).one_or_none()
+            if media is None:
+                raise HTTPException(status_code=404, detail="Media not found")
+            body = construct(MediaResponse, media).model_dump_json().encode()
+        media_cache.put(media_id, body)
+        READ_OPS['get_media'].inc()
+        return Response(body, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
-        registry_errors.labels(error_type='get_media_failed').inc()
+        ERRORS['get_media_failed'].inc()
         logger.exception("get_media failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -446,73 +612,80 @@ async def get_media(media_id: uuid.UUID, db: Session = Depends(get_db)):
 # Transcript Endpoints
 # ============================================================================
 @app.post("/api/v1/transcripts", response_model=TranscriptResponse, status_code=status.HTTP_201_CREATED)
-async def create_transcript(transcript: TranscriptCreate, db: Session = Depends(get_db)):
+def create_transcript(transcript: TranscriptCreate, db: Session = Depends(get_db)):
     """Create a new transcript"""
-    start_time = time.time()
     try:
-        # Verify media exists
-        media = db.query(Media).filter(Media.id == transcript.media_id).first()
-        if not media:
-            raise HTTPException(status_code=404, detail="Media not found")
-
-        db_transcript = Transcript(**transcript.model_dump())
-        db.add(db_transcript)
-
-        # Update media status
-        media.status = "completed"
-
-        db.commit()
-        db.refresh(db_transcript)
-
-        # Log event
-        db_event = Event(
-            event_type="transcribe",
-            entity_type="transcript",
-            entity_id=db_transcript.id,
-            description=f"Transcribed media {transcript.media_id}"
-        )
-        db.add(db_event)
-        db.commit()
+        with timed(registry_write_latency):
+            # Mark the media completed and verify it exists in one round trip
+            media_id = db.execute(
+                update(Media)
+                .where(Media.id == transcript.media_id)
+                .values(status="completed")
+                .returning(Media.id)
+            ).scalar_one_or_none()
+            if media_id is None:
+                raise HTTPException(status_code=404, detail="Media not found")
+
+            db_transcript = db.execute(
+                insert(Transcript).values(**transcript.model_dump()).returning(*Transcript.__table__.c)
+            ).one()
+            db.commit()
+            # After commit, so later reads fetch the new status
+            media_cache.evict(media_id)
+
+            # Log event (written in the background)
+            enqueue_event(
+                "transcribe",
+                "transcript",
+                db_transcript.id,
+                description=f"Transcribed media {transcript.media_id}"
+            )
 
-        registry_write_operations.labels(operation='create_transcript').inc()
-        registry_write_latency.observe((time.time() - start_time) * 1000)
+        WRITE_OPS['create_transcript'].inc()
 
-        return db_transcript
+        return json_row(TranscriptResponse, db_transcript, status.HTTP_201_CREATED)
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type='create_transcript_failed').inc()
+        ERRORS['create_transcript_failed'].inc()
         logger.exception("create_transcript failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/api/v1/transcripts", response_model=List[TranscriptResponse])
-async def list_transcripts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def list_transcripts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """List all transcripts"""
-    start_time = time.time()
     try:
-        transcripts = db.query(Transcript).offset(skip).limit(limit).all()
-        registry_read_operations.labels(operation='list_transcripts').inc()
-        registry_read_latency.observe((time.time() - start_time) * 1000)
-        return transcripts
+        with timed(registry_read_latency):
+            rows = db.execute(
+                select(*Transcript.__table__.c)
+                .offset(skip)
+                .limit(limit)
+                .execution_options(yield_per=LIST_STREAM_CHUNK)
+            )
+        READ_OPS['list_transcripts'].inc()
+        return stream_json_list(
+            TranscriptResponse, rows, "list_transcripts", ERRORS['list_transcripts_stream_failed']
+        )
     except Exception as e:
-        registry_errors.labels(error_type='list_transcripts_failed').inc()
+        ERRORS['list_transcripts_failed'].inc()
         logger.exception("list_transcripts failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/api/v1/transcripts/media/{media_id}", response_model=List[TranscriptResponse])
-async def get_transcripts_by_media(media_id: uuid.UUID, db: Session = Depends(get_db)):
+def get_transcripts_by_media(media_id: uuid.UUID, db: Session = Depends(get_db)):
     """Get all transcripts for a specific media"""
-    start_time = time.time()
     try:
-        transcripts = db.query(Transcript).filter(Transcript.media_id == media_id).all()
-        registry_read_operations.labels(operation='get_transcripts_by_media').inc()
-        registry_read_latency.observe((time.time() - start_time) * 1000)
-        return transcripts
+        with timed(registry_read_latency):
+            transcripts = db.execute(
+                select(*Transcript.__table__.c).where(Transcript.media_id == media_id)
+            ).all()
+        READ_OPS['get_transcripts_by_media'].inc()
+        return Response(json_list(TranscriptResponse, transcripts), media_type="application/json")
     except Exception as e:
-        registry_errors.labels(error_type='get_transcripts_by_media_failed').inc()
+        ERRORS['get_transcripts_by_media_failed'].inc()
         logger.exception("get_transcripts_by_media failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -521,37 +694,71 @@ async def get_transcripts_by_media(media_id: uuid.UUID, db: Session = Depends(ge
 # Segment Endpoints
 # ============================================================================
 @app.post("/api/v1/segments", response_model=SegmentResponse, status_code=status.HTTP_201_CREATED)
-async def create_segment(segment: SegmentCreate, db: Session = Depends(get_db)):
+def create_segment(segment: SegmentCreate, db: Session = Depends(get_db)):
     """Create a new segment"""
-    start_time = time.time()
     try:
-        db_segment = Segment(**segment.model_dump())
-        db.add(db_segment)
-        db.commit()
-        db.refresh(db_segment)
+        with timed(registry_write_latency):
+            db_segment = db.execute(
+                insert(Segment).values(**segment.model_dump()).returning(*Segment.__table__.c)
+            ).one()
+            db.commit()
 
-        registry_write_operations.labels(operation='create_segment').inc()
-        registry_write_latency.observe((time.time() - start_time) * 1000)
+        WRITE_OPS['create_segment'].inc()
 
-        return db_segment
+        return json_row(SegmentResponse, db_segment, status.HTTP_201_CREATED)
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type='create_segment_failed').inc()
+        ERRORS['create_segment_failed'].inc()
         logger.exception("create_segment failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+SEGMENT_COPY_COLUMNS = [
+    "id", "transcript_id", "segment_index", "start_time_seconds", "end_time_seconds",
+    "text", "confidence_score", "speaker_id", "meta_data",
+]
+
+
+@app.post("/api/v1/segments/bulk", response_model=SegmentBulkResponse, status_code=status.HTTP_201_CREATED)
+def create_segments_bulk(segments: List[SegmentCreate], db: Session = Depends(get_db)):
+    """Create many segments in one transaction"""
+    try:
+        with timed(registry_write_latency):
+            segment_rows = [{"id": uuid7(), **item.model_dump()} for item in segments]
+
+            if len(segment_rows) >= BULK_COPY_THRESHOLD:
+                bulk_insert_with_copy(db, "segments", segment_rows, SEGMENT_COPY_COLUMNS)
+            else:
+                db.bulk_insert_mappings(Segment, segment_rows)
+            db.commit()
+
+        WRITE_OPS['create_segments_bulk'].inc()
+
+        return SegmentBulkResponse(created=len(segment_rows), ids=[row["id"] for row in segment_rows])
+    except Exception as e:
+        db.rollback()
+        ERRORS['create_segments_bulk_failed'].inc()
+        logger.exception("create_segments_bulk failed")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @app.get("/api/v1/segments/transcript/{transcript_id}", response_model=List[SegmentResponse])
-async def get_segments_by_transcript(transcript_id: uuid.UUID, db: Session = Depends(get_db)):
+def get_segments_by_transcript(transcript_id: uuid.UUID, db: Session = Depends(get_db)):
     """Get all segments for a specific transcript"""
-    start_time = time.time()
     try:
-        segments = db.query(Segment).filter(Segment.transcript_id == transcript_id).order_by(Segment.segment_index).all()
-        registry_read_operations.labels(operation='get_segments_by_transcript').inc()
-        registry_read_latency.observe((time.time() - start_time) * 1000)
-        return segments
+        with timed(registry_read_latency):
+            rows = db.execute(
+                select(*Segment.__table__.c)
+                .where(Segment.transcript_id == transcript_id)
+                .order_by(Segment.segment_index)
+                .execution_options(yield_per=LIST_STREAM_CHUNK)
+            )
+        READ_OPS['get_segments_by_transcript'].inc()
+        return stream_json_list(
+            SegmentResponse, rows, "get_segments_by_transcript", ERRORS['get_segments_by_transcript_stream_failed']
+        )
     except Exception as e:
-        registry_errors.labels(error_type='get_segments_by_transcript_failed').inc()
+        ERRORS['get_segments_by_transcript_failed'].inc()
         logger.exception("get_segments_by_transcript failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -560,37 +767,56 @@ async def get_segments_by_transcript(transcript_id: uuid.UUID, db: Session = Dep
 # Event Endpoints
 # ============================================================================
 @app.post("/api/v1/events", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
-async def create_event(event: EventCreate, db: Session = Depends(get_db)):
+def create_event(event: EventCreate, db: Session = Depends(get_db)):
     """Create a new event"""
-    start_time = time.time()
     try:
-        db_event = Event(**event.model_dump())
-        db.add(db_event)
-        db.commit()
-        db.refresh(db_event)
+        with timed(registry_write_latency):
+            db_event = db.execute(
+                insert(Event).values(**event.model_dump()).returning(*Event.__table__.c)
+            ).one()
+            db.commit()
 
-        registry_write_operations.labels(operation='create_event').inc()
-        registry_write_latency.observe((time.time() - start_time) * 1000)
+        WRITE_OPS['create_event'].inc()
 
-        return db_event
+        return json_row(EventResponse, db_event, status.HTTP_201_CREATED)
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type='create_event_failed').inc()
+        ERRORS['create_event_failed'].inc()
         logger.exception("create_event failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/api/v1/events", response_model=List[EventResponse])
-async def list_events(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """List all events"""
-    start_time = time.time()
+def list_events(
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[uuid.UUID] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+):
+    """List events, newest first.
+
+    Keyset pagination: pass the created_at and id of the last row of the
+    previous page as after_created_at / after_id to fetch the next page.
+    """
     try:
-        events = db.query(Event).order_by(Event.created_at.desc()).offset(skip).limit(limit).all()
-        registry_read_operations.labels(operation='list_events').inc()
-        registry_read_latency.observe((time.time() - start_time) * 1000)
-        return events
+        with timed(registry_read_latency):
+            stmt = select(*Event.__table__.c)
+            if after_created_at is not None:
+                if after_id is not None:
+                    stmt = stmt.where(tuple_(Event.created_at, Event.id) < (after_created_at, after_id))
+                else:
+                    stmt = stmt.where(Event.created_at < after_created_at)
+            rows = db.execute(
+                stmt.order_by(Event.created_at.desc(), Event.id.desc())
+                .limit(limit)
+                .execution_options(yield_per=LIST_STREAM_CHUNK)
+            )
+        READ_OPS['list_events'].inc()
+        return stream_json_list(
+            EventResponse, rows, "list_events", ERRORS['list_events_stream_failed']
+        )
     except Exception as e:
-        registry_errors.labels(error_type='list_events_failed').inc()
+        ERRORS['list_events_failed'].inc()
         logger.exception("list_events failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -6,7 +6,6 @@ Routes:
   POST   /api/bug-fixes/search       full-text search across bug fixes
   DELETE /api/bug-fixes/{item_id}    delete a bug fix record
 """
-import time
 import logging
 from typing import Optional
 from uuid import UUID
@@ -33,11 +32,38 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/bug-fixes", tags=["bug-fixes"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_bug_fixes",
+        "search_bug_fixes",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_bug_fix",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_bug_fix_failed",
+        "list_bug_fixes_failed",
+        "search_bug_fixes_failed",
+        "delete_bug_fix_failed",
+    )
+}
+
 
 @router.post("", response_model=BugFixResponse, status_code=status.HTTP_201_CREATED)
 async def create_bug_fix(
@@ -45,7 +71,6 @@ async def create_bug_fix(
     response: Response,
     db: Session = Depends(get_db),
 ) -> BugFixResponse:
-    start = time.time()
     if payload.severity not in VALID_SEVERITIES:
         raise HTTPException(
             status_code=422,
@@ -57,27 +82,26 @@ async def create_bug_fix(
             detail=f"Invalid category '{payload.category}'. Valid: {sorted(VALID_CATEGORIES)}",
         )
     try:
-        embedding = None
-        try:
-            from embedding_utils import get_embedding
-            text_for_embed = f"{payload.tldr} {payload.symptom} {payload.root_cause} {payload.fix_applied}"
-            embedding = await get_embedding(text_for_embed)
-        except Exception as embed_err:
-            logger.warning("Bug fix embedding failed: %s", embed_err)
-
-        row, created = svc.upsert_bug_fix(db, payload, embedding)
-
-        if not created:
-            response.status_code = status.HTTP_200_OK
-
-        registry_write_operations.labels(operation="create_bug_fix").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            embedding = None
+            try:
+                from embedding_utils import get_embedding
+                text_for_embed = f"{payload.tldr} {payload.symptom} {payload.root_cause} {payload.fix_applied}"
+                embedding = await get_embedding(text_for_embed)
+            except Exception as embed_err:
+                logger.warning("Bug fix embedding failed: %s", embed_err)
+
+            row, created = svc.upsert_bug_fix(db, payload, embedding)
+
+            if not created:
+                response.status_code = status.HTTP_200_OK
+        WRITE_OPS['create_bug_fix'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_bug_fix_failed").inc()
+        ERRORS['create_bug_fix_failed'].inc()
         logger.error("%s failed: %s", "bug_fixes_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -91,18 +115,16 @@ async def list_bug_fixes(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ) -> BugFixList:
-    start = time.time()
     try:
-        rows, total = svc.list_bug_fixes(
-            db, project_name=project_name, category=category,
-            severity=severity, limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_bug_fixes").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_bug_fixes(
+                db, project_name=project_name, category=category,
+                severity=severity, limit=limit, offset=offset,
+            )
+        READ_OPS['list_bug_fixes'].inc()
         return BugFixList(bug_fixes=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="list_bug_fixes_failed").inc()
+        ERRORS['list_bug_fixes_failed'].inc()
         logger.error("%s failed: %s", "bug_fixes_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -112,19 +134,17 @@ async def search_bug_fixes(
     body: BugFixSearch,
     db: Session = Depends(get_db),
 ) -> BugFixList:
-    start = time.time()
     try:
-        rows, total = svc.search_bug_fixes(
-            db, body.query,
-            project_name=body.project_name, category=body.category,
-            severity=body.severity, limit=body.limit,
-        )
-
-        registry_read_operations.labels(operation="search_bug_fixes").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.search_bug_fixes(
+                db, body.query,
+                project_name=body.project_name, category=body.category,
+                severity=body.severity, limit=body.limit,
+            )
+        READ_OPS['search_bug_fixes'].inc()
         return BugFixList(bug_fixes=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="search_bug_fixes_failed").inc()
+        ERRORS['search_bug_fixes_failed'].inc()
         logger.error("%s failed: %s", "bug_fixes_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -142,6 +162,6 @@ async def delete_bug_fix(
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="delete_bug_fix_failed").inc()
+        ERRORS['delete_bug_fix_failed'].inc()
         logger.error("delete_bug_fix failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
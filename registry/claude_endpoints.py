@@ -2,24 +2,45 @@
 Claude AI Data Endpoints
 Handles Claude projects, conversations, messages, and artifacts
 """
-import time
 import logging
 from typing import List, Optional, Union
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, UUID4
 
 from database import get_db
 import claude_service as svc
+from json_rows import list_adapter, stream_json_list
+from response_cache import ResponseCache
 
-from metrics import registry_read_latency, registry_read_operations, registry_errors
+from metrics import registry_read_latency, registry_read_operations, registry_errors, timed
 
 logger = logging.getLogger(__name__)
 
 
 router = APIRouter(prefix="/api/v1", tags=["claude"])
 
+# Label children bound once instead of hashing labels on every request
+_OPERATIONS = (
+    "list_projects",
+    "get_project",
+    "list_conversations",
+    "get_conversation",
+    "search_conversations",
+    "list_messages",
+    "list_artifacts",
+    "list_artifacts_by_conversation",
+    "get_artifact",
+)
+READ_OPS = {op: registry_read_operations.labels(operation=op) for op in _OPERATIONS}
+ERRORS = {op: registry_errors.labels(error_type=op) for op in _OPERATIONS}
+STREAM_ERRORS = {
+    op: registry_errors.labels(error_type=f"{op}_stream_failed")
+    for op in ("list_messages", "list_artifacts", "list_artifacts_by_conversation")
+}
+
 
 # =============================================================================
 # PYDANTIC MODELS
@@ -85,13 +106,32 @@ class ArtifactResponse(BaseModel):
         from_attributes = True
 
 
+# Responses are built from our own rows, so they are constructed without
+# validation and dumped here rather than revalidated against response_model.
+def _construct(model, obj, **extra):
+    fields = {name: getattr(obj, name) for name in model.model_fields if name not in extra}
+    return model.model_construct(**fields, **extra)
+
+
+# Single-item bodies keyed by (kind, id). Nothing here writes these rows; the
+# ingest scripts do, so changes (e.g. new message counts) show after the TTL.
+ITEM_CACHE_TTL = 30.0
+ITEM_CACHE_MAX = 10_000
+item_cache = ResponseCache(ITEM_CACHE_TTL, ITEM_CACHE_MAX)
+
+
+def _cached_json(key, item: BaseModel) -> Response:
+    body = item.model_dump_json().encode()
+    item_cache.put(key, body)
+    return Response(body, media_type="application/json")
+
+
+def _json_list(model, items) -> Response:
+    return Response(list_adapter(model).dump_json(items), media_type="application/json")
+
+
 def _conv_response(conv, msg_count: int, art_count: int) -> ConversationResponse:
-    return ConversationResponse(
-        id=conv.id, title=conv.title, conversation_id=conv.conversation_id,
-        export_source=conv.export_source, model_name=conv.model_name,
-        project_id=conv.project_id, created_at=conv.created_at,
-        updated_at=conv.updated_at, message_count=msg_count, artifact_count=art_count,
-    )
+    return _construct(ConversationResponse, conv, message_count=msg_count, artifact_count=art_count)
 
 
 # =============================================================================
@@ -99,51 +139,47 @@ def _conv_response(conv, msg_count: int, art_count: int) -> ConversationResponse
 # =============================================================================
 
 @router.get("/projects", response_model=List[ProjectResponse])
-async def list_projects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def list_projects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """List all Claude projects"""
-    start = time.time()
     try:
-        rows = svc.list_projects(db, skip=skip, limit=limit)
-        result = []
-        for project, conv_count in rows:
-            result.append(ProjectResponse(
-                id=project.id, name=project.name, project_id=project.project_id,
-                description=project.description, custom_instructions=project.custom_instructions,
-                knowledge_files=project.knowledge_files, created_at=project.created_at,
-                updated_at=project.updated_at, conversation_count=conv_count,
-            ))
-
-        registry_read_latency.observe((time.time() - start) * 1000)
-        registry_read_operations.labels(operation="list_projects").inc()
-        return result
+        with timed(registry_read_latency):
+            rows = svc.list_projects(db, skip=skip, limit=limit)
+            result = [
+                _construct(ProjectResponse, project, conversation_count=conv_count)
+                for project, conv_count in rows
+            ]
+
+        READ_OPS['list_projects'].inc()
+        return _json_list(ProjectResponse, result)
     except Exception as e:
-        registry_errors.labels(error_type="list_projects").inc()
+        ERRORS['list_projects'].inc()
         logger.exception("list_projects failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/projects/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: UUID4, db: Session = Depends(get_db)):
+def get_project(project_id: UUID4, db: Session = Depends(get_db)):
     """Get a specific Claude project"""
-    start = time.time()
+    cached = item_cache.get(("project", project_id))
+    if cached is not None:
+        READ_OPS['get_project'].inc()
+        return Response(cached, media_type="application/json")
     try:
-        result = svc.get_project(db, project_id)
-        if not result:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        project, conv_count = result
-        registry_read_latency.observe((time.time() - start) * 1000)
-        registry_read_operations.labels(operation="get_project").inc()
-        return ProjectResponse(
-            id=project.id, name=project.name, project_id=project.project_id,
-            description=project.description, custom_instructions=project.custom_instructions,
-            knowledge_files=project.knowledge_files, created_at=project.created_at,
-            updated_at=project.updated_at, conversation_count=conv_count,
+        with timed(registry_read_latency):
+            result = svc.get_project(db, project_id)
+            if not result:
+                raise HTTPException(status_code=404, detail="Project not found")
+
+            project, conv_count = result
+        READ_OPS['get_project'].inc()
+        return _cached_json(
+            ("project", project_id),
+            _construct(ProjectResponse, project, conversation_count=conv_count),
         )
     except HTTPException:
         raise
     except Exception as e:
-        registry_errors.labels(error_type="get_project").inc()
+        ERRORS['get_project'].inc()
         logger.exception("get_project failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -153,7 +189,7 @@ async def get_project(project_id: UUID4, db: Session = Depends(get_db)):
 # =============================================================================
 
 @router.get("/conversations", response_model=List[ConversationResponse])
-async def list_conversations(
+def list_conversations(
     skip: int = 0,
     limit: int = 100,
     project_id: Optional[UUID4] = None,
@@ -161,81 +197,83 @@ async def list_conversations(
     db: Session = Depends(get_db)
 ):
     """List Claude conversations with optional filtering"""
-    start = time.time()
     try:
-        rows = svc.list_conversations(
-            db, project_id=project_id, export_source=export_source,
-            skip=skip, limit=limit,
-        )
-        result = [_conv_response(conv, msg_count, art_count) for conv, msg_count, art_count in rows]
-
-        registry_read_latency.observe((time.time() - start) * 1000)
-        registry_read_operations.labels(operation="list_conversations").inc()
-        return result
+        with timed(registry_read_latency):
+            rows = svc.list_conversations(
+                db, project_id=project_id, export_source=export_source,
+                skip=skip, limit=limit,
+            )
+            result = [_conv_response(conv, msg_count, art_count) for conv, msg_count, art_count in rows]
+
+        READ_OPS['list_conversations'].inc()
+        return _json_list(ConversationResponse, result)
     except Exception as e:
-        registry_errors.labels(error_type="list_conversations").inc()
+        ERRORS['list_conversations'].inc()
         logger.exception("list_conversations failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/conversations/{conversation_id}", response_model=ConversationResponse)
-async def get_conversation(conversation_id: UUID4, db: Session = Depends(get_db)):
-    """Get a specific Claude conversation"""
-    start = time.time()
-    try:
-        result = svc.get_conversation(db, conversation_id)
-        if not result:
-            raise HTTPException(status_code=404, detail="Conversation not found")
-
-        conv, msg_count, art_count = result
-        registry_read_latency.observe((time.time() - start) * 1000)
-        registry_read_operations.labels(operation="get_conversation").inc()
-        return _conv_response(conv, msg_count, art_count)
-    except HTTPException:
-        raise
-    except Exception as e:
-        registry_errors.labels(error_type="get_conversation").inc()
-        logger.exception("get_conversation failed")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
 @router.get("/conversations/search")
-async def search_conversations(
+def search_conversations(
     q: str,
     skip: int = 0,
     limit: int = 50,
     db: Session = Depends(get_db)
 ):
     """Search Claude conversations by title or content"""
-    start = time.time()
     try:
-        rows = svc.search_conversations(db, q, skip=skip, limit=limit)
-        result = [_conv_response(conv, msg_count, art_count) for conv, msg_count, art_count in rows]
+        with timed(registry_read_latency):
+            rows = svc.search_conversations(db, q, skip=skip, limit=limit)
+            result = [_conv_response(conv, msg_count, art_count) for conv, msg_count, art_count in rows]
 
-        registry_read_latency.observe((time.time() - start) * 1000)
-        registry_read_operations.labels(operation="search_conversations").inc()
-        return result
+        READ_OPS['search_conversations'].inc()
+        return _json_list(ConversationResponse, result)
     except Exception as e:
-        registry_errors.labels(error_type="search_conversations").inc()
+        ERRORS['search_conversations'].inc()
         logger.exception("search_conversations failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/conversations/{conversation_id}", response_model=ConversationResponse)
+def get_conversation(conversation_id: UUID4, db: Session = Depends(get_db)):
+    """Get a specific Claude conversation"""
+    cached = item_cache.get(("conversation", conversation_id))
+    if cached is not None:
+        READ_OPS['get_conversation'].inc()
+        return Response(cached, media_type="application/json")
+    try:
+        with timed(registry_read_latency):
+            result = svc.get_conversation(db, conversation_id)
+            if not result:
+                raise HTTPException(status_code=404, detail="Conversation not found")
+
+            conv, msg_count, art_count = result
+        READ_OPS['get_conversation'].inc()
+        return _cached_json(("conversation", conversation_id), _conv_response(conv, msg_count, art_count))
+    except HTTPException:
+        raise
+    except Exception as e:
+        ERRORS['get_conversation'].inc()
+        logger.exception("get_conversation failed")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 # =============================================================================
 # MESSAGE ENDPOINTS
 # =============================================================================
 
 @router.get("/messages/conversation/{conversation_id}", response_model=List[MessageResponse])
-async def list_messages(conversation_id: UUID4, db: Session = Depends(get_db)):
+def list_messages(conversation_id: UUID4, db: Session = Depends(get_db)):
     """List messages for a Claude conversation"""
-    start = time.time()
     try:
-        messages = svc.list_messages(db, conversation_id)
-        registry_read_latency.observe((time.time() - start) * 1000)
-        registry_read_operations.labels(operation="list_messages").inc()
-        return messages
+        with timed(registry_read_latency):
+            rows = svc.list_messages(db, conversation_id)
+        READ_OPS['list_messages'].inc()
+        return stream_json_list(
+            MessageResponse, rows, "list_messages", STREAM_ERRORS['list_messages']
+        )
     except Exception as e:
-        registry_errors.labels(error_type="list_messages").inc()
+        ERRORS['list_messages'].inc()
         logger.exception("list_messages failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -245,54 +283,59 @@ async def list_messages(conversation_id: UUID4, db: Session = Depends(get_db)):
 # =============================================================================
 
 @router.get("/artifacts", response_model=List[ArtifactResponse])
-async def list_artifacts(
+def list_artifacts(
     skip: int = 0,
     limit: int = 100,
     artifact_type: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """List Claude artifacts with optional filtering"""
-    start = time.time()
     try:
-        artifacts = svc.list_artifacts(db, artifact_type=artifact_type, skip=skip, limit=limit)
-        registry_read_latency.observe((time.time() - start) * 1000)
-        registry_read_operations.labels(operation="list_artifacts").inc()
-        return artifacts
+        with timed(registry_read_latency):
+            rows = svc.list_artifacts(db, artifact_type=artifact_type, skip=skip, limit=limit)
+        READ_OPS['list_artifacts'].inc()
+        return stream_json_list(
+            ArtifactResponse, rows, "list_artifacts", STREAM_ERRORS['list_artifacts']
+        )
     except Exception as e:
-        registry_errors.labels(error_type="list_artifacts").inc()
+        ERRORS['list_artifacts'].inc()
         logger.exception("list_artifacts failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/artifacts/conversation/{conversation_id}", response_model=List[ArtifactResponse])
-async def list_artifacts_by_conversation(conversation_id: UUID4, db: Session = Depends(get_db)):
+def list_artifacts_by_conversation(conversation_id: UUID4, db: Session = Depends(get_db)):
     """List artifacts for a specific Claude conversation"""
-    start = time.time()
     try:
-        artifacts = svc.list_artifacts_by_conversation(db, conversation_id)
-        registry_read_latency.observe((time.time() - start) * 1000)
-        registry_read_operations.labels(operation="list_artifacts_by_conversation").inc()
-        return artifacts
+        with timed(registry_read_latency):
+            rows = svc.list_artifacts_by_conversation(db, conversation_id)
+        READ_OPS['list_artifacts_by_conversation'].inc()
+        return stream_json_list(
+            ArtifactResponse, rows, "list_artifacts_by_conversation", STREAM_ERRORS['list_artifacts_by_conversation']
+        )
     except Exception as e:
-        registry_errors.labels(error_type="list_artifacts_by_conversation").inc()
+        ERRORS['list_artifacts_by_conversation'].inc()
         logger.exception("list_artifacts_by_conversation failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/artifacts/{artifact_id}", response_model=ArtifactResponse)
-async def get_artifact(artifact_id: UUID4, db: Session = Depends(get_db)):
+def get_artifact(artifact_id: UUID4, db: Session = Depends(get_db)):
     """Get a specific Claude artifact"""
-    start = time.time()
+    cached = item_cache.get(("artifact", artifact_id))
+    if cached is not None:
+        READ_OPS['get_artifact'].inc()
+        return Response(cached, media_type="application/json")
     try:
-        artifact = svc.get_artifact(db, artifact_id)
-        if not artifact:
-            raise HTTPException(status_code=404, detail="Artifact not found")
-        registry_read_latency.observe((time.time() - start) * 1000)
-        registry_read_operations.labels(operation="get_artifact").inc()
-        return artifact
+        with timed(registry_read_latency):
+            artifact = svc.get_artifact(db, artifact_id)
+            if not artifact:
+                raise HTTPException(status_code=404, detail="Artifact not found")
+        READ_OPS['get_artifact'].inc()
+        return _cached_json(("artifact", artifact_id), _construct(ArtifactResponse, artifact))
     except HTTPException:
         raise
     except Exception as e:
-        registry_errors.labels(error_type="get_artifact").inc()
+        ERRORS['get_artifact'].inc()
         logger.exception("get_artifact failed")
         raise HTTPException(status_code=500, detail="Internal server error")
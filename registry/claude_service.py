@@ -3,20 +3,42 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.engine import Result, Row
 from sqlalchemy.orm import Session
 
+from json_rows import LIST_STREAM_CHUNK
 from models import Project, Conversation, Message, Artifact
 
 
+# Correlated per-row counts: one statement per listing, and LIMIT/OFFSET
+# apply to the parent rows instead of a joined-and-grouped product.
+_conversation_count = (
+    select(func.count(Conversation.id))
+    .where(Conversation.project_id == Project.id)
+    .correlate(Project)
+    .scalar_subquery()
+)
+_message_count = (
+    select(func.count(Message.id))
+    .where(Message.conversation_id == Conversation.id)
+    .correlate(Conversation)
+    .scalar_subquery()
+)
+_artifact_count = (
+    select(func.count(Artifact.id))
+    .where(Artifact.conversation_id == Conversation.id)
+    .correlate(Conversation)
+    .scalar_subquery()
+)
+
+
 def list_projects(
     db: Session, *, skip: int = 0, limit: int = 100,
 ) -> list[tuple]:
     """Return list of (Project, conversation_count) tuples."""
     return (
-        db.query(Project, func.count(Conversation.id))
-        .outerjoin(Conversation, Conversation.project_id == Project.id)
-        .group_by(Project.id)
+        db.query(Project, _conversation_count)
         .offset(skip)
         .limit(limit)
         .all()
@@ -25,31 +47,16 @@ def list_projects(
 
 def get_project(db: Session, project_id: UUID) -> tuple | None:
     """Return (Project, conversation_count) or None."""
-    result = (
-        db.query(Project, func.count(Conversation.id))
-        .outerjoin(Conversation, Conversation.project_id == Project.id)
+    return (
+        db.query(Project, _conversation_count)
         .filter(Project.id == project_id)
-        .group_by(Project.id)
         .first()
     )
-    return result
 
 
 def _conversations_with_counts(query):
-    """Subquery-based conversation listing with message + artifact counts."""
-    msg_counts = (
-        func.count(Message.id).label("msg_count")
-    )
-    art_counts = (
-        func.count(Artifact.id).label("art_count")
-    )
-    return (
-        query
-        .outerjoin(Message, Message.conversation_id == Conversation.id)
-        .outerjoin(Artifact, Artifact.conversation_id == Conversation.id)
-        .group_by(Conversation.id)
-        .with_entities(Conversation, msg_counts, art_counts)
-    )
+    """Add message + artifact counts to a Conversation query."""
+    return query.add_columns(_message_count, _artifact_count)
 
 
 def list_conversations(
@@ -77,13 +84,19 @@ def get_conversation(db: Session, conversation_id: UUID) -> tuple | None:
     return _conversations_with_counts(query).first()
 
 
+def _contains_pattern(q: str) -> str:
+    """LIKE pattern matching q literally anywhere (escape character: backslash)."""
+    # Unescaped, a bare % or _ would match every title
+    return "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
 def search_conversations(
     db: Session, q: str, *, skip: int = 0, limit: int = 50,
 ) -> list[tuple]:
     """Search conversations by title. Returns list of (Conversation, msg_count, art_count)."""
     query = (
         db.query(Conversation)
-        .filter(Conversation.title.ilike(f"%{q}%"))
+        .filter(Conversation.title.ilike(_contains_pattern(q), escape="\\"))
         .order_by(Conversation.created_at.desc())
         .offset(skip)
         .limit(limit)
@@ -91,12 +104,15 @@ def search_conversations(
     return _conversations_with_counts(query).all()
 
 
-def list_messages(db: Session, conversation_id: UUID) -> list[Message]:
-    return (
-        db.query(Message)
-        .filter(Message.conversation_id == conversation_id)
+# Listings below return yield_per Core results (plain column rows, no ORM
+# instances) for the endpoints to stream.
+
+def list_messages(db: Session, conversation_id: UUID) -> Result:
+    return db.execute(
+        select(*Message.__table__.c)
+        .where(Message.conversation_id == conversation_id)
         .order_by(Message.message_index)
-        .all()
+        .execution_options(yield_per=LIST_STREAM_CHUNK)
     )
 
 
@@ -106,21 +122,29 @@ def list_artifacts(
     artifact_type: str | None = None,
     skip: int = 0,
     limit: int = 100,
-) -> list[Artifact]:
-    query = db.query(Artifact)
+) -> Result:
+    stmt = select(*Artifact.__table__.c)
     if artifact_type:
-        query = query.filter(Artifact.artifact_type == artifact_type)
-    return query.order_by(Artifact.created_at.desc()).offset(skip).limit(limit).all()
+        stmt = stmt.where(Artifact.artifact_type == artifact_type)
+    return db.execute(
+        stmt.order_by(Artifact.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .execution_options(yield_per=LIST_STREAM_CHUNK)
+    )
 
 
-def list_artifacts_by_conversation(db: Session, conversation_id: UUID) -> list[Artifact]:
-    return (
-        db.query(Artifact)
-        .filter(Artifact.conversation_id == conversation_id)
+def list_artifacts_by_conversation(db: Session, conversation_id: UUID) -> Result:
+    return db.execute(
+        select(*Artifact.__table__.c)
+        .where(Artifact.conversation_id == conversation_id)
         .order_by(Artifact.created_at)
-        .all()
+        .execution_options(yield_per=LIST_STREAM_CHUNK)
     )
 
 
-def get_artifact(db: Session, artifact_id: UUID) -> Artifact | None:
-    return db.query(Artifact).filter(Artifact.id == artifact_id).first()
+_GET_ARTIFACT = select(*Artifact.__table__.c).where(Artifact.id == bindparam("id"))
+
+
+def get_artifact(db: Session, artifact_id: UUID) -> Row | None:
+    return db.execute(_GET_ARTIFACT, {"id": artifact_id}).one_or_none()
@@ -3,7 +3,6 @@ CME Grant Intake API Endpoints
 Handles CME project creation, pipeline execution, and status tracking
 Uses /api/v2/ prefix for CME-specific endpoints
 """
-import time
 import os
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -35,11 +34,54 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/cme", tags=["cme"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_cme_projects",
+        "get_cme_project",
+        "get_cme_pipeline_status",
+        "list_cme_pipeline_runs",
+        "cme_fulltext_search",
+        "cme_vector_search",
+        "cme_hybrid_search",
+        "cme_rag_context",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_cme_project",
+        "update_cme_project",
+        "start_cme_pipeline",
+        "cancel_cme_pipeline",
+        "rerun_cme_pipeline",
+        "create_source_reference",
+        "create_agent_output",
+        "create_document",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_cme_project",
+        "list_cme_projects",
+        "get_cme_project",
+        "update_cme_project",
+        "start_cme_pipeline",
+        "get_cme_pipeline_status",
+        "rerun_cme_pipeline",
+    )
+}
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -272,13 +314,11 @@ async def create_cme_project(
     Create a new CME project by submitting the 47-field intake form.
     This stores the project and prepares it for pipeline execution.
     """
-    start = time.time()
     try:
-        intake_dict = intake.model_dump(mode='json')
-        db_project = project_svc.create_project(db, intake.section_a.project_name, intake_dict)
-
-        registry_write_operations.labels(operation="create_cme_project").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            intake_dict = intake.model_dump(mode='json')
+            db_project = project_svc.create_project(db, intake.section_a.project_name, intake_dict)
+        WRITE_OPS['create_cme_project'].inc()
 
         return CMEProjectCreateResponse(
             project_id=str(db_project.id),
@@ -289,7 +329,7 @@ async def create_cme_project(
 
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_cme_project").inc()
+        ERRORS['create_cme_project'].inc()
         logger.exception("create_cme_project failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -302,39 +342,37 @@ async def list_cme_projects(
     db: Session = Depends(get_db)
 ):
     """List all CME projects with optional status filtering"""
-    start = time.time()
     try:
-        projects = project_svc.list_projects(
-            db,
-            status_filter=status.value if status else None,
-            skip=skip,
-            limit=limit,
-        )
-
-        result = [
-            CMEProjectDetail(
-                id=str(p.id),
-                name=p.name,
-                status=CMEProjectStatus(p.status),
-                current_agent=p.current_agent,
-                progress_percent=p.progress_percent or 0,
-                intake=p.intake,
-                intake_version=p.intake_version or 1,
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-                outputs_available=list(p.outputs.keys()) if p.outputs else [],
-                human_review_status=p.human_review_status
+        with timed(registry_read_latency):
+            projects = project_svc.list_projects(
+                db,
+                status_filter=status.value if status else None,
+                skip=skip,
+                limit=limit,
             )
-            for p in projects
-        ]
 
-        registry_read_operations.labels(operation="list_cme_projects").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+            result = [
+                CMEProjectDetail(
+                    id=str(p.id),
+                    name=p.name,
+                    status=CMEProjectStatus(p.status),
+                    current_agent=p.current_agent,
+                    progress_percent=p.progress_percent or 0,
+                    intake=p.intake,
+                    intake_version=p.intake_version or 1,
+                    created_at=p.created_at,
+                    updated_at=p.updated_at,
+                    outputs_available=list(p.outputs.keys()) if p.outputs else [],
+                    human_review_status=p.human_review_status
+                )
+                for p in projects
+            ]
+        READ_OPS['list_cme_projects'].inc()
 
         return result
 
     except Exception as e:
-        registry_errors.labels(error_type="list_cme_projects").inc()
+        ERRORS['list_cme_projects'].inc()
         logger.exception("list_cme_projects failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -342,14 +380,12 @@ async def list_cme_projects(
 @router.get("/projects/{project_id}", response_model=CMEProjectDetail)
 async def get_cme_project(project_id: str, db: Session = Depends(get_db)):
     """Get details for a specific CME project"""
-    start = time.time()
     try:
-        p = project_svc.get_project(db, project_id)
-        if not p:
-            raise HTTPException(status_code=404, detail="CME project not found")
-
-        registry_read_operations.labels(operation="get_cme_project").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            p = project_svc.get_project(db, project_id)
+            if not p:
+                raise HTTPException(status_code=404, detail="CME project not found")
+        READ_OPS['get_cme_project'].inc()
 
         return CMEProjectDetail(
             id=str(p.id),
@@ -368,7 +404,7 @@ async def get_cme_project(project_id: str, db: Session = Depends(get_db)):
     except HTTPException:
         raise
     except Exception as e:
-        registry_errors.labels(error_type="get_cme_project").inc()
+        ERRORS['get_cme_project'].inc()
         logger.exception("get_cme_project failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -387,26 +423,24 @@ async def update_cme_project(
     so the next /rerun starts from the new intake while existing run history
     keeps its intake_version_used snapshot.
     """
-    start = time.time()
     try:
-        project = project_svc.get_project(db, project_id)
-        if not project:
-            raise HTTPException(status_code=404, detail="CME project not found")
-
-        if project.status in ("processing", "archived"):
-            raise HTTPException(
-                status_code=409,
-                detail=f"Cannot edit: project status is '{project.status}'. Cancel the run or unarchive the project first.",
+        with timed(registry_write_latency):
+            project = project_svc.get_project(db, project_id)
+            if not project:
+                raise HTTPException(status_code=404, detail="CME project not found")
+
+            if project.status in ("processing", "archived"):
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Cannot edit: project status is '{project.status}'. Cancel the run or unarchive the project first.",
+                )
+
+            intake_dict = intake.model_dump(mode="json")
+            project = project_svc.update_project_intake(
+                db, project, intake.section_a.project_name, intake_dict,
+                extract_intake_fields_fn=sync_svc.extract_intake_fields,
             )
-
-        intake_dict = intake.model_dump(mode="json")
-        project = project_svc.update_project_intake(
-            db, project, intake.section_a.project_name, intake_dict,
-            extract_intake_fields_fn=sync_svc.extract_intake_fields,
-        )
-
-        registry_write_operations.labels(operation="update_cme_project").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        WRITE_OPS['update_cme_project'].inc()
 
         return CMEProjectDetail(
             id=str(project.id),
@@ -426,7 +460,7 @@ async def update_cme_project(
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="update_cme_project").inc()
+        ERRORS['update_cme_project'].inc()
         logger.exception("update_cme_project failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -456,23 +490,21 @@ async def start_cme_pipeline(
     db: Session = Depends(get_db)
 ):
     """Start the 12-agent LangGraph pipeline for a CME project"""
-    start = time.time()
     try:
-        project = project_svc.get_project(db, project_id)
-        if not project:
-            raise HTTPException(status_code=404, detail="CME project not found")
+        with timed(registry_write_latency):
+            project = project_svc.get_project(db, project_id)
+            if not project:
+                raise HTTPException(status_code=404, detail="CME project not found")
 
-        if project.status not in ["intake", "failed"]:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Cannot start pipeline: project status is {project.status}"
-            )
+            if project.status not in ["intake", "failed"]:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Cannot start pipeline: project status is {project.status}"
+                )
 
-        lg = await trigger_langgraph_pipeline(str(project.id), project.intake)
-        pipeline_svc.start_pipeline(db, project, lg["thread_id"], lg["run_id"])
-
-        registry_write_operations.labels(operation="start_cme_pipeline").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+            lg = await trigger_langgraph_pipeline(str(project.id), project.intake)
+            pipeline_svc.start_pipeline(db, project, lg["thread_id"], lg["run_id"])
+        WRITE_OPS['start_cme_pipeline'].inc()
 
         return ExecutionStatus(
             project_id=str(project.id),
@@ -490,7 +522,7 @@ async def start_cme_pipeline(
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="start_cme_pipeline").inc()
+        ERRORS['start_cme_pipeline'].inc()
         logger.exception("start_cme_pipeline failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -501,27 +533,25 @@ async def get_cme_pipeline_status(project_id: str, db: Session = Depends(get_db)
 
     Auto-syncs from LangGraph Cloud when project is processing/review.
     """
-    start = time.time()
     try:
-        project = project_svc.get_project(db, project_id)
-        if not project:
-            raise HTTPException(status_code=404, detail="CME project not found")
-
-        if project.status in ("processing", "review") and project.pipeline_thread_id:
-            try:
-                thread_data = await _fetch_thread_from_cloud(project.pipeline_thread_id)
-                if thread_data:
-                    await sync_svc.sync_project_from_thread(project, thread_data, db)
-            except Exception as sync_err:
-                logger.warning(f"Cloud sync failed during status poll: {sync_err}")
-        else:
-            logger.info(
-                "auto-sync skipped for %s: status=%s thread_id=%s",
-                project_id, project.status, project.pipeline_thread_id,
-            )
-
-        registry_read_operations.labels(operation="get_cme_pipeline_status").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            project = project_svc.get_project(db, project_id)
+            if not project:
+                raise HTTPException(status_code=404, detail="CME project not found")
+
+            if project.status in ("processing", "review") and project.pipeline_thread_id:
+                try:
+                    thread_data = await _fetch_thread_from_cloud(project.pipeline_thread_id)
+                    if thread_data:
+                        await sync_svc.sync_project_from_thread(project, thread_data, db)
+                except Exception as sync_err:
+                    logger.warning(f"Cloud sync failed during status poll: {sync_err}")
+            else:
+                logger.info(
+                    "auto-sync skipped for %s: status=%s thread_id=%s",
+                    project_id, project.status, project.pipeline_thread_id,
+                )
+        READ_OPS['get_cme_pipeline_status'].inc()
 
         return ExecutionStatus(
             project_id=str(project.id),
@@ -538,7 +568,7 @@ async def get_cme_pipeline_status(project_id: str, db: Session = Depends(get_db)
     except HTTPException:
         raise
     except Exception as e:
-        registry_errors.labels(error_type="get_cme_pipeline_status").inc()
+        ERRORS['get_cme_pipeline_status'].inc()
         logger.exception("get_cme_pipeline_status failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -601,7 +631,7 @@ async def cancel_cme_pipeline(project_id: str, db: Session = Depends(get_db)):
         logger.warning(f"Cloud cancel failed for thread={run.thread_id} run={run.langgraph_run_id}, marking DB cancelled anyway")
     run = pipeline_svc.cancel_pipeline(db, project, run)
 
-    registry_write_operations.labels(operation="cancel_cme_pipeline").inc()
+    WRITE_OPS['cancel_cme_pipeline'].inc()
     return pipeline_svc.pipeline_run_to_read(run)
 
 
@@ -618,39 +648,37 @@ async def rerun_cme_pipeline(
     run_number = max+1, points current_run_id at it, and flips the project
     status back to processing.
     """
-    start = time.time()
-    project = project_svc.get_project(db, project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="CME project not found")
-
-    if project.status not in ("complete", "failed", "cancelled", "review"):
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot rerun: project status is {project.status}",
-        )
+    with timed(registry_write_latency):
+        project = project_svc.get_project(db, project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="CME project not found")
 
-    prev_run = None
-    if project.status == "review" and project.current_run_id:
-        prev_run = pipeline_svc.get_active_run(db, project)
-        if prev_run and prev_run.status == "processing":
-            cancelled = await cancel_langgraph_run(prev_run.thread_id, prev_run.langgraph_run_id)
-            if not cancelled:
-                logger.warning(f"Cloud cancel failed for prev run {prev_run.langgraph_run_id} during rerun")
+        if project.status not in ("complete", "failed", "cancelled", "review"):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot rerun: project status is {project.status}",
+            )
 
-    try:
-        lg = await trigger_langgraph_pipeline(str(project.id), project.intake)
-    except Exception as e:
-        registry_errors.labels(error_type="rerun_cme_pipeline").inc()
-        logger.exception("rerun_cme_pipeline LangGraph trigger failed")
-        raise HTTPException(status_code=502, detail="Pipeline trigger failed")
+        prev_run = None
+        if project.status == "review" and project.current_run_id:
+            prev_run = pipeline_svc.get_active_run(db, project)
+            if prev_run and prev_run.status == "processing":
+                cancelled = await cancel_langgraph_run(prev_run.thread_id, prev_run.langgraph_run_id)
+                if not cancelled:
+                    logger.warning(f"Cloud cancel failed for prev run {prev_run.langgraph_run_id} during rerun")
 
-    run = pipeline_svc.rerun_pipeline(
-        db, project, lg["thread_id"], lg["run_id"],
-        reason=body.reason, prev_run=prev_run,
-    )
+        try:
+            lg = await trigger_langgraph_pipeline(str(project.id), project.intake)
+        except Exception as e:
+            ERRORS['rerun_cme_pipeline'].inc()
+            logger.exception("rerun_cme_pipeline LangGraph trigger failed")
+            raise HTTPException(status_code=502, detail="Pipeline trigger failed")
 
-    registry_write_operations.labels(operation="rerun_cme_pipeline").inc()
-    registry_write_latency.observe((time.time() - start) * 1000)
+        run = pipeline_svc.rerun_pipeline(
+            db, project, lg["thread_id"], lg["run_id"],
+            reason=body.reason, prev_run=prev_run,
+        )
+    WRITE_OPS['rerun_cme_pipeline'].inc()
     return pipeline_svc.pipeline_run_to_read(run)
 
 
@@ -663,7 +691,7 @@ async def list_cme_pipeline_runs(project_id: str, db: Session = Depends(get_db))
 
     runs = pipeline_svc.list_runs(db, project_id)
 
-    registry_read_operations.labels(operation="list_cme_pipeline_runs").inc()
+    READ_OPS['list_cme_pipeline_runs'].inc()
     return PipelineRunListResponse(
         runs=[pipeline_svc.pipeline_run_to_read(r) for r in runs],
         total=len(runs),
@@ -1065,15 +1093,12 @@ async def fulltext_search(
     db: Session = Depends(get_db),
 ):
     """Full-text search across CME documents, intake fields, and source references."""
-    start = time.time()
-
-    results_data = search_svc.fulltext_search(
-        db, q, project_id=project_id, source_type=source_type, limit=limit,
-    )
+    with timed(registry_read_latency):
+        results_data = search_svc.fulltext_search(
+            db, q, project_id=project_id, source_type=source_type, limit=limit,
+        )
 
-    elapsed = (time.time() - start) * 1000
-    registry_read_latency.observe(elapsed)
-    registry_read_operations.labels(operation="cme_fulltext_search").inc()
+    READ_OPS['cme_fulltext_search'].inc()
 
     results = [SearchResultItem(**r) for r in results_data]
     return SearchResponse(query=q, results=results, total=len(results))
@@ -1085,23 +1110,20 @@ async def vector_similarity_search(
     db: Session = Depends(get_db),
 ):
     """Vector similarity search using pgvector cosine distance."""
-    start = time.time()
+    with timed(registry_read_latency):
+        query_embedding = await sync_svc.generate_embedding(req.query)
+        if query_embedding is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Embedding service unavailable — could not embed query",
+            )
 
-    query_embedding = await sync_svc.generate_embedding(req.query)
-    if query_embedding is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Embedding service unavailable — could not embed query",
+        results_data = search_svc.vector_similarity_search(
+            db, query_embedding,
+            project_id=req.project_id, source_tables=req.source_tables, limit=req.limit,
         )
 
-    results_data = search_svc.vector_similarity_search(
-        db, query_embedding,
-        project_id=req.project_id, source_tables=req.source_tables, limit=req.limit,
-    )
-
-    elapsed = (time.time() - start) * 1000
-    registry_read_latency.observe(elapsed)
-    registry_read_operations.labels(operation="cme_vector_search").inc()
+    READ_OPS['cme_vector_search'].inc()
 
     results = [SearchResultItem(**r) for r in results_data]
     return SearchResponse(query=req.query, results=results, total=len(results))
@@ -1113,18 +1135,15 @@ async def hybrid_search(
     db: Session = Depends(get_db),
 ):
     """Hybrid search combining full-text and vector similarity with reciprocal rank fusion."""
-    start = time.time()
-
-    query_embedding = await sync_svc.generate_embedding(req.query)
+    with timed(registry_read_latency):
+        query_embedding = await sync_svc.generate_embedding(req.query)
 
-    results_data = search_svc.hybrid_search(
-        db, req.query, query_embedding,
-        project_id=req.project_id, source_tables=req.source_tables, limit=req.limit,
-    )
+        results_data = search_svc.hybrid_search(
+            db, req.query, query_embedding,
+            project_id=req.project_id, source_tables=req.source_tables, limit=req.limit,
+        )
 
-    elapsed = (time.time() - start) * 1000
-    registry_read_latency.observe(elapsed)
-    registry_read_operations.labels(operation="cme_hybrid_search").inc()
+    READ_OPS['cme_hybrid_search'].inc()
 
     results = [SearchResultItem(**r) for r in results_data]
     return SearchResponse(query=req.query, results=results, total=len(results))
@@ -1136,21 +1155,18 @@ async def get_rag_context(
     db: Session = Depends(get_db),
 ):
     """Retrieve relevant context chunks for LLM RAG augmentation."""
-    start = time.time()
-
-    query_embedding = await sync_svc.generate_embedding(req.query)
-
-    result = search_svc.get_rag_context(
-        db, req.query, query_embedding,
-        project_id=req.project_id,
-        max_chunks=req.max_chunks,
-        max_tokens=req.max_tokens,
-        include_citations=req.include_citations,
-    )
+    with timed(registry_read_latency):
+        query_embedding = await sync_svc.generate_embedding(req.query)
+
+        result = search_svc.get_rag_context(
+            db, req.query, query_embedding,
+            project_id=req.project_id,
+            max_chunks=req.max_chunks,
+            max_tokens=req.max_tokens,
+            include_citations=req.include_citations,
+        )
 
-    elapsed = (time.time() - start) * 1000
-    registry_read_latency.observe(elapsed)
-    registry_read_operations.labels(operation="cme_rag_context").inc()
+    READ_OPS['cme_rag_context'].inc()
 
     chunks = [RAGChunk(**c) for c in result["chunks"]]
     return RAGContextResponse(
@@ -1218,30 +1234,27 @@ async def create_source_reference(
     db: Session = Depends(get_db),
 ):
     """Create a source reference. Returns 409 if project_id + ref_id already exists."""
-    start = time.time()
-
-    project = project_svc.get_project(db, str(ref.project_id))
-    if not project:
-        raise HTTPException(status_code=404, detail=f"Project {ref.project_id} not found")
+    with timed(registry_write_latency):
+        project = project_svc.get_project(db, str(ref.project_id))
+        if not project:
+            raise HTTPException(status_code=404, detail=f"Project {ref.project_id} not found")
 
-    pub_date = None
-    if ref.publication_date:
-        try:
-            pub_date = datetime.fromisoformat(ref.publication_date).date()
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid publication_date '{ref.publication_date}': {e}")
-            pub_date = None
+        pub_date = None
+        if ref.publication_date:
+            try:
+                pub_date = datetime.fromisoformat(ref.publication_date).date()
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Invalid publication_date '{ref.publication_date}': {e}")
+                pub_date = None
 
-    ref_id, ref_status = pipeline_svc.create_source_reference(db, project, ref.model_dump(), pub_date)
+        ref_id, ref_status = pipeline_svc.create_source_reference(db, project, ref.model_dump(), pub_date)
 
-    if ref_status == "created":
-        ref_text = f"{ref.title} {ref.authors or ''} {ref.abstract or ''}"
-        background_tasks.add_task(_generate_embedding_and_save, "cme_source_references", ref_id, ref_text)
-        db.commit()
+        if ref_status == "created":
+            ref_text = f"{ref.title} {ref.authors or ''} {ref.abstract or ''}"
+            background_tasks.add_task(_generate_embedding_and_save, "cme_source_references", ref_id, ref_text)
+            db.commit()
 
-    elapsed = (time.time() - start) * 1000
-    registry_write_latency.observe(elapsed)
-    registry_write_operations.labels(operation="create_source_reference").inc()
+    WRITE_OPS['create_source_reference'].inc()
 
     return {"id": ref_id, "status": ref_status}
 
@@ -1253,22 +1266,19 @@ async def create_agent_output(
     db: Session = Depends(get_db),
 ):
     """Create an agent output. Returns 409 if project_id + agent_name already exists."""
-    start = time.time()
-
-    project = project_svc.get_project(db, str(req.project_id))
-    if not project:
-        raise HTTPException(status_code=404, detail=f"Project {req.project_id} not found")
+    with timed(registry_write_latency):
+        project = project_svc.get_project(db, str(req.project_id))
+        if not project:
+            raise HTTPException(status_code=404, detail=f"Project {req.project_id} not found")
 
-    output_id, output_status = pipeline_svc.create_agent_output(db, project, req.model_dump())
+        output_id, output_status = pipeline_svc.create_agent_output(db, project, req.model_dump())
 
-    if output_status == "created":
-        if req.document_text:
-            background_tasks.add_task(_generate_embedding_and_save, "cme_agent_outputs", output_id, req.document_text)
-        db.commit()
+        if output_status == "created":
+            if req.document_text:
+                background_tasks.add_task(_generate_embedding_and_save, "cme_agent_outputs", output_id, req.document_text)
+            db.commit()
 
-    elapsed = (time.time() - start) * 1000
-    registry_write_latency.observe(elapsed)
-    registry_write_operations.labels(operation="create_agent_output").inc()
+    WRITE_OPS['create_agent_output'].inc()
 
     return {"id": output_id, "status": output_status}
 
@@ -1280,20 +1290,17 @@ async def create_document(
     db: Session = Depends(get_db),
 ):
     """Create an immutable document version. Auto-increments version if one exists."""
-    start = time.time()
-
-    project = project_svc.get_project(db, str(req.project_id))
-    if not project:
-        raise HTTPException(status_code=404, detail=f"Project {req.project_id} not found")
+    with timed(registry_write_latency):
+        project = project_svc.get_project(db, str(req.project_id))
+        if not project:
+            raise HTTPException(status_code=404, detail=f"Project {req.project_id} not found")
 
-    doc_id, version, doc_status = pipeline_svc.create_document(db, project, req.model_dump())
+        doc_id, version, doc_status = pipeline_svc.create_document(db, project, req.model_dump())
 
-    background_tasks.add_task(_generate_embedding_and_save, "cme_documents", doc_id, req.content_text)
-    db.commit()
+        background_tasks.add_task(_generate_embedding_and_save, "cme_documents", doc_id, req.content_text)
+        db.commit()
 
-    elapsed = (time.time() - start) * 1000
-    registry_write_latency.observe(elapsed)
-    registry_write_operations.labels(operation="create_document").inc()
+    WRITE_OPS['create_document'].inc()
 
     return {"id": doc_id, "version": version, "status": doc_status}
 
@@ -2,46 +2,58 @@
 from __future__ import annotations
 
 import logging
-import time
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from cme_schemas import PipelineStatsResponse, ServiceHealthResponse
 from database import get_db
-from metrics import registry_errors, registry_read_latency, registry_read_operations
+from metrics import registry_errors, registry_read_latency, registry_read_operations, timed
 import cme_stats_service as svc
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/cme/stats", tags=["cme-stats"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "cme_pipeline_stats",
+        "cme_service_health",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "cme_pipeline_stats_failed",
+        "cme_service_health_failed",
+    )
+}
+
 
 @router.get("/pipeline", response_model=PipelineStatsResponse)
 async def pipeline_stats(db: Session = Depends(get_db)):
-    start = time.time()
     try:
-        data = svc.get_pipeline_stats(db)
-        registry_read_operations.labels(operation="cme_pipeline_stats").inc()
+        with timed(registry_read_latency):
+            data = svc.get_pipeline_stats(db)
+        READ_OPS['cme_pipeline_stats'].inc()
         return data
     except Exception:
-        registry_errors.labels(error_type="cme_pipeline_stats_failed").inc()
+        ERRORS['cme_pipeline_stats_failed'].inc()
         logger.exception("GET /api/cme/stats/pipeline failed")
         raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        registry_read_latency.observe((time.time() - start) * 1000)
 
 
 @router.get("/services", response_model=ServiceHealthResponse)
 async def service_health(db: Session = Depends(get_db)):
-    start = time.time()
     try:
-        data = svc.get_service_health(db)
-        registry_read_operations.labels(operation="cme_service_health").inc()
+        with timed(registry_read_latency):
+            data = svc.get_service_health(db)
+        READ_OPS['cme_service_health'].inc()
         return data
     except Exception:
-        registry_errors.labels(error_type="cme_service_health_failed").inc()
+        ERRORS['cme_service_health_failed'].inc()
         logger.exception("GET /api/cme/stats/services failed")
         raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        registry_read_latency.observe((time.time() - start) * 1000)
@@ -11,7 +11,6 @@ The corrections table captures user pushback patterns so Claude can learn
 what behaviors to avoid. Queryable via the unified KB search endpoint and
 surfaced in SessionStart briefing Section 8.
 """
-import time
 import logging
 from typing import Optional
 from uuid import UUID
@@ -38,11 +37,40 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/corrections", tags=["corrections"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_corrections",
+        "search_corrections",
+        "correction_stats",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_correction",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_correction_failed",
+        "list_corrections_failed",
+        "search_corrections_failed",
+        "correction_stats_failed",
+        "delete_correction_failed",
+    )
+}
+
 
 @router.post("", response_model=CorrectionResponse, status_code=201)
 async def create_correction(
@@ -50,36 +78,34 @@ async def create_correction(
     response: Response,
     db: Session = Depends(get_db),
 ):
-    start = time.time()
     if payload.category not in VALID_CATEGORIES:
         raise HTTPException(
             status_code=422,
             detail=f"Invalid category '{payload.category}'. Valid: {sorted(VALID_CATEGORIES)}",
         )
     try:
-        upsert_hash = svc.compute_upsert_hash(payload.user_message)
-
-        embedding = None
-        try:
-            from embedding_utils import get_embedding
-            embed_text = f"{payload.category} {payload.user_message} {payload.context or ''}"
-            embedding = await get_embedding(embed_text)
-        except Exception as embed_err:
-            logger.warning("Correction embedding failed: %s", embed_err)
-
-        row, created = svc.upsert_correction(db, payload, upsert_hash, embedding)
-
-        if not created:
-            response.status_code = 200
-
-        registry_write_operations.labels(operation="create_correction").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            upsert_hash = svc.compute_upsert_hash(payload.user_message)
+
+            embedding = None
+            try:
+                from embedding_utils import get_embedding
+                embed_text = f"{payload.category} {payload.user_message} {payload.context or ''}"
+                embedding = await get_embedding(embed_text)
+            except Exception as embed_err:
+                logger.warning("Correction embedding failed: %s", embed_err)
+
+            row, created = svc.upsert_correction(db, payload, upsert_hash, embedding)
+
+            if not created:
+                response.status_code = 200
+        WRITE_OPS['create_correction'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_correction_failed").inc()
+        ERRORS['create_correction_failed'].inc()
         logger.error("%s failed: %s", "corrections_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -94,18 +120,16 @@ async def list_corrections(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ):
-    start = time.time()
     try:
-        rows, total = svc.list_corrections(
-            db, project_name=project_name, category=category,
-            since_days=since_days, limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_corrections").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_corrections(
+                db, project_name=project_name, category=category,
+                since_days=since_days, limit=limit, offset=offset,
+            )
+        READ_OPS['list_corrections'].inc()
         return CorrectionList(corrections=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="list_corrections_failed").inc()
+        ERRORS['list_corrections_failed'].inc()
         logger.error("%s failed: %s", "corrections_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -115,19 +139,17 @@ async def search_corrections(
     body: CorrectionSearch,
     db: Session = Depends(get_db),
 ):
-    start = time.time()
     try:
-        rows, total = svc.search_corrections(
-            db, body.query,
-            project_name=body.project_name, category=body.category,
-            limit=body.limit,
-        )
-
-        registry_read_operations.labels(operation="search_corrections").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.search_corrections(
+                db, body.query,
+                project_name=body.project_name, category=body.category,
+                limit=body.limit,
+            )
+        READ_OPS['search_corrections'].inc()
         return CorrectionList(corrections=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="search_corrections_failed").inc()
+        ERRORS['search_corrections_failed'].inc()
         logger.error("%s failed: %s", "corrections_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -138,15 +160,13 @@ async def correction_stats(
     db: Session = Depends(get_db),
 ):
     """Enhanced stats: per-category counts (7d/30d/all), repeat flags, trends, top pattern."""
-    start = time.time()
     try:
-        result = svc.correction_stats_enhanced(db, project_name=project_name)
-
-        registry_read_operations.labels(operation="correction_stats").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            result = svc.correction_stats_enhanced(db, project_name=project_name)
+        READ_OPS['correction_stats'].inc()
         return result
     except Exception as e:
-        registry_errors.labels(error_type="correction_stats_failed").inc()
+        ERRORS['correction_stats_failed'].inc()
         logger.error("%s failed: %s", "corrections_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -164,6 +184,6 @@ async def delete_correction(
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="delete_correction_failed").inc()
+        ERRORS['delete_correction_failed'].inc()
         logger.error("delete_correction failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
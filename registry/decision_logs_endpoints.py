@@ -6,7 +6,6 @@ Routes:
   POST   /api/decision-logs/search   full-text search across decision logs
   DELETE /api/decision-logs/{item_id} delete a decision log
 """
-import time
 import logging
 from typing import Optional
 from uuid import UUID
@@ -31,11 +30,38 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/decision-logs", tags=["decision-logs"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_decision_logs",
+        "search_decision_logs",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_decision_log",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_decision_log_failed",
+        "list_decision_logs_failed",
+        "search_decision_logs_failed",
+        "delete_decision_log_failed",
+    )
+}
+
 
 @router.post("", response_model=DecisionLogResponse, status_code=status.HTTP_201_CREATED)
 async def create_decision_log(
@@ -43,29 +69,27 @@ async def create_decision_log(
     response: Response,
     db: Session = Depends(get_db),
 ) -> DecisionLogResponse:
-    start = time.time()
     try:
-        embedding = None
-        try:
-            from embedding_utils import get_embedding
-            text_for_embed = f"{payload.title} {payload.choice} {payload.rationale}"
-            embedding = await get_embedding(text_for_embed)
-        except Exception as embed_err:
-            logger.warning("Embedding generation failed: %s", embed_err)
-
-        row, created = svc.upsert_decision_log(db, payload, embedding)
-
-        if not created:
-            response.status_code = status.HTTP_200_OK
-
-        registry_write_operations.labels(operation="create_decision_log").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            embedding = None
+            try:
+                from embedding_utils import get_embedding
+                text_for_embed = f"{payload.title} {payload.choice} {payload.rationale}"
+                embedding = await get_embedding(text_for_embed)
+            except Exception as embed_err:
+                logger.warning("Embedding generation failed: %s", embed_err)
+
+            row, created = svc.upsert_decision_log(db, payload, embedding)
+
+            if not created:
+                response.status_code = status.HTTP_200_OK
+        WRITE_OPS['create_decision_log'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_decision_log_failed").inc()
+        ERRORS['create_decision_log_failed'].inc()
         logger.error("create_decision_log failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -78,18 +102,16 @@ async def list_decision_logs(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ) -> DecisionLogList:
-    start = time.time()
     try:
-        rows, total = svc.list_decision_logs(
-            db, project_name=project_name, domain=domain,
-            limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_decision_logs").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_decision_logs(
+                db, project_name=project_name, domain=domain,
+                limit=limit, offset=offset,
+            )
+        READ_OPS['list_decision_logs'].inc()
         return DecisionLogList(decision_logs=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="list_decision_logs_failed").inc()
+        ERRORS['list_decision_logs_failed'].inc()
         logger.error("%s failed: %s", "decision_logs_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -99,19 +121,17 @@ async def search_decision_logs(
     body: DecisionLogSearch,
     db: Session = Depends(get_db),
 ) -> DecisionLogList:
-    start = time.time()
     try:
-        rows, total = svc.search_decision_logs(
-            db, body.query,
-            project_name=body.project_name, domain=body.domain,
-            limit=body.limit,
-        )
-
-        registry_read_operations.labels(operation="search_decision_logs").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.search_decision_logs(
+                db, body.query,
+                project_name=body.project_name, domain=body.domain,
+                limit=body.limit,
+            )
+        READ_OPS['search_decision_logs'].inc()
         return DecisionLogList(decision_logs=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="search_decision_logs_failed").inc()
+        ERRORS['search_decision_logs_failed'].inc()
         logger.error("%s failed: %s", "decision_logs_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -129,6 +149,6 @@ async def delete_decision_log(
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="delete_decision_log_failed").inc()
+        ERRORS['delete_decision_log_failed'].inc()
         logger.error("delete_decision_log failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
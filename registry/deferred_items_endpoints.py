@@ -8,7 +8,6 @@ Routes:
   PATCH  /api/deferred-items/{item_id}    update status/priority with optional resolution reason
   DELETE /api/deferred-items/{item_id}    delete a deferred item record
 """
-import time
 import logging
 from typing import Optional
 from uuid import UUID
@@ -38,11 +37,44 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/deferred-items", tags=["deferred-items"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_deferred_items",
+        "search_deferred_items",
+        "deferred_item_stats",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_deferred_item",
+        "update_deferred_item",
+        "mark_surfaced",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_deferred_item_failed",
+        "list_deferred_items_failed",
+        "search_deferred_items_failed",
+        "deferred_item_stats_failed",
+        "update_deferred_item_failed",
+        "mark_surfaced_failed",
+        "delete_deferred_item_failed",
+    )
+}
+
 
 @router.post("", response_model=DeferredItemResponse, status_code=status.HTTP_201_CREATED)
 async def create_deferred_item(
@@ -50,7 +82,6 @@ async def create_deferred_item(
     response: Response,
     db: Session = Depends(get_db),
 ) -> DeferredItemResponse:
-    start = time.time()
     if payload.priority not in VALID_PRIORITIES:
         raise HTTPException(
             status_code=422,
@@ -67,27 +98,26 @@ async def create_deferred_item(
             detail=f"Invalid status '{payload.status}'. Valid: {sorted(VALID_STATUSES)}",
         )
     try:
-        embedding = None
-        try:
-            from embedding_utils import get_embedding
-            text_for_embed = f"{payload.title} {payload.description} {payload.reason}"
-            embedding = await get_embedding(text_for_embed)
-        except Exception as embed_err:
-            logger.warning("Deferred item embedding failed: %s", embed_err)
-
-        row, created = svc.upsert_deferred_item(db, payload, embedding)
+        with timed(registry_write_latency):
+            embedding = None
+            try:
+                from embedding_utils import get_embedding
+                text_for_embed = f"{payload.title} {payload.description} {payload.reason}"
+                embedding = await get_embedding(text_for_embed)
+            except Exception as embed_err:
+                logger.warning("Deferred item embedding failed: %s", embed_err)
 
-        if not created:
-            response.status_code = status.HTTP_200_OK
+            row, created = svc.upsert_deferred_item(db, payload, embedding)
 
-        registry_write_operations.labels(operation="create_deferred_item").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+            if not created:
+                response.status_code = status.HTTP_200_OK
+        WRITE_OPS['create_deferred_item'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_deferred_item_failed").inc()
+        ERRORS['create_deferred_item_failed'].inc()
         logger.error("%s failed: %s", "deferred_items_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -105,22 +135,20 @@ async def list_deferred_items(
     last_surfaced_before_hours: Optional[int] = Query(None, ge=0),
     db: Session = Depends(get_db),
 ) -> DeferredItemList:
-    start = time.time()
     try:
-        rows, total = svc.list_deferred_items(
-            db, project_name=project_name, category=category,
-            priority=priority, status_filter=status_filter,
-            limit=limit, offset=offset,
-            sort=sort,
-            min_age_days=min_age_days,
-            last_surfaced_before_hours=last_surfaced_before_hours,
-        )
-
-        registry_read_operations.labels(operation="list_deferred_items").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_deferred_items(
+                db, project_name=project_name, category=category,
+                priority=priority, status_filter=status_filter,
+                limit=limit, offset=offset,
+                sort=sort,
+                min_age_days=min_age_days,
+                last_surfaced_before_hours=last_surfaced_before_hours,
+            )
+        READ_OPS['list_deferred_items'].inc()
         return DeferredItemList(deferred_items=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="list_deferred_items_failed").inc()
+        ERRORS['list_deferred_items_failed'].inc()
         logger.error("%s failed: %s", "deferred_items_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -130,20 +158,18 @@ async def search_deferred_items(
     body: DeferredItemSearch,
     db: Session = Depends(get_db),
 ) -> DeferredItemList:
-    start = time.time()
     try:
-        rows, total = svc.search_deferred_items(
-            db, body.query,
-            project_name=body.project_name, category=body.category,
-            priority=body.priority, status_filter=body.status,
-            limit=body.limit,
-        )
-
-        registry_read_operations.labels(operation="search_deferred_items").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.search_deferred_items(
+                db, body.query,
+                project_name=body.project_name, category=body.category,
+                priority=body.priority, status_filter=body.status,
+                limit=body.limit,
+            )
+        READ_OPS['search_deferred_items'].inc()
         return DeferredItemList(deferred_items=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="search_deferred_items_failed").inc()
+        ERRORS['search_deferred_items_failed'].inc()
         logger.error("%s failed: %s", "deferred_items_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -154,15 +180,13 @@ async def deferred_item_stats(
     db: Session = Depends(get_db),
 ):
     """Aggregate stats: status/priority/category distributions, age histogram, stale count."""
-    start = time.time()
     try:
-        result = svc.deferred_item_stats(db, project_name=project_name)
-
-        registry_read_operations.labels(operation="deferred_item_stats").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            result = svc.deferred_item_stats(db, project_name=project_name)
+        READ_OPS['deferred_item_stats'].inc()
         return result
     except Exception as e:
-        registry_errors.labels(error_type="deferred_item_stats_failed").inc()
+        ERRORS['deferred_item_stats_failed'].inc()
         logger.error("%s failed: %s", "deferred_items_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -174,7 +198,6 @@ async def update_deferred_item(
     db: Session = Depends(get_db),
 ):
     """Update status/priority with optional resolution reason."""
-    start = time.time()
     if payload.status is not None and payload.status not in VALID_STATUSES:
         raise HTTPException(
             status_code=422,
@@ -186,18 +209,17 @@ async def update_deferred_item(
             detail=f"Invalid priority '{payload.priority}'. Valid: {sorted(VALID_PRIORITIES)}",
         )
     try:
-        row = svc.update_deferred_item(db, item_id, payload)
-        if not row:
-            raise HTTPException(status_code=404, detail="Not found")
-
-        registry_write_operations.labels(operation="update_deferred_item").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            row = svc.update_deferred_item(db, item_id, payload)
+            if not row:
+                raise HTTPException(status_code=404, detail="Not found")
+        WRITE_OPS['update_deferred_item'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="update_deferred_item_failed").inc()
+        ERRORS['update_deferred_item_failed'].inc()
         logger.error("update_deferred_item failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -210,19 +232,18 @@ async def mark_surfaced(
     """Bump last_surfaced_at to now(). Called by the daemon when an item is included
     in a materialized briefing — lets future queries filter out recently-surfaced
     items via last_surfaced_before_hours."""
-    start = time.time()
     try:
-        row = svc.mark_surfaced(db, item_id)
-        if not row:
-            raise HTTPException(status_code=404, detail="Not found")
-        registry_write_operations.labels(operation="mark_surfaced").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            row = svc.mark_surfaced(db, item_id)
+            if not row:
+                raise HTTPException(status_code=404, detail="Not found")
+        WRITE_OPS['mark_surfaced'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="mark_surfaced_failed").inc()
+        ERRORS['mark_surfaced_failed'].inc()
         logger.error("mark_surfaced failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -240,6 +261,6 @@ async def delete_deferred_item(
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="delete_deferred_item_failed").inc()
+        ERRORS['delete_deferred_item_failed'].inc()
         logger.error("delete_deferred_item failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -9,7 +9,6 @@ Routes:
 Agent-owned fields cannot be written through this API — DevChangelogPatch enforces
 extra='forbid' at the schema layer, rejecting agent-owned keys before the handler runs.
 """
-import time
 import logging
 from datetime import date, datetime, timezone
 from typing import Optional
@@ -33,11 +32,37 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/dev-changelog", tags=["dev-changelog"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_dev_changelog",
+        "get_dev_changelog",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "patch_dev_changelog",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "list_dev_changelog",
+        "get_dev_changelog",
+        "patch_dev_changelog",
+    )
+}
+
 
 @router.get("", response_model=DevChangelogList)
 async def list_dev_changelog(
@@ -50,43 +75,39 @@ async def list_dev_changelog(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ) -> DevChangelogList:
-    start = time.time()
     try:
-        rows, total = svc.list_dev_changelog(
-            db, status=status, category=category,
-            window_start=window_start, window_end=window_end,
-            q=q, limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_dev_changelog").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_dev_changelog(
+                db, status=status, category=category,
+                window_start=window_start, window_end=window_end,
+                q=q, limit=limit, offset=offset,
+            )
+        READ_OPS['list_dev_changelog'].inc()
 
         return DevChangelogList(
             entries=[DevChangelogEntry.model_validate(r) for r in rows],
             total=total,
         )
     except Exception as e:
-        registry_errors.labels(error_type="list_dev_changelog").inc()
+        ERRORS['list_dev_changelog'].inc()
         logger.exception("list_dev_changelog failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/{slug}", response_model=DevChangelogEntry)
 async def get_dev_changelog(slug: str, db: Session = Depends(get_db)) -> DevChangelogEntry:
-    start = time.time()
     try:
-        row = svc.get_by_slug(db, slug)
-        if not row:
-            raise HTTPException(status_code=404, detail=f"dev_changelog entry '{slug}' not found")
-
-        registry_read_operations.labels(operation="get_dev_changelog").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            row = svc.get_by_slug(db, slug)
+            if not row:
+                raise HTTPException(status_code=404, detail=f"dev_changelog entry '{slug}' not found")
+        READ_OPS['get_dev_changelog'].inc()
 
         return DevChangelogEntry.model_validate(row)
     except HTTPException:
         raise
     except Exception as e:
-        registry_errors.labels(error_type="get_dev_changelog").inc()
+        ERRORS['get_dev_changelog'].inc()
         logger.exception("get_dev_changelog failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -97,24 +118,22 @@ async def patch_dev_changelog(
     patch: DevChangelogPatch,
     db: Session = Depends(get_db),
 ) -> DevChangelogEntry:
-    start = time.time()
     try:
-        updates = patch.model_dump(exclude_unset=True)
-        if not updates:
-            raise HTTPException(status_code=400, detail="PATCH body must include at least one human-owned field")
-
-        row = svc.patch_by_slug(db, slug, updates)
-        if not row:
-            raise HTTPException(status_code=404, detail=f"dev_changelog entry '{slug}' not found")
+        with timed(registry_write_latency):
+            updates = patch.model_dump(exclude_unset=True)
+            if not updates:
+                raise HTTPException(status_code=400, detail="PATCH body must include at least one human-owned field")
 
-        registry_write_operations.labels(operation="patch_dev_changelog").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+            row = svc.patch_by_slug(db, slug, updates)
+            if not row:
+                raise HTTPException(status_code=404, detail=f"dev_changelog entry '{slug}' not found")
+        WRITE_OPS['patch_dev_changelog'].inc()
 
         return DevChangelogEntry.model_validate(row)
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="patch_dev_changelog").inc()
+        ERRORS['patch_dev_changelog'].inc()
         logger.exception("patch_dev_changelog failed")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -7,7 +7,6 @@ Routes:
   POST   /api/doc-pages/search       hybrid FTS + vector search with RRF
   DELETE /api/doc-pages/project/:name  delete all pages for a project
 """
-import time
 import logging
 from typing import Optional
 
@@ -33,11 +32,41 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/doc-pages", tags=["doc-pages"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_doc_pages",
+        "search_doc_pages",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "upsert_doc_page",
+        "bulk_ingest_doc_pages",
+        "delete_project_pages",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "upsert_doc_page_failed",
+        "bulk_ingest_doc_pages_failed",
+        "list_doc_pages_failed",
+        "search_doc_pages_failed",
+        "delete_project_pages_failed",
+    )
+}
+
 
 async def _generate_embedding(content: str, title: Optional[str] = None) -> Optional[list]:
     try:
@@ -54,23 +83,21 @@ async def upsert_doc_page(
     response: Response,
     db: Session = Depends(get_db),
 ) -> DocPageResponse:
-    start = time.time()
     try:
-        embedding = await _generate_embedding(payload.content, payload.title)
-        row, created = svc.upsert_page(db, payload, embedding)
-
-        if not created:
-            response.status_code = status.HTTP_200_OK
+        with timed(registry_write_latency):
+            embedding = await _generate_embedding(payload.content, payload.title)
+            row, created = svc.upsert_page(db, payload, embedding)
 
-        registry_write_operations.labels(operation="upsert_doc_page").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+            if not created:
+                response.status_code = status.HTTP_200_OK
+        WRITE_OPS['upsert_doc_page'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
         logger.error("upsert_doc_page failed: %s", e)
-        registry_errors.labels(error_type="upsert_doc_page_failed").inc()
+        ERRORS['upsert_doc_page_failed'].inc()
         raise HTTPException(status_code=500, detail="Upsert failed")
 
 
@@ -80,27 +107,25 @@ async def bulk_ingest(
     db: Session = Depends(get_db),
 ) -> dict:
     """Bulk upsert doc pages with optional mark-and-sweep stale cleanup."""
-    start = time.time()
     try:
-        pages_with_embeddings = []
-        for page in payload.pages:
-            page_data = page.model_copy(update={"project_name": payload.project_name})
-            embedding = await _generate_embedding(page_data.content, page_data.title)
-            pages_with_embeddings.append((page_data, embedding))
-
-        upserted, swept = svc.bulk_upsert(
-            db, payload.project_name, pages_with_embeddings, payload.sweep_stale,
-        )
-
-        registry_write_operations.labels(operation="bulk_ingest_doc_pages").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            pages_with_embeddings = []
+            for page in payload.pages:
+                page_data = page.model_copy(update={"project_name": payload.project_name})
+                embedding = await _generate_embedding(page_data.content, page_data.title)
+                pages_with_embeddings.append((page_data, embedding))
+
+            upserted, swept = svc.bulk_upsert(
+                db, payload.project_name, pages_with_embeddings, payload.sweep_stale,
+            )
+        WRITE_OPS['bulk_ingest_doc_pages'].inc()
         return {"upserted": upserted, "swept": swept, "project_name": payload.project_name}
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
         logger.error("bulk_ingest failed for project %s: %s", payload.project_name, e)
-        registry_errors.labels(error_type="bulk_ingest_doc_pages_failed").inc()
+        ERRORS['bulk_ingest_doc_pages_failed'].inc()
         raise HTTPException(status_code=500, detail="Bulk ingest failed")
 
 
@@ -112,19 +137,17 @@ async def list_doc_pages(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ) -> DocPageList:
-    start = time.time()
     try:
-        rows, total = svc.list_doc_pages(
-            db, project_name=project_name, source_file=source_file,
-            limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_doc_pages").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_doc_pages(
+                db, project_name=project_name, source_file=source_file,
+                limit=limit, offset=offset,
+            )
+        READ_OPS['list_doc_pages'].inc()
         return DocPageList(doc_pages=rows, total=total)
     except Exception as e:
         logger.error("list_doc_pages failed: %s", e)
-        registry_errors.labels(error_type="list_doc_pages_failed").inc()
+        ERRORS['list_doc_pages_failed'].inc()
         raise HTTPException(status_code=500, detail="List failed")
 
 
@@ -134,20 +157,18 @@ async def search_doc_pages(
     db: Session = Depends(get_db),
 ) -> DocPageList:
     """Hybrid search using Reciprocal Rank Fusion (RRF) over FTS + vector."""
-    start = time.time()
     try:
-        query_embedding = await get_embedding(body.query)
-        result_pages = svc.search_doc_pages(
-            db, body.query, query_embedding,
-            project_name=body.project_name, tags=body.tags, limit=body.limit,
-        )
-
-        registry_read_operations.labels(operation="search_doc_pages").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            query_embedding = await get_embedding(body.query)
+            result_pages = svc.search_doc_pages(
+                db, body.query, query_embedding,
+                project_name=body.project_name, tags=body.tags, limit=body.limit,
+            )
+        READ_OPS['search_doc_pages'].inc()
         return DocPageList(doc_pages=result_pages, total=len(result_pages))
     except Exception as e:
         logger.error("search_doc_pages failed: %s", e)
-        registry_errors.labels(error_type="search_doc_pages_failed").inc()
+        ERRORS['search_doc_pages_failed'].inc()
         raise HTTPException(status_code=500, detail="Search failed")
 
 
@@ -156,15 +177,13 @@ async def delete_project_pages(
     project_name: str,
     db: Session = Depends(get_db),
 ) -> dict:
-    start = time.time()
     try:
-        count = svc.delete_project_pages(db, project_name)
-
-        registry_write_operations.labels(operation="delete_project_pages").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            count = svc.delete_project_pages(db, project_name)
+        WRITE_OPS['delete_project_pages'].inc()
         return {"deleted": count, "project_name": project_name}
     except Exception as e:
         db.rollback()
         logger.error("delete_project_pages failed for %s: %s", project_name, e)
-        registry_errors.labels(error_type="delete_project_pages_failed").inc()
+        ERRORS['delete_project_pages_failed'].inc()
         raise HTTPException(status_code=500, detail="Delete failed")
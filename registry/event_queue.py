@@ -0,0 +1,206 @@
+"""
+Write-behind queue for audit Event rows.
+
+Request handlers enqueue events instead of inserting them in their own
+transaction; a background task started from the API lifespan drains the
+queue and COPYs events in batches into events_staging, an UNLOGGED table
+(no WAL for the ingest write). Every EVENT_PROMOTE_INTERVAL seconds the
+staged rows are moved into events in a single transaction.
+
+Staged rows are lost if Postgres crashes before they are promoted, so audit
+events can lag or drop by at most one promote interval. A batch whose write
+fails is retried EVENT_WRITE_ATTEMPTS times before it is discarded, and the
+queue holds at most EVENT_QUEUE_MAX events; both kinds of loss are counted in
+registry_events_dropped. On shutdown stop_event_flusher() lets the flusher
+write the batch it is collecting before flush_pending_events() writes the rest.
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import text
+
+from database import SessionLocal, bulk_insert_with_copy
+from metrics import registry_db_errors, registry_events_dropped
+from models import uuid7
+
+logger = logging.getLogger("dhg.registry.events")
+
+# Flush when this many events are pending or after this many seconds
+EVENT_BATCH_SIZE = 500
+EVENT_FLUSH_INTERVAL = 0.25
+# Move staged events into the events table this often
+EVENT_PROMOTE_INTERVAL = 5.0
+# Events held in memory before new ones are dropped (e.g. while the DB is down)
+EVENT_QUEUE_MAX = 50_000
+# Tries per batch, with linear backoff between them, before it is discarded
+EVENT_WRITE_ATTEMPTS = 3
+EVENT_RETRY_BACKOFF = 0.5
+
+_dropped_queue_full = registry_events_dropped.labels(reason="queue_full")
+_dropped_write_failed = registry_events_dropped.labels(reason="write_failed")
+
+EVENT_COLUMNS = ["id", "event_type", "entity_type", "entity_id", "user_id", "description", "meta_data"]
+
+# DELETE ... RETURNING inside the INSERT keeps the move atomic even with
+# several API workers staging concurrently (a TRUNCATE could drop rows
+# another worker committed after our SELECT).
+_PROMOTE_SQL = text(
+    "WITH moved AS (DELETE FROM events_staging RETURNING {cols}) "
+    "INSERT INTO events ({cols}) SELECT {cols} FROM moved".format(
+        cols=", ".join(EVENT_COLUMNS + ["created_at"])
+    )
+)
+
+# Queued by stop_event_flusher(): the flusher writes what it holds and returns
+_STOP = object()
+
+# Created by start_event_flusher() so it belongs to the serving event loop
+event_queue: Optional[asyncio.Queue] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def enqueue_event(event_type: str, entity_type: str, entity_id=None, **fields) -> None:
+    """Queue an audit event for the background flusher.
+
+    Safe to call from worker threads. Without a running flusher (scripts,
+    one-off sessions) the event is written straight to events instead.
+    """
+    event = {
+        "id": uuid7(),
+        "event_type": event_type,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        **fields,
+    }
+    if event_queue is None:
+        _write_with_retry([event], "events")
+    else:
+        # Handlers run in FastAPI's threadpool; hand the event to the loop
+        _loop.call_soon_threadsafe(_put_event, event)
+
+
+def _put_event(event: dict) -> None:
+    try:
+        event_queue.put_nowait(event)
+    except asyncio.QueueFull:
+        _dropped_queue_full.inc()
+        logger.warning("Event queue full; dropped %s event", event["event_type"])
+
+
+def _write_events(batch: list, table: str = "events_staging") -> None:
+    db = SessionLocal()
+    try:
+        bulk_insert_with_copy(db, table, batch, EVENT_COLUMNS)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _write_with_retry(batch: list, table: str = "events_staging") -> None:
+    """Write a batch, retrying transient failures before giving up on it."""
+    for attempt in range(1, EVENT_WRITE_ATTEMPTS + 1):
+        try:
+            _write_events(batch, table)
+            return
+        except Exception:
+            registry_db_errors.inc()
+            logger.exception(
+                "Failed to write %d queued events (attempt %d/%d)",
+                len(batch), attempt, EVENT_WRITE_ATTEMPTS,
+            )
+            if attempt < EVENT_WRITE_ATTEMPTS:
+                time.sleep(EVENT_RETRY_BACKOFF * attempt)
+    _dropped_write_failed.inc(len(batch))
+
+
+def _promote_staged_events() -> None:
+    db = SessionLocal()
+    try:
+        db.execute(_PROMOTE_SQL)
+        db.commit()
+    except Exception:
+        db.rollback()
+        registry_db_errors.inc()
+        logger.exception("Failed to promote staged events")
+    finally:
+        db.close()
+
+
+def _take_pending(batch: list) -> list:
+    """Top up batch from the queue without waiting; stops after _STOP."""
+    while len(batch) < EVENT_BATCH_SIZE:
+        try:
+            event = event_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        batch.append(event)
+        if event is _STOP:
+            break
+    return batch
+
+
+def start_event_flusher() -> asyncio.Task:
+    """Create the queue on the running loop and start draining it."""
+    global event_queue, _loop
+    _loop = asyncio.get_running_loop()
+    event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAX)
+    return asyncio.create_task(event_flusher())
+
+
+async def stop_event_flusher(task: asyncio.Task) -> None:
+    """Have the flusher write the batch it is collecting, then wait for it to exit."""
+    await event_queue.put(_STOP)
+    await task
+
+
+async def event_flusher() -> None:
+    """Drain the queue until stopped, staging up to EVENT_BATCH_SIZE events at a time."""
+    loop = asyncio.get_running_loop()
+    promote_at = None  # set once something is staged
+    while True:
+        timeout = None if promote_at is None else max(promote_at - loop.time(), 0)
+        try:
+            batch = [await asyncio.wait_for(event_queue.get(), timeout)]
+        except asyncio.TimeoutError:
+            batch = []
+
+        if batch:
+            deadline = loop.time() + EVENT_FLUSH_INTERVAL
+            while len(batch) < EVENT_BATCH_SIZE and batch[-1] is not _STOP:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(event_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+                _take_pending(batch)
+            stopping = batch[-1] is _STOP
+            if stopping:
+                batch.pop()
+            if batch:
+                await asyncio.to_thread(_write_with_retry, batch)
+            if stopping:
+                return
+            if promote_at is None:
+                promote_at = loop.time() + EVENT_PROMOTE_INTERVAL
+
+        if promote_at is not None and loop.time() >= promote_at:
+            await asyncio.to_thread(_promote_staged_events)
+            promote_at = None
+
+
+async def flush_pending_events() -> None:
+    """Write whatever is still queued, promote it, and stop queueing (called on shutdown)."""
+    global event_queue
+    if event_queue is None:
+        return
+    while not event_queue.empty():
+        await asyncio.to_thread(_write_with_retry, _take_pending([]))
+    await asyncio.to_thread(_promote_staged_events)
+    event_queue = None
@@ -3,7 +3,6 @@
 Routes:
   GET /api/feedback-loop/health   pipeline status + per-type event counts (7d)
 """
-import time
 import logging
 from typing import Optional
 
@@ -20,10 +19,26 @@ from metrics import (
     registry_read_latency,
     registry_read_operations,
     registry_errors,
+    timed,
 )
 
 router = APIRouter(prefix="/api/feedback-loop", tags=["feedback-loop"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "feedback_loop_health",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "feedback_loop_health_failed",
+    )
+}
+
 
 @router.get("/health", response_model=FeedbackLoopHealthResponse)
 async def feedback_loop_health(
@@ -31,14 +46,12 @@ async def feedback_loop_health(
     db: Session = Depends(get_db),
 ):
     """Unified pipeline health: per-type counts (7d), last capture, overall status."""
-    start = time.time()
     try:
-        result = svc.feedback_loop_health(db, project_name=project_name)
-
-        registry_read_operations.labels(operation="feedback_loop_health").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            result = svc.feedback_loop_health(db, project_name=project_name)
+        READ_OPS['feedback_loop_health'].inc()
         return result
     except Exception as e:
-        registry_errors.labels(error_type="feedback_loop_health_failed").inc()
+        ERRORS['feedback_loop_health_failed'].inc()
         logger.error("feedback_loop_health failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
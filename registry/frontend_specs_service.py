@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 
 from models import FrontendDesignSpec
@@ -22,8 +23,7 @@ def get_spec_by_slug(db: Session, slug: str) -> FrontendDesignSpec | None:
 
 def create_spec(db: Session, data: dict) -> FrontendDesignSpec:
     """Create a new spec. Raises RuntimeError if slug already exists."""
-    existing = db.query(FrontendDesignSpec).filter(FrontendDesignSpec.slug == data["slug"]).first()
-    if existing:
+    if db.query(exists().where(FrontendDesignSpec.slug == data["slug"])).scalar():
         raise RuntimeError(f"Spec with slug '{data['slug']}' already exists")
     spec = FrontendDesignSpec(**data)
     db.add(spec)
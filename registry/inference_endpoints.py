@@ -1,6 +1,5 @@
 """DHG Inference Platform API - Node discovery, model routing, interaction logging."""
 import logging
-import time
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -18,28 +17,43 @@ from metrics import (
     registry_read_operations,
     registry_write_latency,
     registry_write_operations,
+    timed,
 )
 
 logger = logging.getLogger("dhg.inference.endpoints")
 inference_router = APIRouter(prefix="/api/v1/inference", tags=["inference"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_nodes",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "register_node",
+        "log_interaction",
+    )
+}
+
 
 @inference_router.get("/nodes", response_model=list[NodeResponse])
 def list_nodes(db: Session = Depends(get_db)):
-    start = time.time()
-    result = svc.list_nodes(db)
-    registry_read_operations.labels(operation="list_nodes").inc()
-    registry_read_latency.observe((time.time() - start) * 1000)
+    with timed(registry_read_latency):
+        result = svc.list_nodes(db)
+    READ_OPS['list_nodes'].inc()
     return result
 
 
 @inference_router.post("/nodes/register", response_model=NodeResponse)
 def register_node(req: NodeRegisterRequest, db: Session = Depends(get_db)):
-    start = time.time()
-    node = svc.register_or_update_node(db, req)
-    logger.info(f"Node registered: {node.node_name} ({node.host}:{node.gateway_port})")
-    registry_write_operations.labels(operation="register_node").inc()
-    registry_write_latency.observe((time.time() - start) * 1000)
+    with timed(registry_write_latency):
+        node = svc.register_or_update_node(db, req)
+        logger.info(f"Node registered: {node.node_name} ({node.host}:{node.gateway_port})")
+    WRITE_OPS['register_node'].inc()
     return node
 
 
@@ -85,10 +99,9 @@ def list_models(
 
 @inference_router.post("/interactions", response_model=InteractionLogResponse)
 def log_interaction(req: InteractionLogRequest, db: Session = Depends(get_db)):
-    start = time.time()
-    interaction = svc.log_interaction(db, req)
-    registry_write_operations.labels(operation="log_interaction").inc()
-    registry_write_latency.observe((time.time() - start) * 1000)
+    with timed(registry_write_latency):
+        interaction = svc.log_interaction(db, req)
+    WRITE_OPS['log_interaction'].inc()
     return InteractionLogResponse(id=interaction.id, synced_at=interaction.synced_at)
 
 
@@ -9,7 +9,7 @@ import sys
 from typing import Dict, Any
 from datetime import datetime
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, exists
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
 
@@ -106,11 +106,7 @@ class ClaudeDataIngester:
         try:
             # Check if project already exists
             project_id = project_data.get('project_id')
-            existing = None
-            if project_id:
-                existing = session.query(Project).filter_by(project_id=project_id).first()
-
-            if existing:
+            if project_id and session.query(exists().where(Project.project_id == project_id)).scalar():
                 logger.info(f"Project already exists: {project_data.get('name')}")
                 session.close()
                 return
@@ -6,7 +6,6 @@ Routes:
   POST   /api/insights/search   full-text search across insights
   DELETE /api/insights/{item_id} delete an insight
 """
-import time
 import logging
 from typing import Optional
 from uuid import UUID
@@ -31,11 +30,38 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/insights", tags=["insights"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_insights",
+        "search_insights",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_insight",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_insight_failed",
+        "list_insights_failed",
+        "search_insights_failed",
+        "delete_insight_failed",
+    )
+}
+
 
 @router.post("", response_model=InsightResponse, status_code=status.HTTP_201_CREATED)
 async def create_insight(
@@ -43,29 +69,27 @@ async def create_insight(
     response: Response,
     db: Session = Depends(get_db),
 ) -> InsightResponse:
-    start = time.time()
     try:
-        embedding = None
-        try:
-            from embedding_utils import get_embedding
-            text_for_embed = f"{payload.tldr} {payload.insight_statement}"
-            embedding = await get_embedding(text_for_embed)
-        except Exception as embed_err:
-            logger.warning("Embedding generation failed: %s", embed_err)
-
-        row, created = svc.upsert_insight(db, payload, embedding)
-
-        if not created:
-            response.status_code = status.HTTP_200_OK
-
-        registry_write_operations.labels(operation="create_insight").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            embedding = None
+            try:
+                from embedding_utils import get_embedding
+                text_for_embed = f"{payload.tldr} {payload.insight_statement}"
+                embedding = await get_embedding(text_for_embed)
+            except Exception as embed_err:
+                logger.warning("Embedding generation failed: %s", embed_err)
+
+            row, created = svc.upsert_insight(db, payload, embedding)
+
+            if not created:
+                response.status_code = status.HTTP_200_OK
+        WRITE_OPS['create_insight'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_insight_failed").inc()
+        ERRORS['create_insight_failed'].inc()
         logger.error("%s failed: %s", "insights_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -78,18 +102,16 @@ async def list_insights(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ) -> InsightList:
-    start = time.time()
     try:
-        rows, total = svc.list_insights(
-            db, project_name=project_name, category=category,
-            limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_insights").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_insights(
+                db, project_name=project_name, category=category,
+                limit=limit, offset=offset,
+            )
+        READ_OPS['list_insights'].inc()
         return InsightList(insights=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="list_insights_failed").inc()
+        ERRORS['list_insights_failed'].inc()
         logger.error("%s failed: %s", "insights_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -99,19 +121,17 @@ async def search_insights(
     body: InsightSearch,
     db: Session = Depends(get_db),
 ) -> InsightList:
-    start = time.time()
     try:
-        rows, total = svc.search_insights(
-            db, body.query,
-            project_name=body.project_name, category=body.category,
-            limit=body.limit,
-        )
-
-        registry_read_operations.labels(operation="search_insights").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.search_insights(
+                db, body.query,
+                project_name=body.project_name, category=body.category,
+                limit=body.limit,
+            )
+        READ_OPS['search_insights'].inc()
         return InsightList(insights=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="search_insights_failed").inc()
+        ERRORS['search_insights_failed'].inc()
         logger.error("%s failed: %s", "insights_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -129,6 +149,6 @@ async def delete_insight(
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="delete_insight_failed").inc()
+        ERRORS['delete_insight_failed'].inc()
         logger.error("delete_insight failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -0,0 +1,66 @@
+"""
+JSON bodies built straight from Core result rows.
+
+Endpoints select table columns (no ORM instances), build their response
+models with model_construct — the rows come from our own tables, so the
+UUIDs/datetimes psycopg2 already decoded are not revalidated — and dump them
+to bytes with a cached TypeAdapter instead of going through FastAPI's
+per-request response_model.
+"""
+import logging
+from functools import lru_cache
+from typing import List
+
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+
+logger = logging.getLogger("dhg.registry")
+
+# Rows fetched from the server-side cursor per round trip by streamed listings
+LIST_STREAM_CHUNK = 200
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def construct(model, row):
+    return model.model_construct(**row._mapping)
+
+
+def json_row(model, row, status_code: int = 200) -> Response:
+    body = construct(model, row).model_dump_json()
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def json_list(model, rows) -> bytes:
+    return list_adapter(model).dump_json([construct(model, row) for row in rows])
+
+
+def _stream_json_list(model, rows, operation: str, failed):
+    """Yield a JSON array chunk by chunk from a yield_per result."""
+    yield b"["
+    sep = b""
+    try:
+        for partition in rows.partitions():
+            # Strip the adapter's brackets so partitions splice into one array
+            yield sep + json_list(model, partition)[1:-1]
+            sep = b","
+    except Exception:
+        # Headers are already sent. Re-raise so the server aborts the body:
+        # closing the array would pass a truncated page off as complete, and
+        # keyset clients would page on from the wrong last row.
+        failed.inc()
+        logger.exception("%s stream failed", operation)
+        raise
+    yield b"]"
+
+
+def stream_json_list(model, rows, operation: str, failed) -> StreamingResponse:
+    """Stream a yield_per result as a JSON array of `model`.
+
+    `failed` is the pre-bound error counter incremented if the cursor fails
+    mid-stream.
+    """
+    return StreamingResponse(_stream_json_list(model, rows, operation, failed), media_type="application/json")
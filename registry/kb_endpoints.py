@@ -5,7 +5,6 @@ Routes:
                          Sources: doc_pages, insights, decision_logs, ship_sessions,
                          agent_sessions, corrections, dev_changelog, bug_fixes, deferred_items.
 """
-import time
 import logging
 from typing import Optional
 
@@ -23,11 +22,20 @@ from metrics import (
     registry_read_latency,
     registry_read_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/kb", tags=["kb"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "kb_search",
+    )
+}
+
 
 @router.post("/search", response_model=KBSearchResponse)
 async def kb_search(
@@ -40,48 +48,45 @@ async def kb_search(
     FTS + vector search with Reciprocal Rank Fusion (k=60), then constructs the
     response. Individual source failures are logged and skipped — degrades gracefully.
     """
-    start = time.time()
-
-    raw_sources: list[str] = body.sources if body.sources else list(svc.SOURCE_CONFIG.keys())
-    invalid = [s for s in raw_sources if s not in VALID_SOURCES]
-    if invalid:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Invalid sources: {invalid}. Valid: {sorted(VALID_SOURCES)}",
-        )
-    requested_sources = list(dict.fromkeys(raw_sources))
-
-    query_embedding: Optional[list[float]] = None
-    try:
-        query_embedding = await get_embedding(body.query)
-    except Exception as embed_err:
-        logger.warning("KB search embedding failed, falling back to FTS only: %s", embed_err)
-
-    candidates, searched_sources, failed_sources = svc.kb_search(
-        db, body.query, query_embedding,
-        sources=requested_sources,
-        project_name=body.project_name,
-        limit=body.limit,
-    )
-
-    for source_name in failed_sources:
-        registry_errors.labels(error_type=f"kb_search_{source_name}_failed").inc()
-
-    results = [
-        KBSearchResult(
-            source=source_name,
-            source_id=row.id,
-            title=title,
-            content=content,
-            score=round(score, 8),
-            project_name=row.project_name,
-            metadata=metadata,
+    with timed(registry_read_latency):
+        raw_sources: list[str] = body.sources if body.sources else list(svc.SOURCE_CONFIG.keys())
+        invalid = [s for s in raw_sources if s not in VALID_SOURCES]
+        if invalid:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid sources: {invalid}. Valid: {sorted(VALID_SOURCES)}",
+            )
+        requested_sources = list(dict.fromkeys(raw_sources))
+
+        query_embedding: Optional[list[float]] = None
+        try:
+            query_embedding = await get_embedding(body.query)
+        except Exception as embed_err:
+            logger.warning("KB search embedding failed, falling back to FTS only: %s", embed_err)
+
+        candidates, searched_sources, failed_sources = svc.kb_search(
+            db, body.query, query_embedding,
+            sources=requested_sources,
+            project_name=body.project_name,
+            limit=body.limit,
         )
-        for (_, score, row, source_name, title, content, metadata) in candidates
-    ]
 
-    registry_read_operations.labels(operation="kb_search").inc()
-    registry_read_latency.observe((time.time() - start) * 1000)
+        for source_name in failed_sources:
+            registry_errors.labels(error_type=f"kb_search_{source_name}_failed").inc()
+
+        results = [
+            KBSearchResult(
+                source=source_name,
+                source_id=row.id,
+                title=title,
+                content=content,
+                score=round(score, 8),
+                project_name=row.project_name,
+                metadata=metadata,
+            )
+            for (_, score, row, source_name, title, content, metadata) in candidates
+        ]
+    READ_OPS['kb_search'].inc()
 
     return KBSearchResponse(
         query=body.query,
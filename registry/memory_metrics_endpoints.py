@@ -4,7 +4,6 @@ Routes:
   POST   /api/memory-metrics   create a memory metrics snapshot
   GET    /api/memory-metrics   list with filters (project, limit, offset)
 """
-import time
 import logging
 from typing import Optional
 
@@ -27,29 +26,51 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/memory-metrics", tags=["memory-metrics"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_memory_metrics",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_memory_metrics",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_memory_metrics_failed",
+        "list_memory_metrics_failed",
+    )
+}
+
 
 @router.post("", response_model=MemoryMetricsResponse, status_code=status.HTTP_201_CREATED)
 async def create_memory_metrics(
     payload: MemoryMetricsCreate,
     db: Session = Depends(get_db),
 ) -> MemoryMetricsResponse:
-    start = time.time()
     try:
-        row = svc.create_memory_metrics(db, payload)
-
-        registry_write_operations.labels(operation="create_memory_metrics").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            row = svc.create_memory_metrics(db, payload)
+        WRITE_OPS['create_memory_metrics'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_memory_metrics_failed").inc()
+        ERRORS['create_memory_metrics_failed'].inc()
         logger.exception("create_memory_metrics failed")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -61,16 +82,14 @@ async def list_memory_metrics(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ) -> MemoryMetricsList:
-    start = time.time()
     try:
-        rows, total = svc.list_memory_metrics(
-            db, project=project, limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_memory_metrics").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_memory_metrics(
+                db, project=project, limit=limit, offset=offset,
+            )
+        READ_OPS['list_memory_metrics'].inc()
         return MemoryMetricsList(metrics=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="list_memory_metrics_failed").inc()
+        ERRORS['list_memory_metrics_failed'].inc()
         logger.exception("list_memory_metrics failed")
         raise HTTPException(status_code=500, detail="Internal server error")
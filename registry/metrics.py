@@ -4,19 +4,90 @@ Every endpoint module imports from here instead of declaring its own.
 This prevents duplicate-timeseries errors when multiple modules are
 imported in the same process (e.g., during pytest collection).
 """
+import asyncio
+import bisect
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
 from prometheus_client import Counter, Histogram
 
-registry_write_latency = Histogram(
+
+class BufferedHistogram:
+    """Histogram front end that defers observations to a periodic flush.
+
+    observe() is a lock-free deque append on the request path; flush()
+    (run by the API's background task and before every /metrics scrape,
+    possibly from different threads)
+    buckets the pending values and applies them with one increment per
+    bucket instead of one locked update per observation.
+    """
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+        self._bounds = histogram._upper_bounds
+        self._pending = deque()
+        # Only flushers take this; observe() never blocks
+        self._flush_lock = threading.Lock()
+
+    def observe(self, amount: float) -> None:
+        self._pending.append(amount)
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            pending = self._pending
+            n = len(pending)
+            if not n:
+                return
+            counts = [0] * len(self._bounds)
+            total = 0.0
+            for _ in range(n):
+                amount = pending.popleft()
+                total += amount
+                counts[bisect.bisect_left(self._bounds, amount)] += 1
+            # Same per-bucket (non-cumulative) storage Histogram.observe updates
+            self._histogram._sum.inc(total)
+            for bucket, count in zip(self._histogram._buckets, counts):
+                if count:
+                    bucket.inc(count)
+
+
+registry_write_latency = BufferedHistogram(Histogram(
     "registry_write_latency",
     "Database write latency in milliseconds",
     buckets=[1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000],
-)
+))
 
-registry_read_latency = Histogram(
+registry_read_latency = BufferedHistogram(Histogram(
     "registry_read_latency",
     "Database read latency in milliseconds",
     buckets=[1, 5, 10, 25, 50, 100, 250, 500, 1000],
-)
+))
+
+
+@contextmanager
+def timed(histogram):
+    """Observe the block's duration in milliseconds if it completes without raising."""
+    start_ns = time.perf_counter_ns()
+    yield
+    histogram.observe((time.perf_counter_ns() - start_ns) / 1_000_000)
+
+
+LATENCY_FLUSH_INTERVAL = 1.0
+
+
+def flush_latency_metrics() -> None:
+    """Apply buffered latency observations to the exported histograms."""
+    registry_write_latency.flush()
+    registry_read_latency.flush()
+
+
+async def latency_flusher() -> None:
+    """Flush buffered latencies every LATENCY_FLUSH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(LATENCY_FLUSH_INTERVAL)
+        flush_latency_metrics()
 
 registry_write_operations = Counter(
     "registry_write_operations",
@@ -40,3 +111,9 @@ registry_db_errors = Counter(
     "registry_db_errors",
     "Total number of database connection errors",
 )
+
+registry_events_dropped = Counter(
+    "registry_events_dropped",
+    "Audit events discarded because the event queue was full or writes kept failing",
+    ["reason"],
+)
@@ -1,4 +1,6 @@
 from datetime import datetime
+import os
+import time
 import uuid
 """
 DHG Registry - SQLAlchemy Models
@@ -14,11 +16,30 @@ from pgvector.sqlalchemy import Vector
 Base = declarative_base()
 
 
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    48-bit millisecond timestamp followed by random bits, so new primary keys
+    land at the right-hand edge of the B-tree instead of on random pages.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = rand >> 68              # 12 bits
+    rand_b = rand & ((1 << 62) - 1)  # 62 bits
+    return uuid.UUID(int=(
+        (ts_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    ))
+
+
 class Media(Base):
     """Source media files"""
     __tablename__ = 'media'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     filename = Column(String(512), nullable=False)
     filepath = Column(String(1024), nullable=False)
     file_size_bytes = Column(BigInteger, nullable=False)
@@ -37,7 +58,7 @@ class Transcript(Base):
     """Complete transcription results"""
     __tablename__ = 'transcripts'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     media_id = Column(UUID(as_uuid=True), ForeignKey('media.id', ondelete='CASCADE'), nullable=False)
     full_text = Column(Text, nullable=False)
     language = Column(String(16), nullable=True)
@@ -57,7 +78,7 @@ class Segment(Base):
     """Timestamped transcript segments"""
     __tablename__ = 'segments'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     transcript_id = Column(UUID(as_uuid=True), ForeignKey('transcripts.id', ondelete='CASCADE'), nullable=False)
     segment_index = Column(Integer, nullable=False)
     start_time_seconds = Column(Float, nullable=False)
@@ -76,7 +97,7 @@ class Event(Base):
     """Audit log for all registry operations"""
     __tablename__ = 'events'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     event_type = Column(String(64), nullable=False)  # create, update, delete, transcribe, etc.
     entity_type = Column(String(64), nullable=False)  # media, transcript, segment
     entity_id = Column(UUID(as_uuid=True), nullable=True)
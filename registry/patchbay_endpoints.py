@@ -4,7 +4,6 @@ Route:
   GET /api/patchbay/status   TCP liveness of the docs-hub service map (cached)
 """
 import logging
-import time
 
 from fastapi import APIRouter, HTTPException
 
@@ -16,21 +15,36 @@ from metrics import (
     registry_read_latency,
     registry_read_operations,
     registry_errors,
+    timed,
 )
 
 router = APIRouter(prefix="/api/patchbay", tags=["patchbay"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "patchbay_status",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "patchbay_status_failed",
+    )
+}
+
 
 @router.get("/status")
 async def patchbay_status() -> dict:
     """Return {services: {key: "up"|"down"}, checked_at} for the homepage LEDs."""
-    start = time.time()
     try:
-        result = await svc.get_status()
-        registry_read_operations.labels(operation="patchbay_status").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            result = await svc.get_status()
+        READ_OPS['patchbay_status'].inc()
         return result
     except Exception as e:
         logger.error("patchbay_status failed: %s", e)
-        registry_errors.labels(error_type="patchbay_status_failed").inc()
+        ERRORS['patchbay_status_failed'].inc()
         raise HTTPException(status_code=500, detail="Status probe failed")
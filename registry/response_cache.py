@@ -0,0 +1,43 @@
+"""
+Per-process cache of serialized GET-by-id responses.
+
+Bounded LRU with a short TTL: a hit skips the DB round trip and all Pydantic
+work. Writers in this process evict the entries they change; changes made
+elsewhere (other workers, ingest scripts) show up once the TTL expires.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU map of key -> response body bytes."""
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
@@ -6,7 +6,6 @@ Routes:
   POST   /api/ship-sessions/search   full-text search across ship sessions
   DELETE /api/ship-sessions/{item_id} delete a ship session
 """
-import time
 import logging
 from typing import Optional
 from uuid import UUID
@@ -31,11 +30,38 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/ship-sessions", tags=["ship-sessions"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_ship_sessions",
+        "search_ship_sessions",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_ship_session",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_ship_session_failed",
+        "list_ship_sessions_failed",
+        "search_ship_sessions_failed",
+        "delete_ship_session_failed",
+    )
+}
+
 
 @router.post("", response_model=ShipSessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_ship_session(
@@ -43,29 +69,27 @@ async def create_ship_session(
     response: Response,
     db: Session = Depends(get_db),
 ) -> ShipSessionResponse:
-    start = time.time()
     try:
-        embedding = None
-        try:
-            from embedding_utils import get_embedding
-            text_for_embed = f"{payload.feature} {payload.approach or ''}"
-            embedding = await get_embedding(text_for_embed)
-        except Exception as embed_err:
-            logger.warning("Embedding generation failed: %s", embed_err)
-
-        row, created = svc.upsert_ship_session(db, payload, embedding)
-
-        if not created:
-            response.status_code = status.HTTP_200_OK
-
-        registry_write_operations.labels(operation="create_ship_session").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            embedding = None
+            try:
+                from embedding_utils import get_embedding
+                text_for_embed = f"{payload.feature} {payload.approach or ''}"
+                embedding = await get_embedding(text_for_embed)
+            except Exception as embed_err:
+                logger.warning("Embedding generation failed: %s", embed_err)
+
+            row, created = svc.upsert_ship_session(db, payload, embedding)
+
+            if not created:
+                response.status_code = status.HTTP_200_OK
+        WRITE_OPS['create_ship_session'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_ship_session_failed").inc()
+        ERRORS['create_ship_session_failed'].inc()
         logger.error("%s failed: %s", "ship_sessions_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -78,18 +102,16 @@ async def list_ship_sessions(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ) -> ShipSessionList:
-    start = time.time()
     try:
-        rows, total = svc.list_ship_sessions(
-            db, project_name=project_name, status_filter=status_filter,
-            limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_ship_sessions").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_ship_sessions(
+                db, project_name=project_name, status_filter=status_filter,
+                limit=limit, offset=offset,
+            )
+        READ_OPS['list_ship_sessions'].inc()
         return ShipSessionList(ship_sessions=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="list_ship_sessions_failed").inc()
+        ERRORS['list_ship_sessions_failed'].inc()
         logger.error("%s failed: %s", "ship_sessions_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -99,19 +121,17 @@ async def search_ship_sessions(
     body: ShipSessionSearch,
     db: Session = Depends(get_db),
 ) -> ShipSessionList:
-    start = time.time()
     try:
-        rows, total = svc.search_ship_sessions(
-            db, body.query,
-            project_name=body.project_name, status_filter=body.status,
-            limit=body.limit,
-        )
-
-        registry_read_operations.labels(operation="search_ship_sessions").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.search_ship_sessions(
+                db, body.query,
+                project_name=body.project_name, status_filter=body.status,
+                limit=body.limit,
+            )
+        READ_OPS['search_ship_sessions'].inc()
         return ShipSessionList(ship_sessions=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="search_ship_sessions_failed").inc()
+        ERRORS['search_ship_sessions_failed'].inc()
         logger.error("%s failed: %s", "ship_sessions_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -129,6 +149,6 @@ async def delete_ship_session(
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="delete_ship_session_failed").inc()
+        ERRORS['delete_ship_session_failed'].inc()
         logger.error("delete_ship_session failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -31,6 +31,22 @@ from metrics import (
 
 router = APIRouter(prefix="/api/talkback", tags=["talkback"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "talkback",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "talkback_haiku_unavailable",
+        "talkback_failed",
+    )
+}
+
 
 def _sse(event: str, data: dict) -> str:
     return f"event: {event}\ndata: {json.dumps(data)}\n\n"
@@ -41,7 +57,7 @@ async def talkback(body: TalkbackRequest, db: Session = Depends(get_db)) -> Stre
     """Stream a documentation answer grounded in hybrid doc_pages retrieval."""
 
     async def event_stream():
-        start = time.time()
+        start = time.perf_counter_ns()
         try:
             citations, context = await svc.retrieve(db, body.question, body.project_name)
             yield _sse("citations", {
@@ -57,19 +73,19 @@ async def talkback(body: TalkbackRequest, db: Session = Depends(get_db)) -> Stre
                     yield _sse("error", {
                         "message": "Haiku is not configured on this server. Try the local model.",
                     })
-                    registry_errors.labels(error_type="talkback_haiku_unavailable").inc()
+                    ERRORS['talkback_haiku_unavailable'].inc()
                     return
                 raise
 
-            registry_read_operations.labels(operation="talkback").inc()
-            registry_read_latency.observe((time.time() - start) * 1000)
+            READ_OPS['talkback'].inc()
+            registry_read_latency.observe((time.perf_counter_ns() - start) / 1_000_000)
             yield _sse("done", {
                 "model": body.model,
-                "elapsed_ms": int((time.time() - start) * 1000),
+                "elapsed_ms": int((time.perf_counter_ns() - start) / 1_000_000),
             })
         except Exception as e:
             logger.error("talkback failed (model=%s): %s", body.model, e)
-            registry_errors.labels(error_type="talkback_failed").inc()
+            ERRORS['talkback_failed'].inc()
             yield _sse("error", {"message": "Talkback is temporarily unavailable."})
 
     return StreamingResponse(event_stream(), media_type="text/event-stream")
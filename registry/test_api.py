@@ -36,6 +36,10 @@ class TestMediaEndpoints:
         response = client.post("/api/v1/media")
         assert response.status_code == 422
 
+    def test_create_media_bulk_requires_body(self, client):
+        response = client.post("/api/v1/media/bulk")
+        assert response.status_code == 422
+
     def test_list_media_returns_list(self, client):
         with patch("api.get_db") as mock_get_db:
             mock_db = MagicMock()
@@ -45,6 +49,26 @@ class TestMediaEndpoints:
             assert response.status_code in (200, 500)
 
 
+    def test_get_media_served_from_cache(self, client):
+        import uuid
+        import api
+
+        media_id = uuid.uuid4()
+        api.media_cache.put(media_id, b'{"cached": true}')
+        try:
+            response = client.get(f"/api/v1/media/{media_id}")
+            assert response.status_code == 200
+            assert response.json() == {"cached": True}
+        finally:
+            api.media_cache.evict(media_id)
+
+
+class TestSegmentEndpoints:
+    def test_create_segments_bulk_requires_body(self, client):
+        response = client.post("/api/v1/segments/bulk")
+        assert response.status_code == 422
+
+
 class TestEventEndpoints:
     def test_create_event_requires_body(self, client):
         response = client.post("/api/v1/events")
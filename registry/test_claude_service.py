@@ -0,0 +1,51 @@
+"""Tests for claude_service — count queries compile to a single statement.
+
+Run with:
+    pytest registry/test_claude_service.py -v
+"""
+
+import os
+import sys
+import uuid
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import claude_service as svc
+from models import Conversation, Project
+
+
+def _sql(query) -> str:
+    return str(query.statement.compile(dialect=postgresql.dialect()))
+
+
+def test_conversation_listing_counts_are_correlated_subqueries():
+    query = (
+        Session().query(Conversation)
+        .order_by(Conversation.created_at.desc())
+        .offset(10)
+        .limit(5)
+    )
+    sql = _sql(svc._conversations_with_counts(query))
+
+    # Counts are per row, not a JOIN product of messages x artifacts
+    assert "JOIN" not in sql
+    assert "GROUP BY" not in sql
+    assert "WHERE messages.conversation_id = conversations.id" in sql
+    assert "WHERE artifacts.conversation_id = conversations.id" in sql
+    assert "LIMIT" in sql and "OFFSET" in sql
+
+
+def test_project_count_is_correlated_subquery():
+    query = Session().query(Project, svc._conversation_count).filter(Project.id == uuid.uuid4())
+    sql = _sql(query)
+
+    assert "JOIN" not in sql
+    assert "WHERE conversations.project_id = projects.id" in sql
+
+
+def test_search_pattern_escapes_like_wildcards():
+    assert svc._contains_pattern("plan") == "%plan%"
+    assert svc._contains_pattern("100%_done\\") == "%100\\%\\_done\\\\%"
@@ -8,7 +8,6 @@ Routes:
 """
 import os
 import sys
-import time
 import logging
 from typing import Optional
 from uuid import UUID
@@ -35,11 +34,38 @@ from metrics import (
     registry_write_latency,
     registry_write_operations,
     registry_errors,
+    timed,
 )
 
 
 router = APIRouter(prefix="/api/test-coverage", tags=["test-coverage"])
 
+# Label children bound once instead of hashing labels on every request
+READ_OPS = {
+    op: registry_read_operations.labels(operation=op)
+    for op in (
+        "list_test_coverage",
+        "search_test_coverage",
+    )
+}
+
+WRITE_OPS = {
+    op: registry_write_operations.labels(operation=op)
+    for op in (
+        "create_test_coverage",
+    )
+}
+
+ERRORS = {
+    error_type: registry_errors.labels(error_type=error_type)
+    for error_type in (
+        "create_test_coverage_failed",
+        "list_test_coverage_failed",
+        "search_test_coverage_failed",
+        "delete_test_coverage_failed",
+    )
+}
+
 
 @router.post("", response_model=TestCoverageResponse, status_code=status.HTTP_201_CREATED)
 async def create_test_coverage(
@@ -47,34 +73,32 @@ async def create_test_coverage(
     response: Response,
     db: Session = Depends(get_db),
 ) -> TestCoverageResponse:
-    start = time.time()
     if payload.category not in VALID_CATEGORIES:
         raise HTTPException(
             status_code=422,
             detail=f"Invalid category '{payload.category}'. Valid: {sorted(VALID_CATEGORIES)}",
         )
     try:
-        embedding = None
-        try:
-            from embedding_utils import get_embedding
-            text_for_embed = f"{payload.title} {payload.trigger or ''}"
-            embedding = await get_embedding(text_for_embed)
-        except Exception as embed_err:
-            logger.warning("Test coverage embedding failed: %s", embed_err)
-
-        row, created = svc.upsert_test_coverage(db, payload, embedding)
-
-        if not created:
-            response.status_code = status.HTTP_200_OK
-
-        registry_write_operations.labels(operation="create_test_coverage").inc()
-        registry_write_latency.observe((time.time() - start) * 1000)
+        with timed(registry_write_latency):
+            embedding = None
+            try:
+                from embedding_utils import get_embedding
+                text_for_embed = f"{payload.title} {payload.trigger or ''}"
+                embedding = await get_embedding(text_for_embed)
+            except Exception as embed_err:
+                logger.warning("Test coverage embedding failed: %s", embed_err)
+
+            row, created = svc.upsert_test_coverage(db, payload, embedding)
+
+            if not created:
+                response.status_code = status.HTTP_200_OK
+        WRITE_OPS['create_test_coverage'].inc()
         return row
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="create_test_coverage_failed").inc()
+        ERRORS['create_test_coverage_failed'].inc()
         logger.error("%s failed: %s", "test_coverage_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -87,18 +111,16 @@ async def list_test_coverage(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ) -> TestCoverageList:
-    start = time.time()
     try:
-        rows, total = svc.list_test_coverage(
-            db, project_name=project_name, category=category,
-            limit=limit, offset=offset,
-        )
-
-        registry_read_operations.labels(operation="list_test_coverage").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.list_test_coverage(
+                db, project_name=project_name, category=category,
+                limit=limit, offset=offset,
+            )
+        READ_OPS['list_test_coverage'].inc()
         return TestCoverageList(test_coverage_events=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="list_test_coverage_failed").inc()
+        ERRORS['list_test_coverage_failed'].inc()
         logger.error("%s failed: %s", "test_coverage_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -108,19 +130,17 @@ async def search_test_coverage(
     body: TestCoverageSearch,
     db: Session = Depends(get_db),
 ) -> TestCoverageList:
-    start = time.time()
     try:
-        rows, total = svc.search_test_coverage(
-            db, body.query,
-            project_name=body.project_name, category=body.category,
-            limit=body.limit,
-        )
-
-        registry_read_operations.labels(operation="search_test_coverage").inc()
-        registry_read_latency.observe((time.time() - start) * 1000)
+        with timed(registry_read_latency):
+            rows, total = svc.search_test_coverage(
+                db, body.query,
+                project_name=body.project_name, category=body.category,
+                limit=body.limit,
+            )
+        READ_OPS['search_test_coverage'].inc()
         return TestCoverageList(test_coverage_events=rows, total=total)
     except Exception as e:
-        registry_errors.labels(error_type="search_test_coverage_failed").inc()
+        ERRORS['search_test_coverage_failed'].inc()
         logger.error("%s failed: %s", "test_coverage_op", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -138,6 +158,6 @@ async def delete_test_coverage(
         raise
     except Exception as e:
         db.rollback()
-        registry_errors.labels(error_type="delete_test_coverage_failed").inc()
+        ERRORS['delete_test_coverage_failed'].inc()
         logger.error("delete_test_coverage failed: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -0,0 +1,135 @@
+"""
+Event Queue Tests
+=================
+Unit tests for event_queue.py — background batching of audit events.
+
+Run with: pytest registry/test_event_queue.py -v
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_enqueue_without_flusher_writes_immediately():
+    import event_queue as eq
+
+    written = []
+    with patch.object(eq, "_write_events", new=lambda b, table: written.append((table, b))):
+        eq.enqueue_event("create", "media", description="x")
+
+    assert len(written) == 1
+    table, batch = written[0]
+    assert table == "events"
+    assert batch[0]["event_type"] == "create"
+    assert batch[0]["entity_type"] == "media"
+
+
+def test_flusher_batches_queued_events():
+    import event_queue as eq
+
+    batches = []
+    promotes = []
+
+    async def run():
+        task = eq.start_event_flusher()
+        for i in range(eq.EVENT_BATCH_SIZE + 3):
+            eq.enqueue_event("create", "media", description=str(i))
+        await asyncio.sleep(eq.EVENT_FLUSH_INTERVAL * 2)
+        task.cancel()
+        await eq.flush_pending_events()
+
+    with patch.object(eq, "_write_events", new=lambda b, table: batches.append(len(b))), \
+            patch.object(eq, "_promote_staged_events", new=lambda: promotes.append(1)):
+        asyncio.run(run())
+
+    assert sum(batches) == eq.EVENT_BATCH_SIZE + 3
+    assert max(batches) <= eq.EVENT_BATCH_SIZE
+    assert promotes  # staged rows are promoted at least on shutdown
+    assert eq.event_queue is None
+
+
+def test_flusher_promotes_staged_events_after_interval():
+    import event_queue as eq
+
+    promotes = []
+
+    async def run():
+        task = eq.start_event_flusher()
+        eq.enqueue_event("create", "media")
+        await asyncio.sleep(eq.EVENT_FLUSH_INTERVAL + 0.2)
+        task.cancel()
+        eq.event_queue = None
+
+    with patch.object(eq, "EVENT_PROMOTE_INTERVAL", 0.05), \
+            patch.object(eq, "_write_events", new=lambda b, table: None), \
+            patch.object(eq, "_promote_staged_events", new=lambda: promotes.append(1)):
+        asyncio.run(run())
+
+    assert promotes == [1]
+
+
+def test_failed_write_is_retried_then_counted_as_dropped():
+    import event_queue as eq
+
+    attempts = []
+
+    def failing(batch, table):
+        attempts.append(table)
+        raise RuntimeError("server closed the connection")
+
+    with patch.object(eq, "_write_events", new=failing), \
+            patch.object(eq, "EVENT_RETRY_BACKOFF", 0), \
+            patch.object(eq, "_dropped_write_failed") as dropped:
+        eq._write_with_retry([{"event_type": "create"}] * 3)
+
+    assert attempts == ["events_staging"] * eq.EVENT_WRITE_ATTEMPTS
+    dropped.inc.assert_called_once_with(3)
+
+
+def test_full_queue_drops_and_counts_new_events():
+    import event_queue as eq
+
+    async def run():
+        eq.start_event_flusher().cancel()
+        for _ in range(3):
+            eq._put_event({"event_type": "create"})
+        size = eq.event_queue.qsize()
+        eq.event_queue = None
+        return size
+
+    with patch.object(eq, "EVENT_QUEUE_MAX", 2), \
+            patch.object(eq, "_dropped_queue_full") as dropped:
+        size = asyncio.run(run())
+
+    assert size == 2
+    dropped.inc.assert_called_once_with()
+
+
+def test_stop_writes_the_batch_being_collected():
+    import event_queue as eq
+
+    batches = []
+
+    async def run():
+        task = eq.start_event_flusher()
+        for i in range(5):
+            eq.enqueue_event("create", "media", description=str(i))
+        # Still inside the collection window: the events are held in the
+        # flusher's local batch, not the queue
+        await asyncio.sleep(eq.EVENT_FLUSH_INTERVAL / 5)
+        await eq.stop_event_flusher(task)
+        written_by_flusher = list(batches)
+        await eq.flush_pending_events()
+        return task, written_by_flusher
+
+    with patch.object(eq, "_write_events", new=lambda b, table: batches.append(len(b))), \
+            patch.object(eq, "_promote_staged_events", new=lambda: None):
+        task, written_by_flusher = asyncio.run(run())
+
+    assert task.done() and not task.cancelled()
+    assert written_by_flusher == [5]
+    assert batches == [5]
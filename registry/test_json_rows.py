@@ -0,0 +1,89 @@
+"""
+JSON Rows Tests
+===============
+Unit tests for json_rows.py — Core rows serialized without revalidation.
+
+Run with: pytest registry/test_json_rows.py -v
+"""
+
+import asyncio
+import json
+import os
+import sys
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from json_rows import stream_json_list
+
+
+class ItemResponse(BaseModel):
+    id: uuid.UUID
+    title: str
+    note: Optional[str]
+    created_at: datetime
+
+
+class FakeResult:
+    """Stands in for a yield_per Result: rows handed out in partitions."""
+
+    def __init__(self, partitions):
+        self._partitions = partitions
+
+    def partitions(self):
+        yield from self._partitions
+
+
+def _row(**columns):
+    return SimpleNamespace(_mapping=columns)
+
+
+async def _body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+def test_stream_json_list_splices_partitions_into_one_array():
+    created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    ids = [uuid.uuid4() for _ in range(3)]
+    result = FakeResult([
+        [_row(id=ids[0], title="a", note=None, created_at=created, meta_data={}),
+         _row(id=ids[1], title="b", note="n", created_at=created, meta_data={})],
+        [_row(id=ids[2], title="c", note=None, created_at=created, meta_data={})],
+    ])
+
+    failed = MagicMock()
+    body = json.loads(asyncio.run(_body(stream_json_list(ItemResponse, result, "list_items", failed))))
+
+    failed.inc.assert_not_called()
+    assert [item["id"] for item in body] == [str(i) for i in ids]
+    # Columns the response model does not declare are dropped
+    assert all("meta_data" not in item for item in body)
+    assert body[1]["note"] == "n"
+
+
+def test_stream_json_list_aborts_body_when_cursor_fails():
+    def broken():
+        yield [_row(id=uuid.uuid4(), title="a", note=None, created_at=datetime.now(timezone.utc))]
+        raise RuntimeError("connection lost")
+
+    result = SimpleNamespace(partitions=broken)
+    failed = MagicMock()
+    chunks = []
+
+    async def consume():
+        async for chunk in stream_json_list(ItemResponse, result, "list_items", failed).body_iterator:
+            chunks.append(chunk)
+
+    # The error propagates so the connection is cut instead of the array
+    # being closed into a valid-looking (truncated) page
+    with pytest.raises(RuntimeError):
+        asyncio.run(consume())
+    assert not b"".join(chunks).endswith(b"]")
+    failed.inc.assert_called_once()
@@ -0,0 +1,68 @@
+"""
+Metrics Tests
+=============
+Unit tests for metrics.py — buffered latency histograms.
+
+Run with: pytest registry/test_metrics.py -v
+"""
+
+import os
+import random
+import sys
+
+from prometheus_client import CollectorRegistry, Histogram
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def _samples(registry, name):
+    return {
+        (s.name, tuple(sorted(s.labels.items()))): s.value
+        for metric in registry.collect()
+        for s in metric.samples
+        if metric.name == name and not s.name.endswith("_created")
+    }
+
+
+def test_buffered_histogram_matches_direct_observe():
+    from metrics import BufferedHistogram
+
+    registry = CollectorRegistry()
+    buckets = [1, 5, 10, 25, 50, 100, 250, 500, 1000]
+    direct = Histogram("direct", "direct", buckets=buckets, registry=registry)
+    buffered = BufferedHistogram(Histogram("buffered", "buffered", buckets=buckets, registry=registry))
+
+    values = [0, 1, 5, 1000, 2500] + [random.uniform(0, 2000) for _ in range(500)]
+    for v in values:
+        direct.observe(v)
+        buffered.observe(v)
+
+    assert _samples(registry, "buffered")[("buffered_count", ())] == 0
+    buffered.flush()
+
+    expected = {(n.replace("direct", "buffered"), l): v for (n, l), v in _samples(registry, "direct").items()}
+    actual = _samples(registry, "buffered")
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        assert abs(actual[key] - value) < 1e-6
+
+
+def test_timed_observes_only_on_success():
+    from metrics import timed
+
+    observed = []
+
+    class Recorder:
+        def observe(self, amount):
+            observed.append(amount)
+
+    with timed(Recorder()):
+        pass
+    try:
+        with timed(Recorder()):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+
+    assert len(observed) == 1
+    assert observed[0] >= 0
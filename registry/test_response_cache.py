@@ -0,0 +1,39 @@
+"""
+Response Cache Tests
+====================
+Unit tests for response_cache.py — TTL + LRU body cache.
+
+Run with: pytest registry/test_response_cache.py -v
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from response_cache import ResponseCache
+
+
+def test_entries_expire_after_ttl():
+    cache = ResponseCache(ttl=5.0, maxsize=10)
+    with patch("response_cache.time.monotonic", return_value=100.0):
+        cache.put("a", b"body")
+        assert cache.get("a") == b"body"
+    with patch("response_cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") is None
+    cache.put("b", b"body")
+    cache.evict("b")
+    assert cache.get("b") is None
+
+
+def test_least_recently_used_entry_is_dropped_when_full():
+    cache = ResponseCache(ttl=60.0, maxsize=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    cache.get("a")
+    cache.put("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"